@@ -0,0 +1,2 @@
+# Module benchmarks - Mesures de performance reproductibles
+# Scripts : bench_models, startup_report
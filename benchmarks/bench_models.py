@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Mesure du coût mémoire et du temps de chargement des modèles
+Compare les classes à __slots__ (chargement unitaire et en masse) à des classes classiques
+"""
+
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.grade import Grade
+
+
+class DictGrade:
+    """Note avec un __dict__ par instance (disposition d'origine de Grade)"""
+    
+    def __init__(self, matricule_etudiant, code_matiere, note, date=None):
+        self.matricule_etudiant = matricule_etudiant.strip()
+        self.code_matiere = code_matiere.strip()
+        self.note = float(note)
+        self.date = date
+    
+    @staticmethod
+    def from_dict(data):
+        return DictGrade(data.get('matricule_etudiant', ''), data.get('code_matiere', ''),
+                         data.get('note', 0.0), data.get('date', None))
+
+
+def make_data(count: int) -> str:
+    """
+    Génère le contenu d'un fichier grades.json
+    
+    Args:
+        count (int): Nombre de notes
+    
+    Returns:
+        str: Texte JSON de la liste des notes
+    """
+    return json.dumps([
+        {
+            'matricule_etudiant': ''.join(['ETU', str(i % 5000).zfill(5)]),
+            'code_matiere': ''.join(['MAT', str(i % 40).zfill(2)]),
+            'note': (i * 7) % 21,
+            'date': ''.join(['2024-', str(i % 12 + 1).zfill(2), '-15'])
+        }
+        for i in range(count)
+    ])
+
+
+def measure(label: str, loader, text: str):
+    """
+    Affiche le temps de construction et la mémoire retenue après chargement
+    
+    Args:
+        label (str): Nom de la mesure
+        loader: Fonction qui transforme la liste de dictionnaires
+        text (str): Texte JSON des notes
+    """
+    # Meilleur temps sur trois essais, ramasse-miettes désactivé
+    data = json.loads(text)
+    elapsed = None
+    for _ in range(3):
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        result = loader(data)
+        duration = time.perf_counter() - start
+        gc.enable()
+        del result
+        elapsed = duration if elapsed is None else min(elapsed, duration)
+    del data
+    
+    # Mémoire retenue une fois les dictionnaires JSON libérés, comme après _load_data
+    gc.collect()
+    tracemalloc.start()
+    data = json.loads(text)
+    result = loader(data)
+    del data
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    
+    print(f"{label:<35} {elapsed * 1000:>10.1f} ms {memory / 1024 / 1024:>10.1f} Mo")
+
+
+def main():
+    """Lance les mesures (nombre de notes en argument, 200 000 par défaut)"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    text = make_data(count)
+    
+    print(f"{count} notes")
+    print(f"{'Chargement':<35} {'Temps':>13} {'Mémoire':>13}")
+    print("-" * 63)
+    measure("Classe avec __dict__", lambda d: [DictGrade.from_dict(g) for g in d], text)
+    measure("Grade.from_dict (__slots__)", lambda d: [Grade.from_dict(g) for g in d], text)
+    measure("Grade.from_dicts (en masse)", Grade.from_dicts, text)
+
+
+if __name__ == '__main__':
+    main()
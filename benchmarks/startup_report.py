@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Rapport des imports au démarrage de l'interface graphique
+Exécute python -X importtime sur les modules chargés avant l'affichage de la fenêtre
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules importés avant que la fenêtre principale et le dashboard soient affichés
+STARTUP_MODULES = (
+    'main_gui',
+    'gui.windows.login_window',
+    'gui.windows.main_window',
+    'gui.frames.dashboard_frame'
+)
+
+# Modules qui ne doivent pas être chargés au démarrage (importés en arrière-plan)
+DEFERRED_MODULES = ('matplotlib', 'numpy')
+
+
+def run_importtime(modules) -> Tuple[List[Tuple[str, int, int]], str]:
+    """
+    Importe des modules dans un nouvel interpréteur avec -X importtime
+    
+    Args:
+        modules (Iterable[str]): Modules à importer
+    
+    Returns:
+        Tuple[List[Tuple[str, int, int]], str]: (module, temps propre en µs,
+            temps cumulé en µs) par import, et message d'erreur éventuel
+    """
+    code = "\n".join(f"import {module}" for module in modules)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                             cwd=ROOT, capture_output=True, text=True)
+    
+    entries = []
+    error = ""
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:'):
+            error = line
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Ligne d'en-tête
+            continue
+        entries.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    
+    if process.returncode != 0:
+        return entries, error or f"code de sortie {process.returncode}"
+    return entries, ""
+
+
+def main():
+    """Affiche le rapport ; code de sortie 1 si le budget est dépassé ou si un import échoue"""
+    parser = argparse.ArgumentParser(description="Temps d'import au démarrage de l'interface graphique")
+    parser.add_argument('--top', type=int, default=15, help="Nombre de modules les plus lents affichés")
+    parser.add_argument('--budget', type=float, default=None, help="Temps total maximal autorisé (ms)")
+    args = parser.parse_args()
+    
+    # Les modules chargés par l'interpréteur seul ne sont pas comptés
+    baseline = {name for name, _, _ in run_importtime(())[0]}
+    entries, error = run_importtime(STARTUP_MODULES)
+    entries = [entry for entry in entries if entry[0] not in baseline]
+    total = sum(self_time for _, self_time, _ in entries)
+    
+    print(f"{len(entries)} modules importés, {total / 1000:.1f} ms au total")
+    print(f"{'Module':<50} {'Propre':>10} {'Cumulé':>10}")
+    print("-" * 72)
+    for name, self_time, cumulative in sorted(entries, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"{name:<50} {self_time / 1000:>7.1f} ms {cumulative / 1000:>7.1f} ms")
+    
+    failed = False
+    deferred = sorted({name for name, _, _ in entries if name.split('.')[0] in DEFERRED_MODULES})
+    if deferred:
+        print(f"\nModules à charger en arrière-plan importés au démarrage : {', '.join(deferred[:5])}")
+        failed = True
+    if error:
+        print(f"\nErreur d'import : {error}")
+        failed = True
+    if args.budget is not None and total / 1000 > args.budget:
+        print(f"\nBudget dépassé : {total / 1000:.1f} ms > {args.budget:.1f} ms")
+        failed = True
+    
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+"""
+Interface en ligne de commande du système de gestion des notes
+Exécute des commandes sans saisie interactive : un chargement et une sauvegarde par exécution
+"""
+
+import argparse
+import os
+import shlex
+import sys
+from typing import List, Optional
+from models.student import Student
+from models.subject import Subject
+from models.grade import Grade
+from services.file_manager import FileManager, create_file_manager
+from services.repository import DataRepository
+from services.unit_of_work import UnitOfWork
+from services.statistics import Statistics
+from services.i18n import TranslationManager, get_i18n
+from services import bulk_import, bulletins
+
+# Variable d'environnement contenant le mot de passe (pas de saisie en mode script)
+PASSWORD_ENV = 'GRADEMASTER_PASSWORD'
+
+
+class CliSession:
+    """
+    Données chargées une seule fois pour toutes les commandes d'une exécution
+    
+    Les commandes modifient le dépôt ; save() écrit les modifications en une
+    fois à la fin de l'exécution.
+    """
+    
+    def __init__(self, file_manager: FileManager, i18n: TranslationManager):
+        """
+        Charge les données
+        
+        Args:
+            file_manager (FileManager): Gestionnaire de fichiers
+            i18n (TranslationManager): Gestionnaire de traductions
+        """
+        self.file_manager = file_manager
+        self.i18n = i18n
+        self.repository = DataRepository(
+            Student.from_dicts(file_manager.load_students()),
+            Subject.from_dicts(file_manager.load_subjects()),
+            Grade.from_dicts(file_manager.load_grades())
+        )
+        self.unit_of_work = UnitOfWork(file_manager, self.repository)
+        self.statistics = Statistics.for_repository(self.repository)
+    
+    def save(self) -> bool:
+        """
+        Sauvegarde en une fois les modifications de toutes les commandes
+        
+        Returns:
+            bool: True si la sauvegarde a réussi (ou s'il n'y avait rien à sauvegarder)
+        """
+        collections = self.unit_of_work.touched_collections()
+        if not collections:
+            return True
+        if not self.unit_of_work.commit():
+            print(self.i18n.get('cli.save_failed'))
+            return False
+        print(self.i18n.get('cli.saved', collections=", ".join(collections)))
+        return True
+
+
+# ========== ÉTUDIANTS ET MATIÈRES ==========
+
+def cmd_students_add(session: CliSession, args) -> bool:
+    """Ajoute un étudiant"""
+    i18n = session.i18n
+    if session.repository.get_student(args.matricule):
+        print(i18n.get('students.add.matricule_exists', matricule=args.matricule))
+        return False
+    student = Student(args.nom, args.prenom, args.matricule, args.niveau)
+    is_valid, error_msg = student.validate()
+    if not is_valid:
+        print(i18n.get('students.add.validation_error', error=error_msg))
+        return False
+    session.repository.add_student(student)
+    print(i18n.get('students.add.success', student=str(student)))
+    return True
+
+
+def cmd_subjects_add(session: CliSession, args) -> bool:
+    """Ajoute une matière"""
+    i18n = session.i18n
+    if session.repository.get_subject(args.code):
+        print(i18n.get('subjects.add.code_exists', code=args.code))
+        return False
+    subject = Subject(args.nom, args.code, args.coefficient, args.niveau)
+    is_valid, error_msg = subject.validate()
+    if not is_valid:
+        print(i18n.get('subjects.add.validation_error', error=error_msg))
+        return False
+    session.repository.add_subject(subject)
+    print(i18n.get('subjects.add.success', subject=str(subject)))
+    return True
+
+
+def cmd_import(session: CliSession, args) -> bool:
+    """Importe des fichiers CSV/TSV de la collection demandée"""
+    i18n = session.i18n
+    success = True
+    for path in args.files:
+        name = os.path.basename(path)
+        result = bulk_import.parse_file(path, bulk_import.ExistingKeys(session.repository))
+        if result is None:
+            print(i18n.get('cli.import_failed', file=name))
+            success = False
+            continue
+        if result.collection != args.collection:
+            print(i18n.get('cli.wrong_collection', file=name, expected=args.collection))
+            success = False
+            continue
+        bulk_import.apply_import(result, session.repository)
+        print(i18n.get('cli.import_summary', file=name, rows=result.rows, added=result.added,
+                       duplicates=result.duplicates, errors=len(result.errors)))
+        for line, message in result.errors[:args.show_errors]:
+            print(i18n.get('cli.import_error_line', line=line, message=message))
+        success = success and not result.errors
+    return success
+
+
+# ========== NOTES ==========
+
+def cmd_grades_add(session: CliSession, args) -> bool:
+    """Ajoute une note"""
+    i18n = session.i18n
+    repository = session.repository
+    if not repository.get_student(args.matricule):
+        print(i18n.get('grades.add.student_not_found', matricule=args.matricule))
+        return False
+    if not repository.get_subject(args.code):
+        print(i18n.get('grades.add.subject_not_found', code=args.code))
+        return False
+    if repository.get_grade(args.matricule, args.code):
+        print(i18n.get('grades.add.already_exists'))
+        return False
+    grade = Grade(args.matricule, args.code, args.note, args.date)
+    is_valid, error_msg = grade.validate()
+    if not is_valid:
+        print(i18n.get('grades.add.validation_error', error=error_msg))
+        return False
+    repository.add_grade(grade)
+    print(i18n.get('grades.add.success', grade=str(grade)))
+    return True
+
+
+def cmd_grades_set(session: CliSession, args) -> bool:
+    """Modifie une note existante"""
+    i18n = session.i18n
+    grade = session.repository.get_grade(args.matricule, args.code)
+    if not grade:
+        print(i18n.get('grades.modify.not_found'))
+        return False
+    if args.note < 0 or args.note > 20:
+        print(i18n.get('cli.note_out_of_range'))
+        return False
+    session.repository.update_grade(grade, args.note)
+    print(i18n.get('grades.modify.success', grade=str(grade)))
+    return True
+
+
+# ========== STATISTIQUES ==========
+
+def cmd_stats_student(session: CliSession, args) -> bool:
+    """Affiche la moyenne et le rang d'un étudiant"""
+    i18n = session.i18n
+    student = session.repository.get_student(args.matricule)
+    if not student:
+        print(i18n.get('statistics.student.not_found', matricule=args.matricule))
+        return False
+    
+    stats = session.statistics
+    moyenne = stats.calculate_student_average(args.matricule)
+    rang = stats.calculate_student_rank(args.matricule)
+    print(i18n.get('statistics.student.student_info', student=str(student)))
+    if moyenne:
+        print(i18n.get('statistics.student.average', average=moyenne))
+    else:
+        print(i18n.get('statistics.student.no_average'))
+    if rang:
+        suffix = i18n.get('statistics.student.rank_1') if rang == 1 else i18n.get('statistics.student.rank_other')
+        print(i18n.get('statistics.student.rank', rank=rang, suffix=suffix))
+    else:
+        print(i18n.get('statistics.student.no_rank'))
+    return True
+
+
+def cmd_stats_class(session: CliSession, args) -> bool:
+    """Affiche la moyenne, le meilleur étudiant et le classement d'une classe"""
+    i18n = session.i18n
+    stats = session.statistics
+    moyenne_classe = stats.calculate_class_average(args.niveau)
+    meilleur = stats.get_best_student_in_class(args.niveau)
+    if args.top is None:
+        classement = stats.get_class_ranking(args.niveau)
+    else:
+        classement = stats.get_top_students(args.niveau, args.top)
+    
+    print(i18n.get('statistics.class.class_info', level=args.niveau))
+    if moyenne_classe:
+        print(i18n.get('statistics.class.average', average=moyenne_classe))
+    else:
+        print(i18n.get('statistics.class.no_average'))
+    if meilleur:
+        student, avg = meilleur
+        name = f"{student.prenom} {student.nom.upper()}"
+        print(i18n.get('statistics.class.best_student', name=name, matricule=student.matricule))
+        print(i18n.get('statistics.class.best_average', average=avg))
+    if classement:
+        title_key = 'statistics.class.ranking_title' if args.top is None else 'statistics.class.top_ranking_title'
+        print(f"\n{i18n.get(title_key, count=len(classement))}\n")
+        rank_col = i18n.get('statistics.class.ranking_columns.rank')
+        student_col = i18n.get('statistics.class.ranking_columns.student')
+        avg_col = i18n.get('statistics.class.ranking_columns.average')
+        print(f"{rank_col:<6} {student_col:<40} {avg_col:<10}")
+        print("-" * 60)
+        for student, avg, rank in classement:
+            print(f"{rank:<6} {str(student):<40} {avg:<10.2f}")
+    return True
+
+
+def cmd_stats_global(session: CliSession, args) -> bool:
+    """Affiche la moyenne et le meilleur étudiant de l'établissement"""
+    i18n = session.i18n
+    stats = session.statistics
+    moyenne_globale = stats.calculate_global_average()
+    meilleur = stats.get_best_student_global()
+    
+    if moyenne_globale:
+        print(i18n.get('statistics.global.average', average=moyenne_globale))
+    else:
+        print(i18n.get('statistics.global.no_average'))
+    if meilleur:
+        student, avg = meilleur
+        name = f"{student.prenom} {student.nom.upper()}"
+        print(i18n.get('statistics.global.best_student_title'))
+        print(i18n.get('statistics.global.best_student', name=name, matricule=student.matricule))
+        print(i18n.get('statistics.global.best_level', level=student.niveau))
+        print(i18n.get('statistics.global.best_average', average=avg))
+    print(i18n.get('statistics.global.total_students', count=len(session.repository.students)))
+    print(i18n.get('statistics.global.total_subjects', count=len(session.repository.subjects)))
+    print(i18n.get('statistics.global.total_grades', count=len(session.repository.grades)))
+    return True
+
+
+# ========== BULLETINS ==========
+
+def cmd_bulletins_export(session: CliSession, args) -> bool:
+    """Exporte les bulletins d'une classe ou de tout l'établissement"""
+    i18n = session.i18n
+    
+    def report(done, total):
+        print(f"\r{i18n.get('consultation.batch.progress', done=done, total=total)}", end="", flush=True)
+    
+    result = bulletins.export_bulletins(session.statistics, args.output, args.niveau, args.format,
+                                        bulletins.translated_labels(i18n), args.workers,
+                                        progress=None if args.quiet else report)
+    if result.paths and not args.quiet:
+        print()
+    if result.error:
+        print(i18n.get('consultation.batch.failed', error=result.error,
+                       count=len(result.paths), total=result.total))
+    elif not result.paths:
+        print(i18n.get('consultation.batch.none'))
+    if result.paths:
+        print(i18n.get('consultation.batch.done', count=len(result.paths), path=args.output))
+    return bool(result.paths) and result.error is None
+
+
+# ========== SCRIPTS ==========
+
+def cmd_run(session: CliSession, args) -> bool:
+    """Exécute un fichier de commandes (une par ligne, # pour les commentaires)"""
+    i18n = session.i18n
+    parser = build_parser()
+    name = "<stdin>" if args.script == '-' else args.script
+    try:
+        if args.script == '-':
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.script, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+    except OSError as e:
+        print(i18n.get('cli.script_error', line=0, file=name, error=e))
+        return False
+    
+    success = True
+    for number, line in enumerate(lines, start=1):
+        try:
+            tokens = shlex.split(line, comments=True)
+            if not tokens:
+                continue
+            command = parser.parse_args(tokens)
+        except (ValueError, SystemExit):
+            # argparse a déjà affiché la cause et signale l'erreur par SystemExit
+            print(i18n.get('cli.script_error', line=number, file=name, error=line.strip()))
+            success = False
+            continue
+        if command.handler is cmd_run:
+            print(i18n.get('cli.nested_run'))
+            success = False
+            continue
+        success = command.handler(session, command) and success
+    return success
+
+
+# ========== ANALYSE DES ARGUMENTS ==========
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Construit l'analyseur des commandes
+    
+    Returns:
+        argparse.ArgumentParser: Analyseur avec une sous-commande par opération
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Gestion des notes scolaires en ligne de commande. Le mot de passe est lu "
+                    f"dans la variable d'environnement {PASSWORD_ENV}."
+    )
+    parser.add_argument('--data-dir', default='data', help="Répertoire des données (défaut : data)")
+    commands = parser.add_subparsers(dest='command', metavar='COMMANDE', required=True)
+    
+    # Étudiants
+    students = commands.add_parser('students', help="Gestion des étudiants")
+    students_commands = students.add_subparsers(dest='action', metavar='ACTION', required=True)
+    add = students_commands.add_parser('add', help="Ajouter un étudiant")
+    add.add_argument('matricule')
+    add.add_argument('nom')
+    add.add_argument('prenom')
+    add.add_argument('niveau')
+    add.set_defaults(handler=cmd_students_add)
+    imp = students_commands.add_parser('import', help="Importer des étudiants (CSV/TSV)")
+    imp.set_defaults(handler=cmd_import, collection='students')
+    
+    # Matières
+    subjects = commands.add_parser('subjects', help="Gestion des matières")
+    subjects_commands = subjects.add_subparsers(dest='action', metavar='ACTION', required=True)
+    add = subjects_commands.add_parser('add', help="Ajouter une matière")
+    add.add_argument('code')
+    add.add_argument('nom')
+    add.add_argument('coefficient', type=float)
+    add.add_argument('niveau')
+    add.set_defaults(handler=cmd_subjects_add)
+    imp_subjects = subjects_commands.add_parser('import', help="Importer des matières (CSV/TSV)")
+    imp_subjects.set_defaults(handler=cmd_import, collection='subjects')
+    
+    # Notes
+    grades = commands.add_parser('grades', help="Gestion des notes")
+    grades_commands = grades.add_subparsers(dest='action', metavar='ACTION', required=True)
+    add = grades_commands.add_parser('add', help="Ajouter une note")
+    add.add_argument('matricule')
+    add.add_argument('code')
+    add.add_argument('note', type=float)
+    add.add_argument('--date', help="Date de saisie (YYYY-MM-DD, défaut : aujourd'hui)")
+    add.set_defaults(handler=cmd_grades_add)
+    set_grade = grades_commands.add_parser('set', help="Modifier une note existante")
+    set_grade.add_argument('matricule')
+    set_grade.add_argument('code')
+    set_grade.add_argument('note', type=float)
+    set_grade.set_defaults(handler=cmd_grades_set)
+    imp_grades = grades_commands.add_parser('import', help="Importer des notes (CSV/TSV)")
+    imp_grades.set_defaults(handler=cmd_import, collection='grades')
+    
+    for importer in (imp, imp_subjects, imp_grades):
+        importer.add_argument('files', nargs='+', metavar='FICHIER')
+        importer.add_argument('--show-errors', type=int, default=10, metavar='N',
+                              help="Nombre de lignes rejetées affichées par fichier (défaut : 10)")
+    
+    # Statistiques
+    stats = commands.add_parser('stats', help="Statistiques")
+    stats_commands = stats.add_subparsers(dest='action', metavar='ACTION', required=True)
+    student = stats_commands.add_parser('student', help="Moyenne et rang d'un étudiant")
+    student.add_argument('matricule')
+    student.set_defaults(handler=cmd_stats_student)
+    klass = stats_commands.add_parser('class', help="Moyenne et classement d'une classe")
+    klass.add_argument('niveau')
+    klass.add_argument('--top', type=int, metavar='K', help="N'afficher que les K premiers")
+    klass.set_defaults(handler=cmd_stats_class)
+    glob = stats_commands.add_parser('global', help="Statistiques de l'établissement")
+    glob.set_defaults(handler=cmd_stats_global)
+    
+    # Bulletins
+    bulletins_parser = commands.add_parser('bulletins', help="Bulletins de notes")
+    bulletins_commands = bulletins_parser.add_subparsers(dest='action', metavar='ACTION', required=True)
+    export = bulletins_commands.add_parser('export', help="Exporter les bulletins en lot")
+    export.add_argument('--niveau', help="Niveau/classe à exporter (défaut : tout l'établissement)")
+    export.add_argument('--format', choices=sorted(bulletins.FORMATS), default='text')
+    export.add_argument('--output', default='bulletins', help="Dossier de sortie (défaut : bulletins)")
+    export.add_argument('--workers', type=int, help="Nombre de processus (défaut : nombre de processeurs)")
+    export.add_argument('--quiet', action='store_true', help="Ne pas afficher l'avancement")
+    export.set_defaults(handler=cmd_bulletins_export)
+    
+    # Scripts
+    run = commands.add_parser('run', help="Exécuter un fichier de commandes (- pour l'entrée standard)")
+    run.add_argument('script')
+    run.set_defaults(handler=cmd_run)
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Point d'entrée de la ligne de commande
+    
+    Args:
+        argv (List[str], optional): Arguments (sys.argv[1:] par défaut)
+    
+    Returns:
+        int: Code de sortie (0 si toutes les commandes ont réussi)
+    """
+    args = build_parser().parse_args(argv)
+    
+    file_manager = create_file_manager(args.data_dir)
+    config = file_manager.load_config()
+    i18n = get_i18n()
+    i18n.set_language(config.get('language', 'fr'))
+    
+    if os.environ.get(PASSWORD_ENV) != config.get('password', 'password'):
+        print(i18n.get('cli.auth_failed'))
+        return 1
+    
+    session = CliSession(file_manager, i18n)
+    success = args.handler(session, args)
+    # Une seule sauvegarde, même après un script de plusieurs commandes
+    success = session.save() and success
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
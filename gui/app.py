@@ -5,8 +5,9 @@ Gère la configuration et l'initialisation de l'interface graphique
 """
 
 import customtkinter as ctk
-from services.file_manager import FileManager
+from services.file_manager import create_file_manager
 from services.i18n import get_i18n
+from services.logger import configure_logger
 
 
 class App:
@@ -21,7 +22,7 @@ class App:
         ctk.set_default_color_theme("blue")
         
         # Initialiser le gestionnaire de fichiers
-        self.file_manager = FileManager()
+        self.file_manager = create_file_manager()
         
         # Charger la configuration et initialiser le gestionnaire de traductions
         config = self.file_manager.load_config()
@@ -29,6 +30,9 @@ class App:
         language = config.get('language', 'fr')
         self.i18n.set_language(language)
         
+        # Journal de débogage ("log_level" et "log_file" dans config.json, désactivé par défaut)
+        configure_logger(config, self.file_manager.data_dir)
+        
         # État de l'application
         self.authenticated = False
         self.current_window = None
@@ -37,6 +41,10 @@ class App:
         """Lance l'application"""
         # Importer ici pour éviter les imports circulaires
         from gui.windows.login_window import LoginWindow
+        from gui.widgets.chart_widget import preload_matplotlib
+        
+        # Charger matplotlib pendant la saisie du mot de passe
+        preload_matplotlib()
         
         # Créer et afficher la fenêtre de login
         login_window = LoginWindow(self)
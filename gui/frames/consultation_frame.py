@@ -5,7 +5,6 @@ Frame Consultation - Consultation des notes
 
 import customtkinter as ctk
 from tkinter import messagebox
-from services.statistics import Statistics
 
 
 class ConsultationFrame(ctk.CTkScrollableFrame):
@@ -130,13 +129,14 @@ class ConsultationFrame(ctk.CTkScrollableFrame):
     def _show_student_grades(self):
         """Affiche les notes d'un étudiant"""
         matricule = self.student_matricule_entry.get().strip()
-        student = next((s for s in self.main_window.students if s.matricule == matricule), None)
+        repository = self.main_window.repository
+        student = repository.get_student(matricule)
         
         if not student:
             messagebox.showerror("Erreur", f"Aucun étudiant trouvé avec le matricule {matricule}")
             return
         
-        student_grades = [g for g in self.main_window.grades if g.matricule_etudiant == matricule]
+        student_grades = repository.get_grades_by_student(matricule)
         
         self.student_grades_text.delete("1.0", "end")
         text = f"Étudiant: {student.prenom} {student.nom.upper()}\n"
@@ -145,7 +145,7 @@ class ConsultationFrame(ctk.CTkScrollableFrame):
         text += f"{len(student_grades)} note(s) trouvée(s):\n\n"
         
         for grade in student_grades:
-            subject = next((s for s in self.main_window.subjects if s.code == grade.code_matiere), None)
+            subject = repository.get_subject(grade.code_matiere)
             subject_name = subject.nom if subject else grade.code_matiere
             text += f"  - {subject_name}: {grade.note}/20 (Date: {grade.date})\n"
         
@@ -164,13 +164,14 @@ class ConsultationFrame(ctk.CTkScrollableFrame):
             return
         
         code_matiere = subject_str.split(" - ")[0]
-        subject = next((s for s in self.main_window.subjects if s.code == code_matiere), None)
+        repository = self.main_window.repository
+        subject = repository.get_subject(code_matiere)
         
         if not subject:
             messagebox.showerror("Erreur", "Matière introuvable")
             return
         
-        class_students = [s for s in self.main_window.students if s.niveau == niveau]
+        class_students = repository.get_students_by_niveau(niveau)
         
         self.class_grades_text.delete("1.0", "end")
         text = f"Matière: {subject.nom}\n"
@@ -178,8 +179,7 @@ class ConsultationFrame(ctk.CTkScrollableFrame):
         text += f"{len(class_students)} étudiant(s) dans la classe:\n\n"
         
         for student in class_students:
-            grade = next((g for g in self.main_window.grades 
-                         if g.matricule_etudiant == student.matricule and g.code_matiere == code_matiere), None)
+            grade = repository.get_grade(student.matricule, code_matiere)
             if grade:
                 text += f"  - {student.prenom} {student.nom.upper()} ({student.matricule}): {grade.note}/20\n"
             else:
@@ -190,16 +190,16 @@ class ConsultationFrame(ctk.CTkScrollableFrame):
     def _show_bulletin(self):
         """Affiche le bulletin complet d'un étudiant"""
         matricule = self.bulletin_matricule_entry.get().strip()
-        student = next((s for s in self.main_window.students if s.matricule == matricule), None)
+        repository = self.main_window.repository
+        student = repository.get_student(matricule)
         
         if not student:
             messagebox.showerror("Erreur", f"Aucun étudiant trouvé avec le matricule {matricule}")
             return
         
-        student_grades = [g for g in self.main_window.grades if g.matricule_etudiant == matricule]
         level_subjects = [s for s in self.main_window.subjects if s.niveau == student.niveau]
         
-        stats = Statistics(self.main_window.students, self.main_window.subjects, self.main_window.grades)
+        stats = self.main_window.stats_store
         moyenne = stats.calculate_student_average(matricule)
         rang = stats.calculate_student_rank(matricule)
         
@@ -218,7 +218,7 @@ class ConsultationFrame(ctk.CTkScrollableFrame):
         total_coefficients = 0.0
         
         for subject in level_subjects:
-            grade = next((g for g in student_grades if g.code_matiere == subject.code), None)
+            grade = repository.get_grade(matricule, subject.code)
             if grade:
                 points = grade.note * subject.coefficient
                 total_points += points
@@ -170,44 +170,70 @@ class DashboardFrame(ctk.CTkScrollableFrame):
         total_subjects = len(self.main_window.subjects)
         total_grades = len(self.main_window.grades)
         
-        # Calculer la moyenne globale
-        stats = Statistics(self.main_window.students, self.main_window.subjects, self.main_window.grades)
-        avg_gpa = stats.calculate_global_average()
-        avg_gpa_str = f"{avg_gpa:.2f}" if avg_gpa else "0.00"
-        
-        # Mettre à jour les cartes
+        # Mettre à jour les cartes (la moyenne globale arrive avec les graphiques)
         self.students_card.update_value(str(total_students), f"Across {len(set(s.niveau for s in self.main_window.students))} classes")
         self.subjects_card.update_value(str(total_subjects), f"Across {len(set(s.niveau for s in self.main_window.subjects))} levels")
         self.grades_card.update_value(str(total_grades), "Total grades recorded")
-        self.gpa_card.update_value(avg_gpa_str, "Overall average")
         
         # Mettre à jour les graphiques
         self._update_charts()
     
     def _update_charts(self):
-        """Met à jour les graphiques"""
+        """Lance le calcul des graphiques et de la moyenne globale hors du thread Tk"""
+        self.main_window.task_runner.submit(
+            "dashboard.charts", self._compute_charts, self._plot_charts,
+            self.main_window.get_statistics_snapshot()
+        )
+    
+    @staticmethod
+    def _compute_charts(snapshot):
+        """
+        Calcule les données du dashboard (exécuté dans le thread de travail)
+        
+        Args:
+            snapshot (tuple): Instantané des données (Statistics.snapshot())
+        
+        Returns:
+            tuple: (moyenne globale, effectifs par niveau, moyennes par niveau)
+        """
+        stats = Statistics.from_snapshot(snapshot)
+        
         # Graphique Enrollment by Grade
         levels = {}
-        for student in self.main_window.students:
+        for student in stats.students:
             level = student.niveau
             levels[level] = levels.get(level, 0) + 1
         
-        if levels:
-            labels = list(levels.keys())
-            values = list(levels.values())
-            self.enrollment_chart.plot_bar_chart(labels, values, color="#1F6AA5")
-        
         # Graphique GPA Trend (simulation avec données disponibles)
         # Pour un vrai système, on aurait besoin de données historiques
-        stats = Statistics(self.main_window.students, self.main_window.subjects, self.main_window.grades)
-        
         # Calculer les moyennes par niveau
         level_averages = {}
-        for level in set(s.niveau for s in self.main_window.students):
+        for level in levels:
             avg = stats.calculate_class_average(level)
             if avg:
                 level_averages[level] = avg
         
+        return stats.calculate_global_average(), levels, level_averages
+    
+    def _plot_charts(self, result):
+        """
+        Affiche la moyenne globale et les graphiques
+        
+        Args:
+            result (tuple): Résultat de _compute_charts()
+        """
+        if not self.winfo_exists():
+            return
+        avg_gpa, levels, level_averages = result
+        
+        avg_gpa_str = f"{avg_gpa:.2f}" if avg_gpa else "0.00"
+        self.gpa_card.update_value(avg_gpa_str, "Overall average")
+        
+        if levels:
+            labels = list(levels.keys())
+            values = list(levels.values())
+            self.enrollment_chart.plot_bar_chart(labels, values, color="#1F6AA5")
+        
         if level_averages:
             labels = list(level_averages.keys())
             values = list(level_averages.values())
@@ -27,6 +27,10 @@ class GradesFrame(ctk.CTkScrollableFrame):
         
         self.main_window = main_window
         
+        # Lignes du tableau déjà construites (None tant qu'elles sont à recalculer)
+        self._rows = None
+        self.main_window.repository.add_listener(self._on_data_changed)
+        
         self._create_widgets()
         self._load_table_data()
     
@@ -99,7 +103,7 @@ class GradesFrame(ctk.CTkScrollableFrame):
         
         # Tableau des notes
         columns = [("Étudiant", 200), ("Matière", 200), ("Note", 100), ("Date", 150)]
-        self.table = DataTable(self, columns=columns)
+        self.table = DataTable(self, columns=columns, virtual=True)
         self.table.pack(fill="both", expand=True, pady=(0, 20))
         
         # Boutons d'action
@@ -126,25 +130,43 @@ class GradesFrame(ctk.CTkScrollableFrame):
         )
         delete_btn.pack(side="left")
     
-    def _load_table_data(self):
-        """Charge les données dans le tableau"""
-        data = []
-        for grade in self.main_window.grades:
-            # Trouver l'étudiant
-            student = next((s for s in self.main_window.students if s.matricule == grade.matricule_etudiant), None)
-            student_name = f"{student.prenom} {student.nom}" if student else grade.matricule_etudiant
-            
-            # Trouver la matière
-            subject = next((s for s in self.main_window.subjects if s.code == grade.code_matiere), None)
-            subject_name = subject.nom if subject else grade.code_matiere
-            
-            data.append((
-                student_name,
-                subject_name,
+    def _on_data_changed(self, action, entity):
+        """Invalide les lignes en cache après toute modification des données"""
+        self._rows = None
+    
+    def _build_rows(self) -> list:
+        """
+        Construit les lignes du tableau par jointure sur les notes
+        
+        Returns:
+            list: Lignes (étudiant, matière, note, date)
+        """
+        # Tables de jointure : un nom calculé une seule fois par étudiant et par matière
+        student_names = {}
+        for student in self.main_window.students:
+            student_names.setdefault(student.matricule, f"{student.prenom} {student.nom}")
+        subject_names = {}
+        for subject in self.main_window.subjects:
+            subject_names.setdefault(subject.code, subject.nom)
+        
+        return [
+            (
+                student_names.get(grade.matricule_etudiant, grade.matricule_etudiant),
+                subject_names.get(grade.code_matiere, grade.code_matiere),
                 f"{grade.note:.2f}/20",
                 grade.date
-            ))
-        self.table.set_data(data)
+            )
+            for grade in self.main_window.grades
+        ]
+    
+    def _load_table_data(self):
+        """Charge les données dans le tableau"""
+        # Le tableau affiche déjà les lignes à jour
+        if self._rows is not None:
+            return
+        self._rows = self._build_rows()
+        # Chaque ligne est associée à sa note : modification et suppression sans recherche
+        self.table.set_data(self._rows, keys=list(self.main_window.grades))
     
     def _save_grade(self):
         """Enregistre une note"""
@@ -170,12 +192,11 @@ class GradesFrame(ctk.CTkScrollableFrame):
             return
         
         # Vérifier qu'il n'y a pas déjà une note
-        existing = next((g for g in self.main_window.grades 
-                        if g.matricule_etudiant == matricule and g.code_matiere == code_matiere), None)
+        existing = self.main_window.repository.get_grade(matricule, code_matiere)
         
         if existing:
             if messagebox.askyesno("Note existante", "Une note existe déjà. Voulez-vous la modifier ?"):
-                existing.note = note
+                self.main_window.repository.update_grade(existing, note)
             else:
                 return
         else:
@@ -184,7 +205,7 @@ class GradesFrame(ctk.CTkScrollableFrame):
             if not is_valid:
                 messagebox.showerror("Erreur", error_msg)
                 return
-            self.main_window.grades.append(new_grade)
+            self.main_window.repository.add_grade(new_grade)
         
         self.main_window.refresh_data()
         self._load_table_data()
@@ -192,79 +213,56 @@ class GradesFrame(ctk.CTkScrollableFrame):
     
     def _modify_grade(self):
         """Modifie une note sélectionnée"""
-        selected = self.table.get_selected_item()
-        if not selected:
+        grade = self.table.get_selected_key()
+        if grade is None:
             messagebox.showwarning("Attention", "Veuillez sélectionner une note")
             return
         
-        # Trouver la note
-        student_name = selected[0]
-        subject_name = selected[1]
+        # Afficher le dialogue de modification
+        dialog = ctk.CTkToplevel(self)
+        dialog.title("Modifier une note")
+        dialog.geometry("400x200")
+        dialog.transient(self)
+        dialog.grab_set()
         
-        student = next((s for s in self.main_window.students 
-                       if f"{s.prenom} {s.nom}" == student_name), None)
-        subject = next((s for s in self.main_window.subjects if s.nom == subject_name), None)
+        form_frame = ctk.CTkFrame(dialog)
+        form_frame.pack(fill="both", expand=True, padx=30, pady=30)
         
-        if student and subject:
-            grade = next((g for g in self.main_window.grades 
-                         if g.matricule_etudiant == student.matricule and g.code_matiere == subject.code), None)
-            if grade:
-                # Afficher le dialogue de modification
-                dialog = ctk.CTkToplevel(self)
-                dialog.title("Modifier une note")
-                dialog.geometry("400x200")
-                dialog.transient(self)
-                dialog.grab_set()
+        ctk.CTkLabel(form_frame, text="Nouvelle note (0-20):", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 10))
+        note_entry = ctk.CTkEntry(form_frame, width=300, height=40)
+        note_entry.insert(0, str(grade.note))
+        note_entry.pack(pady=(0, 20))
                 
-                form_frame = ctk.CTkFrame(dialog)
-                form_frame.pack(fill="both", expand=True, padx=30, pady=30)
+        def save():
+            try:
+                new_note = float(note_entry.get().strip())
+                if new_note < 0 or new_note > 20:
+                    messagebox.showerror("Erreur", "La note doit être comprise entre 0 et 20")
+                    return
+                self.main_window.repository.update_grade(grade, new_note)
+                self.main_window.refresh_data()
+                self._load_table_data()
+                dialog.destroy()
+            except ValueError:
+                messagebox.showerror("Erreur", "La note doit être un nombre")
                 
-                ctk.CTkLabel(form_frame, text="Nouvelle note (0-20):", font=ctk.CTkFont(size=14)).pack(anchor="w", pady=(0, 10))
-                note_entry = ctk.CTkEntry(form_frame, width=300, height=40)
-                note_entry.insert(0, str(grade.note))
-                note_entry.pack(pady=(0, 20))
+        buttons_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
+        buttons_frame.pack(fill="x")
                 
-                def save():
-                    try:
-                        new_note = float(note_entry.get().strip())
-                        if new_note < 0 or new_note > 20:
-                            messagebox.showerror("Erreur", "La note doit être comprise entre 0 et 20")
-                            return
-                        grade.note = new_note
-                        self.main_window.refresh_data()
-                        self._load_table_data()
-                        dialog.destroy()
-                    except ValueError:
-                        messagebox.showerror("Erreur", "La note doit être un nombre")
-                
-                buttons_frame = ctk.CTkFrame(form_frame, fg_color="transparent")
-                buttons_frame.pack(fill="x")
-                
-                ctk.CTkButton(buttons_frame, text="Enregistrer", fg_color="#4CAF50", command=save).pack(side="right", padx=(10, 0))
-                ctk.CTkButton(buttons_frame, text="Annuler", fg_color="#808080", command=dialog.destroy).pack(side="right")
+        ctk.CTkButton(buttons_frame, text="Enregistrer", fg_color="#4CAF50", command=save).pack(side="right", padx=(10, 0))
+        ctk.CTkButton(buttons_frame, text="Annuler", fg_color="#808080", command=dialog.destroy).pack(side="right")
     
     def _delete_grade(self):
         """Supprime une note sélectionnée"""
-        selected = self.table.get_selected_item()
-        if not selected:
+        grade = self.table.get_selected_key()
+        if grade is None:
             messagebox.showwarning("Attention", "Veuillez sélectionner une note")
             return
         
-        student_name = selected[0]
-        subject_name = selected[1]
-        
-        student = next((s for s in self.main_window.students 
-                       if f"{s.prenom} {s.nom}" == student_name), None)
-        subject = next((s for s in self.main_window.subjects if s.nom == subject_name), None)
-        
-        if student and subject:
-            grade = next((g for g in self.main_window.grades 
-                         if g.matricule_etudiant == student.matricule and g.code_matiere == subject.code), None)
-            if grade:
-                if messagebox.askyesno("Confirmation", "Êtes-vous sûr de vouloir supprimer cette note ?"):
-                    self.main_window.grades.remove(grade)
-                    self.main_window.refresh_data()
-                    self._load_table_data()
+        if messagebox.askyesno("Confirmation", "Êtes-vous sûr de vouloir supprimer cette note ?"):
+            self.main_window.repository.remove_grade(grade)
+            self.main_window.refresh_data()
+            self._load_table_data()
     
     def refresh(self):
         """Rafraîchit la frame"""
@@ -25,6 +25,9 @@ class StatisticsFrame(ctk.CTkScrollableFrame):
         super().__init__(parent, fg_color="transparent")
         
         self.main_window = main_window
+        # Dernières demandes affichées, recalculées par refresh()
+        self._class_niveau = None
+        self._global_requested = False
         
         self._create_widgets()
     
@@ -147,13 +150,13 @@ class StatisticsFrame(ctk.CTkScrollableFrame):
     def _show_student_stats(self):
         """Affiche les statistiques d'un étudiant"""
         matricule = self.student_stats_entry.get().strip()
-        student = next((s for s in self.main_window.students if s.matricule == matricule), None)
+        student = self.main_window.repository.get_student(matricule)
         
         if not student:
             messagebox.showerror("Erreur", f"Aucun étudiant trouvé avec le matricule {matricule}")
             return
         
-        stats = Statistics(self.main_window.students, self.main_window.subjects, self.main_window.grades)
+        stats = self.main_window.stats_store
         moyenne = stats.calculate_student_average(matricule)
         rang = stats.calculate_student_rank(matricule)
         
@@ -170,13 +173,49 @@ class StatisticsFrame(ctk.CTkScrollableFrame):
         self.student_stats_text.insert("1.0", text)
     
     def _show_class_stats(self):
-        """Affiche les statistiques d'une classe"""
-        niveau = self.class_stats_entry.get().strip()
+        """Lance le calcul des statistiques d'une classe"""
+        self._class_niveau = self.class_stats_entry.get().strip()
+        self._submit_class_stats()
         
-        stats = Statistics(self.main_window.students, self.main_window.subjects, self.main_window.grades)
-        moyenne_classe = stats.calculate_class_average(niveau)
-        meilleur = stats.get_best_student_in_class(niveau)
-        classement = stats.get_class_ranking(niveau)
+    def _submit_class_stats(self):
+        """Soumet le calcul des statistiques de la dernière classe demandée"""
+        niveau = self._class_niveau
+        
+        self.class_stats_text.delete("1.0", "end")
+        self.class_stats_text.insert("1.0", f"Classe: {niveau}\n\nCalcul en cours...\n")
+        
+        # Une nouvelle demande remplace celle qui n'a pas encore abouti
+        self.main_window.task_runner.submit(
+            "statistics.class", self._compute_class_stats, self._display_class_stats,
+            self.main_window.get_statistics_snapshot(), niveau
+        )
+    
+    @staticmethod
+    def _compute_class_stats(snapshot, niveau):
+        """
+        Calcule les statistiques d'une classe (exécuté dans le thread de travail)
+        
+        Args:
+            snapshot (tuple): Instantané des données (Statistics.snapshot())
+            niveau (str): Niveau/classe
+        
+        Returns:
+            tuple: (niveau, moyenne, meilleur étudiant, classement)
+        """
+        stats = Statistics.from_snapshot(snapshot)
+        return (niveau, stats.calculate_class_average(niveau),
+                stats.get_best_student_in_class(niveau), stats.get_class_ranking(niveau))
+    
+    def _display_class_stats(self, result):
+        """
+        Affiche les statistiques d'une classe
+        
+        Args:
+            result (tuple): Résultat de _compute_class_stats()
+        """
+        if not self.winfo_exists():
+            return
+        niveau, moyenne_classe, meilleur, classement = result
         
         self.class_stats_text.delete("1.0", "end")
         text = f"Classe: {niveau}\n\n"
@@ -200,7 +239,7 @@ class StatisticsFrame(ctk.CTkScrollableFrame):
         if classement:
             labels = [f"{s.prenom} {s.nom[:10]}" for s, _, _ in classement]
             values = [avg for _, avg, _ in classement]
-            self.class_chart.plot_bar_chart(labels, values, color="#1F6AA5")
+            self.class_chart.plot_bar_chart(labels, values, color="#1F6AA5", grouping="max")
     
     def _show_subject_stats(self):
         """Affiche les statistiques d'une matière"""
@@ -210,13 +249,13 @@ class StatisticsFrame(ctk.CTkScrollableFrame):
             return
         
         code_matiere = subject_str.split(" - ")[0]
-        subject = next((s for s in self.main_window.subjects if s.code == code_matiere), None)
+        subject = self.main_window.repository.get_subject(code_matiere)
         
         if not subject:
             messagebox.showerror("Erreur", "Matière introuvable")
             return
         
-        stats = Statistics(self.main_window.students, self.main_window.subjects, self.main_window.grades)
+        stats = self.main_window.stats_store
         moyenne = stats.calculate_subject_average(code_matiere)
         meilleur = stats.get_best_student_in_subject(code_matiere)
         
@@ -232,10 +271,45 @@ class StatisticsFrame(ctk.CTkScrollableFrame):
         self.subject_stats_text.insert("1.0", text)
     
     def _show_global_stats(self):
-        """Affiche les statistiques globales"""
-        stats = Statistics(self.main_window.students, self.main_window.subjects, self.main_window.grades)
-        moyenne_globale = stats.calculate_global_average()
-        meilleur = stats.get_best_student_global()
+        """Lance le calcul des statistiques globales"""
+        self._global_requested = True
+        self._submit_global_stats()
+    
+    def _submit_global_stats(self):
+        """Soumet le calcul des statistiques globales"""
+        self.global_stats_text.delete("1.0", "end")
+        self.global_stats_text.insert("1.0", "STATISTIQUES GLOBALES\n\nCalcul en cours...\n")
+        
+        self.main_window.task_runner.submit(
+            "statistics.global", self._compute_global_stats, self._display_global_stats,
+            self.main_window.get_statistics_snapshot()
+        )
+    
+    @staticmethod
+    def _compute_global_stats(snapshot):
+        """
+        Calcule les statistiques de l'établissement (exécuté dans le thread de travail)
+        
+        Args:
+            snapshot (tuple): Instantané des données (Statistics.snapshot())
+        
+        Returns:
+            tuple: (moyenne globale, meilleur étudiant, nombres d'étudiants, de matières et de notes)
+        """
+        stats = Statistics.from_snapshot(snapshot)
+        return (stats.calculate_global_average(), stats.get_best_student_global(),
+                len(stats.students), len(stats.subjects), len(stats.grades))
+    
+    def _display_global_stats(self, result):
+        """
+        Affiche les statistiques globales
+        
+        Args:
+            result (tuple): Résultat de _compute_global_stats()
+        """
+        if not self.winfo_exists():
+            return
+        moyenne_globale, meilleur, total_students, total_subjects, total_grades = result
         
         self.global_stats_text.delete("1.0", "end")
         text = "STATISTIQUES GLOBALES\n"
@@ -249,9 +323,9 @@ class StatisticsFrame(ctk.CTkScrollableFrame):
             text += f"  Niveau: {student.niveau}\n"
             text += f"  Moyenne: {avg:.2f}/20\n"
         
-        text += f"\nNombre total d'étudiants: {len(self.main_window.students)}\n"
-        text += f"Nombre total de matières: {len(self.main_window.subjects)}\n"
-        text += f"Nombre total de notes: {len(self.main_window.grades)}\n"
+        text += f"\nNombre total d'étudiants: {total_students}\n"
+        text += f"Nombre total de matières: {total_subjects}\n"
+        text += f"Nombre total de notes: {total_grades}\n"
         
         self.global_stats_text.insert("1.0", text)
     
@@ -259,3 +333,9 @@ class StatisticsFrame(ctk.CTkScrollableFrame):
         """Rafraîchit la frame"""
         self.subject_stats_combo.configure(values=[f"{s.code} - {s.nom}" for s in self.main_window.subjects])
 
+        # Les statistiques déjà affichées sont recalculées sur les données actuelles
+        if self._class_niveau is not None:
+            self._submit_class_stats()
+        if self._global_requested:
+            self._submit_global_stats()
+
@@ -7,26 +7,9 @@ import customtkinter as ctk
 from tkinter import messagebox
 from gui.widgets.data_table import DataTable
 from models.student import Student
-import json
-import os
+from services.logger import get_logger
 
-# #region agent log
-DEBUG_LOG_PATH = r"d:\Ecole\UCAC ICAM\PROJETS IMPORTANTS\student_grade_manager\.cursor\debug.log"
-def _debug_log(location, message, data, hypothesis_id=None):
-    try:
-        with open(DEBUG_LOG_PATH, 'a', encoding='utf-8') as f:
-            log_entry = {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": hypothesis_id,
-                "location": location,
-                "message": message,
-                "data": data,
-                "timestamp": os.path.getmtime(DEBUG_LOG_PATH) * 1000 if os.path.exists(DEBUG_LOG_PATH) else 0
-            }
-            f.write(json.dumps(log_entry) + "\n")
-    except: pass
-# #endregion
+logger = get_logger(__name__)
 
 
 class StudentsFrame(ctk.CTkScrollableFrame):
@@ -74,7 +57,7 @@ class StudentsFrame(ctk.CTkScrollableFrame):
         
         # Tableau des étudiants
         columns = [("Matricule", 150), ("Nom", 200), ("Prénom", 200), ("Niveau", 150)]
-        self.table = DataTable(self, columns=columns)
+        self.table = DataTable(self, columns=columns, virtual=True)
         self.table.pack(fill="both", expand=True, pady=(0, 20))
         
         # Boutons d'action
@@ -163,9 +146,7 @@ class StudentsFrame(ctk.CTkScrollableFrame):
         buttons_frame.pack(side="bottom", fill="x", pady=(10, 0))
         
         def save():
-            # #region agent log
-            _debug_log("students_frame.py:save:entry", "save() called", {"is_modification": student is not None, "student_matricule": student.matricule if student else None}, "A")
-            # #endregion
+            logger.debug("save() called", extra={'data': {'is_modification': student is not None, 'student_matricule': student.matricule if student else None}})
             
             nom = nom_entry.get().strip()
             prenom = prenom_entry.get().strip()
@@ -178,76 +159,56 @@ class StudentsFrame(ctk.CTkScrollableFrame):
             else:
                 matricule = matricule_entry.get().strip()
             
-            # #region agent log
-            _debug_log("students_frame.py:save:fields", "Fields extracted", {"nom": nom, "prenom": prenom, "matricule": matricule, "niveau": niveau}, "B")
-            # #endregion
+            logger.debug("Fields extracted", extra={'data': {'nom': nom, 'prenom': prenom, 'matricule': matricule, 'niveau': niveau}})
             
             if not all([nom, prenom, matricule, niveau]):
-                # #region agent log
-                _debug_log("students_frame.py:save:validation_failed", "Validation failed - empty fields", {"nom": nom, "prenom": prenom, "matricule": matricule, "niveau": niveau}, "B")
-                # #endregion
+                logger.debug("Validation failed - empty fields", extra={'data': {'nom': nom, 'prenom': prenom, 'matricule': matricule, 'niveau': niveau}})
                 messagebox.showerror("Erreur", "Tous les champs sont obligatoires")
                 return
             
             # Vérifier l'unicité du matricule (seulement pour l'ajout)
             if not student:
-                if any(s.matricule == matricule for s in self.main_window.students):
+                if self.main_window.repository.get_student(matricule):
                     messagebox.showerror("Erreur", f"Le matricule {matricule} existe déjà")
                     return
                 new_student = Student(nom, prenom, matricule, niveau)
                 is_valid, error_msg = new_student.validate()
                 if not is_valid:
-                    # #region agent log
-                    _debug_log("students_frame.py:save:validation_failed", "Student validation failed", {"error": error_msg}, "B")
-                    # #endregion
+                    logger.debug("Student validation failed", extra={'data': {'error': error_msg}})
                     messagebox.showerror("Erreur", error_msg)
                     return
-                self.main_window.students.append(new_student)
+                self.main_window.repository.add_student(new_student)
             else:
                 # Modification : mettre à jour les champs modifiables
-                # #region agent log
-                _debug_log("students_frame.py:save:before_modify", "Before modification", {"old_nom": student.nom, "old_prenom": student.prenom, "old_niveau": student.niveau}, "D")
-                # #endregion
+                logger.debug("Before modification", extra={'data': {'old_nom': student.nom, 'old_prenom': student.prenom, 'old_niveau': student.niveau}})
                 
-                student.nom = nom
-                student.prenom = prenom
-                student.niveau = niveau
-                
-                # #region agent log
-                _debug_log("students_frame.py:save:after_modify", "After modification", {"new_nom": student.nom, "new_prenom": student.prenom, "new_niveau": student.niveau}, "D")
-                # #endregion
-                
-                is_valid, error_msg = student.validate()
+                # Valider les nouvelles valeurs avant de modifier l'étudiant
+                is_valid, error_msg = Student(nom, prenom, matricule, niveau).validate()
                 if not is_valid:
-                    # #region agent log
-                    _debug_log("students_frame.py:save:validation_failed", "Student validation failed after modify", {"error": error_msg}, "B")
-                    # #endregion
+                    logger.debug("Student validation failed before modify", extra={'data': {'error': error_msg}})
                     messagebox.showerror("Erreur", error_msg)
                     return
+                
+                self.main_window.repository.update_student(student, nom, prenom, niveau)
+                
+                logger.debug("After modification", extra={'data': {'new_nom': student.nom, 'new_prenom': student.prenom, 'new_niveau': student.niveau}})
             
-            # #region agent log
-            _debug_log("students_frame.py:save:before_refresh", "Before refresh_data()", {"students_count": len(self.main_window.students)}, "C")
-            # #endregion
+            logger.debug("Before refresh_data()", extra={'data': {'students_count': len(self.main_window.students)}})
             
             self.main_window.refresh_data()
             
-            # #region agent log
-            _debug_log("students_frame.py:save:after_refresh", "After refresh_data()", {"students_count": len(self.main_window.students)}, "C")
-            # #endregion
+            logger.debug("After refresh_data()", extra={'data': {'students_count': len(self.main_window.students)}})
             
             self._load_table_data()
             dialog.destroy()
             
-            # #region agent log
-            _debug_log("students_frame.py:save:exit", "save() completed successfully", {}, "A")
-            # #endregion
+            logger.debug("save() completed successfully")
         
         # Fonction de suppression depuis le dialogue
         def delete_from_dialog():
             if student and messagebox.askyesno("Confirmation", f"Êtes-vous sûr de vouloir supprimer {student.prenom} {student.nom} ?"):
                 # Supprimer aussi toutes ses notes
-                self.main_window.grades = [g for g in self.main_window.grades if g.matricule_etudiant != student.matricule]
-                self.main_window.students.remove(student)
+                self.main_window.repository.remove_student(student)
                 self.main_window.refresh_data()
                 self._load_table_data()
                 dialog.destroy()
@@ -263,7 +224,7 @@ class StudentsFrame(ctk.CTkScrollableFrame):
             hover_color="#45a049" if student else "#1a5a8a",
             width=150,
             height=40,
-            command=lambda: (_debug_log("students_frame.py:button:click", "Save button clicked", {"btn_text": btn_text}, "A"), save())
+            command=save
         )
         save_btn.pack(side="right", padx=(10, 0))
         
@@ -298,7 +259,7 @@ class StudentsFrame(ctk.CTkScrollableFrame):
             return
         
         matricule = selected[0]
-        student = next((s for s in self.main_window.students if s.matricule == matricule), None)
+        student = self.main_window.repository.get_student(matricule)
         if student:
             self._show_add_dialog(student)
     
@@ -310,13 +271,12 @@ class StudentsFrame(ctk.CTkScrollableFrame):
             return
         
         matricule = selected[0]
-        student = next((s for s in self.main_window.students if s.matricule == matricule), None)
+        student = self.main_window.repository.get_student(matricule)
         
         if student:
             if messagebox.askyesno("Confirmation", f"Êtes-vous sûr de vouloir supprimer {student.prenom} {student.nom} ?"):
                 # Supprimer aussi toutes ses notes
-                self.main_window.grades = [g for g in self.main_window.grades if g.matricule_etudiant != matricule]
-                self.main_window.students.remove(student)
+                self.main_window.repository.remove_student(student)
                 self.main_window.refresh_data()
                 self._load_table_data()
     
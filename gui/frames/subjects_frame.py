@@ -54,7 +54,7 @@ class SubjectsFrame(ctk.CTkScrollableFrame):
         
         # Tableau des matières
         columns = [("Code", 150), ("Nom", 300), ("Coefficient", 150), ("Niveau", 150)]
-        self.table = DataTable(self, columns=columns)
+        self.table = DataTable(self, columns=columns, virtual=True)
         self.table.pack(fill="both", expand=True, pady=(0, 20))
         
         # Boutons d'action
@@ -154,7 +154,7 @@ class SubjectsFrame(ctk.CTkScrollableFrame):
             
             # Vérifier l'unicité du code
             if not subject:
-                if any(s.code == code for s in self.main_window.subjects):
+                if self.main_window.repository.get_subject(code):
                     messagebox.showerror("Erreur", f"Le code {code} existe déjà")
                     return
                 new_subject = Subject(nom, code, coefficient, niveau)
@@ -162,15 +162,14 @@ class SubjectsFrame(ctk.CTkScrollableFrame):
                 if not is_valid:
                     messagebox.showerror("Erreur", error_msg)
                     return
-                self.main_window.subjects.append(new_subject)
+                self.main_window.repository.add_subject(new_subject)
             else:
-                subject.nom = nom
-                subject.coefficient = coefficient
-                subject.niveau = niveau
-                is_valid, error_msg = subject.validate()
+                # Valider les nouvelles valeurs avant de modifier la matière
+                is_valid, error_msg = Subject(nom, subject.code, coefficient, niveau).validate()
                 if not is_valid:
                     messagebox.showerror("Erreur", error_msg)
                     return
+                self.main_window.repository.update_subject(subject, nom, coefficient, niveau)
             
             self.main_window.refresh_data()
             self._load_table_data()
@@ -202,7 +201,7 @@ class SubjectsFrame(ctk.CTkScrollableFrame):
             return
         
         code = selected[0]
-        subject = next((s for s in self.main_window.subjects if s.code == code), None)
+        subject = self.main_window.repository.get_subject(code)
         if subject:
             self._show_add_dialog(subject)
     
@@ -214,13 +213,12 @@ class SubjectsFrame(ctk.CTkScrollableFrame):
             return
         
         code = selected[0]
-        subject = next((s for s in self.main_window.subjects if s.code == code), None)
+        subject = self.main_window.repository.get_subject(code)
         
         if subject:
             if messagebox.askyesno("Confirmation", f"Êtes-vous sûr de vouloir supprimer {subject.nom} ?"):
                 # Supprimer aussi toutes ses notes
-                self.main_window.grades = [g for g in self.main_window.grades if g.code_matiere != code]
-                self.main_window.subjects.remove(subject)
+                self.main_window.repository.remove_subject(subject)
                 self.main_window.refresh_data()
                 self._load_table_data()
     
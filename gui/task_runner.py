@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Exécution des calculs longs hors du thread Tk
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Tuple
+
+
+class TaskRunner:
+    """
+    Exécute des calculs dans un thread de travail et renvoie leurs résultats au thread Tk
+    
+    Chaque tâche porte un nom. Soumettre une tâche du même nom annule la
+    précédente : si elle n'a pas commencé elle ne s'exécute pas, sinon son
+    résultat est ignoré. Les résultats sont récupérés par une consultation
+    périodique avec after(), et les callbacks s'exécutent dans le thread Tk.
+    """
+    
+    # Intervalle de consultation des tâches en cours (ms)
+    POLL_MS = 50
+    
+    def __init__(self, widget):
+        """
+        Initialise l'exécuteur
+        
+        Args:
+            widget: Widget Tk utilisé pour after()
+        """
+        self.widget = widget
+        # Un seul thread : les calculs s'enchaînent sans se concurrencer
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stats")
+        self._tasks: Dict[str, Tuple] = {}
+        self._poll_job = None
+    
+    def submit(self, name: str, function: Callable, callback: Callable, *args):
+        """
+        Lance un calcul en remplaçant la tâche de même nom
+        
+        Args:
+            name (str): Nom de la tâche
+            function (Callable): Calcul exécuté dans le thread de travail avec *args
+            callback (Callable): Appelée dans le thread Tk avec le résultat
+            *args: Arguments du calcul
+        """
+        self.cancel(name)
+        future = self._executor.submit(function, *args)
+        self._tasks[name] = (future, callback)
+        if self._poll_job is None:
+            self._poll_job = self.widget.after(self.POLL_MS, self._poll)
+    
+    def cancel(self, name: str):
+        """
+        Annule une tâche : elle ne s'exécutera pas, ou son résultat sera ignoré
+        
+        Args:
+            name (str): Nom de la tâche
+        """
+        task = self._tasks.pop(name, None)
+        if task is not None:
+            task[0].cancel()
+    
+    def cancel_group(self, prefix: str) -> bool:
+        """
+        Annule toutes les tâches dont le nom commence par un préfixe
+        
+        Args:
+            prefix (str): Préfixe des noms (ex: "statistics." pour les tâches d'une frame)
+        
+        Returns:
+            bool: True si au moins une tâche a été annulée
+        """
+        names = [name for name in self._tasks if name.startswith(prefix)]
+        for name in names:
+            self.cancel(name)
+        return bool(names)
+    
+    def is_running(self, name: str) -> bool:
+        """
+        Indique si une tâche attend encore son résultat
+        
+        Args:
+            name (str): Nom de la tâche
+        
+        Returns:
+            bool: True si la tâche est en attente ou en cours
+        """
+        return name in self._tasks
+    
+    def _poll(self):
+        """Transmet aux callbacks les résultats des tâches terminées"""
+        self._poll_job = None
+        for name, (future, callback) in list(self._tasks.items()):
+            if not future.done():
+                continue
+            del self._tasks[name]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Erreur lors du calcul '{name}': {e}")
+                continue
+            callback(result)
+        if self._tasks:
+            self._poll_job = self.widget.after(self.POLL_MS, self._poll)
+    
+    def shutdown(self):
+        """Abandonne les tâches en attente et arrête le thread de travail"""
+        for name in list(self._tasks):
+            self.cancel(name)
+        if self._poll_job is not None:
+            self.widget.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._executor.shutdown(wait=False)
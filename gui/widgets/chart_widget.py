@@ -4,18 +4,73 @@ Widget de graphique réutilisable
 Intègre matplotlib dans CustomTkinter pour afficher des graphiques
 """
 
+import threading
 import customtkinter as ctk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
+
+# matplotlib est long à importer : il est chargé en arrière-plan, hors du
+# chemin de démarrage, et les graphiques affichent un texte d'attente jusque-là
+_matplotlib = None
+_matplotlib_lock = threading.Lock()
+_matplotlib_ready = threading.Event()
+_preload_thread = None
+
+
+def load_matplotlib():
+    """
+    Importe matplotlib et le backend Tk (une seule fois)
+    
+    Returns:
+        tuple: (Figure, FigureCanvasTkAgg)
+    """
+    global _matplotlib
+    with _matplotlib_lock:
+        if _matplotlib is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            _matplotlib = (Figure, FigureCanvasTkAgg)
+            _matplotlib_ready.set()
+    return _matplotlib
+
+
+def _preload():
+    """Importe matplotlib dans le thread d'arrière-plan"""
+    try:
+        load_matplotlib()
+    except ImportError as e:
+        print(f"Erreur lors du chargement de matplotlib: {e}")
+
+
+def preload_matplotlib() -> bool:
+    """
+    Lance l'import de matplotlib dans un thread d'arrière-plan s'il n'a pas déjà eu lieu
+    
+    Returns:
+        bool: True si l'import est encore en cours
+    """
+    global _preload_thread
+    if _matplotlib_ready.is_set():
+        return False
+    if _preload_thread is None:
+        _preload_thread = threading.Thread(target=_preload, daemon=True)
+        _preload_thread.start()
+    return _preload_thread.is_alive()
 
 
 class ChartWidget(ctk.CTkFrame):
     """
     Widget de graphique avec matplotlib
+    
+    Les barres et la ligne sont créées une fois puis mises à jour sur place :
+    tant que les catégories ne changent pas, seules les données sont redessinées
+    (blitting), sans recalcul de la mise en page.
     """
     
+    # Au-delà de ce nombre de catégories, les valeurs sont regroupées par tranches
+    MAX_CATEGORIES = 25
+    
+    # Intervalle de vérification du chargement de matplotlib (ms)
+    POLL_MS = 50
+    
     def __init__(self, parent, title: str, subtitle: str = "", chart_type: str = "bar", **kwargs):
         """
         Initialise le widget de graphique
@@ -32,6 +87,20 @@ class ChartWidget(ctk.CTkFrame):
         self.subtitle = subtitle
         self.chart_type = chart_type
         
+        # Artistes réutilisés d'un tracé à l'autre
+        self._kind = None
+        self._labels = None
+        self._bars = []
+        self._bar_texts = []
+        self._line = None
+        self._background = None
+        
+        # Figure créée une fois matplotlib chargé ; dernier tracé demandé avant cela
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+        self._pending = None
+        
         self.configure(fg_color=("#2b2b2b", "#1a1a1a"), corner_radius=15)
         
         self._create_widgets()
@@ -58,9 +127,58 @@ class ChartWidget(ctk.CTkFrame):
             )
             subtitle_label.pack(anchor="w", pady=(5, 0))
         
+        # Texte d'attente affiché pendant le chargement de matplotlib
+        self.placeholder_label = ctk.CTkLabel(
+            self,
+            text="Chargement du graphique...",
+            height=300,
+            font=ctk.CTkFont(size=12),
+            text_color=("#808080", "#a0a0a0")
+        )
+        self.placeholder_label.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        
+        self._poll_matplotlib()
+    
+    def _poll_matplotlib(self):
+        """Crée la figure dès que matplotlib est chargé"""
+        if preload_matplotlib():
+            self.after(self.POLL_MS, self._poll_matplotlib)
+            return
+        if not self.winfo_exists():
+            return
+        try:
+            self._create_figure()
+        except ImportError as e:
+            # L'import a échoué : le texte d'attente l'indique au lieu de rester affiché
+            self._pending = None
+            self.placeholder_label.configure(text=f"Graphique indisponible : matplotlib n'a pas pu être chargé ({e})")
+    
+    def _create_figure(self):
+        """Crée la figure matplotlib à la place du texte d'attente"""
+        Figure, FigureCanvasTkAgg = load_matplotlib()
+        
         # Figure matplotlib
         self.fig = Figure(figsize=(8, 4), facecolor='#1a1a1a')
         self.ax = self.fig.add_subplot(111, facecolor='#1a1a1a')
+        self._style_axes()
+        
+        # Canvas pour intégrer matplotlib
+        self.canvas = FigureCanvasTkAgg(self.fig, self)
+        self.canvas.get_tk_widget().configure(bg='#1a1a1a')
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.draw()
+        self.placeholder_label.destroy()
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=20, pady=(0, 20))
+        
+        # Tracer ce qui a été demandé pendant le chargement
+        if self._pending is not None:
+            plot, args = self._pending
+            self._pending = None
+            plot(*args)
+    
+    def _style_axes(self):
+        """Applique le thème sombre aux axes"""
+        self.ax.set_facecolor('#1a1a1a')
         self.ax.tick_params(colors='white')
         self.ax.spines['bottom'].set_color('white')
         self.ax.spines['top'].set_color('white')
@@ -69,13 +187,119 @@ class ChartWidget(ctk.CTkFrame):
         self.ax.xaxis.label.set_color('white')
         self.ax.yaxis.label.set_color('white')
         
-        # Canvas pour intégrer matplotlib
-        self.canvas = FigureCanvasTkAgg(self.fig, self)
-        self.canvas.get_tk_widget().configure(bg='#1a1a1a')
-        self.canvas.draw()
-        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=20, pady=(0, 20))
+    def _reset(self, kind):
+        """
+        Vide les axes et oublie les artistes réutilisables
+        
+        Args:
+            kind (str): Type du prochain tracé ("bar", "line" ou None)
+        """
+        self.ax.clear()
+        self._style_axes()
+        self._kind = kind
+        self._labels = None
+        self._bars = []
+        self._bar_texts = []
+        self._line = None
+    
+    @classmethod
+    def _downsample(cls, labels: list, values: list, grouping: str):
+        """
+        Réduit le nombre de catégories quand elles sont trop nombreuses
+        
+        Les catégories consécutives sont regroupées par tranches. Avec 'sum',
+        une tranche vaut la somme de ses valeurs (effectifs : le total est
+        conservé) ; avec 'max', sa plus grande valeur. Avec 'envelope', chaque
+        tranche garde ses points minimum et maximum, dans leur ordre : une
+        courbe conserve ses pics et ses creux.
+        
+        Args:
+            labels (list): Catégories
+            values (list): Valeurs associées
+            grouping (str): 'sum', 'max' ou 'envelope'
+        
+        Returns:
+            tuple: (catégories, valeurs), au plus MAX_CATEGORIES de chaque
+        """
+        if len(values) <= cls.MAX_CATEGORIES:
+            return labels, values
+        grouped_labels = []
+        grouped_values = []
+        
+        if grouping == 'envelope':
+            # Deux points par tranche
+            size = -(-len(values) // (cls.MAX_CATEGORIES // 2))
+            for start in range(0, len(values), size):
+                positions = range(start, min(start + size, len(values)))
+                low = min(positions, key=values.__getitem__)
+                high = max(positions, key=values.__getitem__)
+                for position in sorted({low, high}):
+                    grouped_labels.append(labels[position])
+                    grouped_values.append(values[position])
+            return grouped_labels, grouped_values
+        
+        size = -(-len(values) // cls.MAX_CATEGORIES)
+        for start in range(0, len(values), size):
+            chunk = values[start:start + size]
+            grouped_values.append(sum(chunk) if grouping == 'sum' else max(chunk))
+            grouped_labels.append(f"{labels[start]} (+{len(chunk) - 1})" if len(chunk) > 1 else labels[start])
+        return grouped_labels, grouped_values
+    
+    def _animated_artists(self) -> list:
+        """Retourne les artistes redessinés par blitting"""
+        artists = self._bars + self._bar_texts
+        if self._line is not None:
+            artists.append(self._line)
+        return artists
+    
+    def _on_draw(self, event):
+        """Mémorise le fond après un rendu complet et y dessine les données"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
+    
+    def _set_categories(self, labels: list):
+        """
+        Place les catégories sur l'axe X si elles ont changé
+        
+        Args:
+            labels (list): Catégories, aux positions 0 à n-1
+        """
+        if labels != self._labels:
+            self.ax.set_xticks(range(len(labels)))
+            # Catégories nombreuses : labels inclinés pour éviter qu'ils se chevauchent
+            if len(labels) > 8:
+                self.ax.set_xticklabels(labels, rotation=45, ha='right')
+            else:
+                self.ax.set_xticklabels(labels)
     
-    def plot_bar_chart(self, labels: list, values: list, color: str = "#1F6AA5"):
+    def _redraw(self, labels: list, previous_ylim: tuple):
+        """
+        Redessine le graphique au moindre coût
+        
+        Args:
+            labels (list): Catégories affichées
+            previous_ylim (tuple): Limites de l'axe Y avant la mise à jour
+        """
+        self.ax.relim()
+        self.ax.autoscale_view()
+        
+        if labels != self._labels:
+            # Nouvelles catégories : la mise en page doit être recalculée
+            self._labels = labels
+            self.fig.tight_layout()
+            self.canvas.draw_idle()
+        elif self._background is None or self.ax.get_ylim() != previous_ylim:
+            # Axes modifiés : rendu complet, sans mise en page
+            self.canvas.draw_idle()
+        else:
+            # Seules les données ont changé : blitting sur le fond mémorisé
+            self.canvas.restore_region(self._background)
+            for artist in self._animated_artists():
+                self.ax.draw_artist(artist)
+            self.canvas.blit(self.fig.bbox)
+    
+    def plot_bar_chart(self, labels: list, values: list, color: str = "#1F6AA5", grouping: str = "sum"):
         """
         Affiche un graphique en barres
         
@@ -83,61 +307,70 @@ class ChartWidget(ctk.CTkFrame):
             labels (list): Labels pour l'axe X
             values (list): Valeurs pour l'axe Y
             color (str): Couleur des barres
+            grouping (str): Regroupement des catégories en trop : "sum" pour
+                des effectifs, "max" pour des valeurs qui ne s'additionnent pas
         """
-        self.ax.clear()
-        self.ax.set_facecolor('#1a1a1a')
-        self.ax.tick_params(colors='white')
-        self.ax.spines['bottom'].set_color('white')
-        self.ax.spines['top'].set_color('white')
-        self.ax.spines['right'].set_color('white')
-        self.ax.spines['left'].set_color('white')
-        self.ax.xaxis.label.set_color('white')
-        self.ax.yaxis.label.set_color('white')
+        if self.canvas is None:
+            self._pending = (self.plot_bar_chart, (labels, values, color, grouping))
+            return
+        labels, values = self._downsample(list(labels), list(values), grouping)
+        previous_ylim = self.ax.get_ylim()
         
-        bars = self.ax.bar(labels, values, color=color)
-        self.ax.set_ylabel('Nombre', color='white')
+        if self._kind != "bar" or len(self._bars) != len(values):
+            self._reset("bar")
+            self._bars = list(self.ax.bar(range(len(values)), values, color=color, animated=True))
+            self.ax.set_ylabel('Nombre', color='white')
+            self._bar_texts = [self.ax.text(0, 0, '', ha='center', va='bottom', color='white', animated=True)
+                               for _ in self._bars]
+        else:
+            for bar, value in zip(self._bars, values):
+                bar.set_height(value)
+                bar.set_color(color)
+        self._set_categories(labels)
         
         # Ajouter les valeurs sur les barres
-        for bar in bars:
+        for bar, text in zip(self._bars, self._bar_texts):
             height = bar.get_height()
-            self.ax.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{int(height)}',
-                        ha='center', va='bottom', color='white')
+            text.set_position((bar.get_x() + bar.get_width()/2., height))
+            text.set_text(f'{int(height)}')
         
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self._redraw(labels, previous_ylim)
     
     def plot_line_chart(self, x_data: list, y_data: list, label: str = "", color: str = "#1F6AA5"):
         """
         Affiche un graphique en ligne
         
         Args:
-            x_data (list): Données pour l'axe X
+            x_data (list): Catégories de l'axe X
             y_data (list): Données pour l'axe Y
             label (str): Label de la ligne
             color (str): Couleur de la ligne
         """
-        self.ax.clear()
-        self.ax.set_facecolor('#1a1a1a')
-        self.ax.tick_params(colors='white')
-        self.ax.spines['bottom'].set_color('white')
-        self.ax.spines['top'].set_color('white')
-        self.ax.spines['right'].set_color('white')
-        self.ax.spines['left'].set_color('white')
-        self.ax.xaxis.label.set_color('white')
-        self.ax.yaxis.label.set_color('white')
+        if self.canvas is None:
+            self._pending = (self.plot_line_chart, (x_data, y_data, label, color))
+            return
+        x_data, y_data = self._downsample(list(x_data), list(y_data), 'envelope')
+        previous_ylim = self.ax.get_ylim()
         
-        self.ax.plot(x_data, y_data, marker='o', color=color, linewidth=2, label=label)
-        self.ax.set_ylabel('Valeur', color='white')
-        self.ax.legend(loc='upper left', facecolor='#1a1a1a', edgecolor='white', labelcolor='white')
-        self.ax.grid(True, alpha=0.3, color='white')
+        if (self._kind != "line" or len(self._line.get_ydata()) != len(y_data)
+                or self._line.get_label() != label):
+            self._reset("line")
+            self._line, = self.ax.plot(range(len(y_data)), y_data, marker='o', color=color,
+                                       linewidth=2, label=label, animated=True)
+            self.ax.set_ylabel('Valeur', color='white')
+            self.ax.legend(loc='upper left', facecolor='#1a1a1a', edgecolor='white', labelcolor='white')
+            self.ax.grid(True, alpha=0.3, color='white')
+        else:
+            self._line.set_ydata(y_data)
+            self._line.set_color(color)
+        self._set_categories(x_data)
         
-        self.fig.tight_layout()
-        self.canvas.draw()
+        self._redraw(x_data, previous_ylim)
     
     def clear(self):
         """Efface le graphique"""
-        self.ax.clear()
-        self.ax.set_facecolor('#1a1a1a')
-        self.canvas.draw()
-
+        if self.canvas is None:
+            self._pending = None
+            return
+        self._reset(None)
+        self.canvas.draw_idle()
@@ -4,16 +4,35 @@ Widget de tableau de données réutilisable
 Affiche des données dans un tableau avec tri et recherche
 """
 
+import re
 import customtkinter as ctk
 from tkinter import ttk
 
 
+# Valeur numérique éventuellement suivie d'un barème (ex: "15.50/20")
+NUMBER_PATTERN = re.compile(r"^\s*(-?\d+(?:\.\d+)?)(?:\s*/\s*\d+)?\s*$")
+
+
 class DataTable(ctk.CTkFrame):
     """
     Tableau de données avec recherche et tri
+    
+    En mode virtuel, les données restent dans une liste Python et seules les
+    lignes visibles sont matérialisées dans le Treeview. Les mêmes items sont
+    réutilisés lors du défilement, ce qui garde l'interface fluide même avec
+    plus de 100 000 lignes.
     """
     
-    def __init__(self, parent, columns: list, data: list = None, **kwargs):
+    # Hauteur de ligne utilisée si le style n'en définit pas
+    DEFAULT_ROW_HEIGHT = 20
+    
+    # Délai (ms) sans frappe avant d'appliquer la recherche
+    SEARCH_DELAY_MS = 200
+    
+    # Séparateur des cellules dans l'index de recherche (ne peut pas être tapé)
+    SEARCH_SEPARATOR = "\x00"
+    
+    def __init__(self, parent, columns: list, data: list = None, virtual: bool = False, **kwargs):
         """
         Initialise le tableau de données
         
@@ -21,12 +40,36 @@ class DataTable(ctk.CTkFrame):
             parent: Widget parent
             columns (list): Liste des colonnes [(nom, largeur), ...]
             data (list): Données initiales (liste de tuples)
+            virtual (bool): Active le mode virtuel (seules les lignes visibles sont créées)
         """
         super().__init__(parent, **kwargs)
         
         self.columns = columns
         self.data = data or []
         self.filtered_data = self.data.copy()
+        # Clé associée à chaque ligne de self.data et index (dans self.data)
+        # de chaque ligne affichée
+        self.keys = None
+        self._view_indices = list(range(len(self.data)))
+        
+        # État du mode virtuel : première ligne affichée, nombre de lignes
+        # visibles et index (dans filtered_data) de la ligne sélectionnée
+        self.virtual = virtual
+        self._offset = 0
+        self._visible_rows = 10
+        self._selected_index = None
+        
+        # Index de recherche : une clé en minuscules par ligne de self.data,
+        # dernier terme appliqué et index des lignes correspondantes
+        self._search_keys = []
+        self._last_search = ""
+        self._match_indices = None
+        self._search_job = None
+        self._build_search_index()
+        
+        # Tri : (index de colonne, décroissant) et clés typées mises en cache par colonne
+        self._sort_state = None
+        self._sort_keys = {}
         
         self.configure(fg_color=("#2b2b2b", "#1a1a1a"), corner_radius=15)
         
@@ -53,14 +96,29 @@ class DataTable(ctk.CTkFrame):
         scrollbar = ttk.Scrollbar(tree_frame)
         scrollbar.pack(side="right", fill="y")
         
+        self.scrollbar = scrollbar
+        
         self.tree = ttk.Treeview(
             tree_frame,
             columns=[col[0] for col in self.columns],
             show="headings",
-            yscrollcommand=scrollbar.set,
+            yscrollcommand=None if self.virtual else scrollbar.set,
             style="Custom.Treeview"
         )
-        scrollbar.config(command=self.tree.yview)
+        if self.virtual:
+            # Le défilement est piloté par le modèle et non par le Treeview
+            scrollbar.config(command=self._on_scrollbar)
+            self.tree.bind("<Configure>", self._on_tree_configure)
+            self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+            self.tree.bind("<MouseWheel>", self._on_mousewheel)
+            self.tree.bind("<Button-4>", lambda e: self._scroll_by(-3))
+            self.tree.bind("<Button-5>", lambda e: self._scroll_by(3))
+            self.tree.bind("<Up>", lambda e: self._move_selection(-1))
+            self.tree.bind("<Down>", lambda e: self._move_selection(1))
+            self.tree.bind("<Prior>", lambda e: self._move_selection(-self._visible_rows))
+            self.tree.bind("<Next>", lambda e: self._move_selection(self._visible_rows))
+        else:
+            scrollbar.config(command=self.tree.yview)
         
         # Configuration des colonnes
         for col_name, width in self.columns:
@@ -89,58 +147,291 @@ class DataTable(ctk.CTkFrame):
     
     def _load_data(self):
         """Charge les données dans le tableau"""
+        if self.virtual:
+            self._scroll_to(self._offset, force=True)
+            return
+        
         # Effacer les données existantes
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # Ajouter les données filtrées
-        for row in self.filtered_data:
-            self.tree.insert("", "end", values=row)
+        # Ajouter les données filtrées (l'id de l'item est l'index de la ligne dans self.data)
+        for index, row in zip(self._view_indices, self.filtered_data):
+            self.tree.insert("", "end", iid=str(index), values=row)
+    
+    # ========== MODE VIRTUEL ==========
+    
+    def _row_height(self) -> int:
+        """Retourne la hauteur d'une ligne du Treeview en pixels"""
+        try:
+            height = int(ttk.Style().lookup("Custom.Treeview", "rowheight"))
+        except (ValueError, TypeError):
+            height = 0
+        return height or self.DEFAULT_ROW_HEIGHT
+    
+    def _on_tree_configure(self, event):
+        """Recalcule le nombre de lignes visibles lors d'un redimensionnement"""
+        row_height = self._row_height()
+        # Une ligne est réservée à l'en-tête des colonnes
+        visible_rows = max(1, event.height // row_height - 1)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._scroll_to(self._offset, force=True)
+    
+    def _scroll_to(self, offset: int, force: bool = False):
+        """
+        Positionne la fenêtre visible sur une ligne du modèle
+        
+        Args:
+            offset (int): Index de la première ligne à afficher
+            force (bool): Réaffiche même si la position n'a pas changé
+        """
+        max_offset = max(0, len(self.filtered_data) - self._visible_rows)
+        offset = min(max(0, offset), max_offset)
+        if offset != self._offset or force:
+            self._offset = offset
+            self._render_window()
+        self._update_scrollbar()
+    
+    def _scroll_by(self, rows: int):
+        """Fait défiler la fenêtre visible d'un nombre de lignes"""
+        self._scroll_to(self._offset + rows)
+        return "break"
+    
+    def _on_mousewheel(self, event):
+        """Gère la molette de la souris (Windows et macOS)"""
+        step = -event.delta // 120 if abs(event.delta) >= 120 else -event.delta
+        return self._scroll_by(step * 3)
+    
+    def _on_scrollbar(self, action, *args):
+        """Gère les commandes de la barre de défilement"""
+        if action == "moveto":
+            self._scroll_to(int(float(args[0]) * len(self.filtered_data)))
+        elif action == "scroll":
+            step = self._visible_rows if args[1] == "pages" else 1
+            self._scroll_to(self._offset + int(args[0]) * step)
+    
+    def _update_scrollbar(self):
+        """Met à jour la position de la barre de défilement"""
+        total = len(self.filtered_data)
+        if total <= self._visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self._offset / total,
+                               min(1.0, (self._offset + self._visible_rows) / total))
+    
+    def _render_window(self):
+        """Affiche les lignes visibles en réutilisant les items existants"""
+        rows = self.filtered_data[self._offset:self._offset + self._visible_rows]
+        items = self.tree.get_children()
+        
+        for index, row in enumerate(rows):
+            if index < len(items):
+                self.tree.item(items[index], values=row)
+            else:
+                self.tree.insert("", "end", values=row)
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+        # Le Treeview ne doit jamais défiler de lui-même
+        self.tree.yview_moveto(0)
+        
+        # Resélectionner la ligne du modèle si elle est visible
+        items = self.tree.get_children()
+        slot = None if self._selected_index is None else self._selected_index - self._offset
+        if slot is not None and 0 <= slot < len(items):
+            if self.tree.selection() != (items[slot],):
+                self.tree.selection_set(items[slot])
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+    
+    def _on_tree_select(self, event=None):
+        """Mémorise la ligne du modèle correspondant à la sélection"""
+        selection = self.tree.selection()
+        if selection:
+            self._selected_index = self._offset + self.tree.index(selection[0])
+        elif (self._selected_index is not None
+              and self._offset <= self._selected_index < self._offset + self._visible_rows):
+            self._selected_index = None
+    
+    def _move_selection(self, delta: int):
+        """
+        Déplace la sélection au clavier en faisant défiler si nécessaire
+        
+        Args:
+            delta (int): Nombre de lignes (négatif vers le haut)
+        """
+        if not self.filtered_data:
+            return "break"
+        if self._selected_index is None:
+            index = self._offset
+        else:
+            index = min(max(0, self._selected_index + delta), len(self.filtered_data) - 1)
+        self._selected_index = index
+        
+        if index < self._offset:
+            self._scroll_to(index, force=True)
+        elif index >= self._offset + self._visible_rows:
+            self._scroll_to(index - self._visible_rows + 1, force=True)
+        else:
+            self._render_window()
+        return "break"
+    
+    # ========== RECHERCHE ==========
+    
+    def _build_search_index(self):
+        """Construit l'index de recherche à partir de self.data"""
+        separator = self.SEARCH_SEPARATOR
+        self._search_keys = [separator.join(str(cell) for cell in row).lower() for row in self.data]
+        self._last_search = ""
+        self._match_indices = None
     
     def _on_search(self, event=None):
+        """Programme le filtrage après une courte pause dans la frappe"""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DELAY_MS, self._apply_search)
+    
+    def _apply_search(self):
         """Filtre les données selon la recherche"""
+        self._search_job = None
         search_term = self.search_entry.get().lower()
+        if search_term == self._last_search and self._match_indices is not None:
+            return
         
         if not search_term:
-            self.filtered_data = self.data.copy()
+            self._match_indices = None
         else:
-            self.filtered_data = [
-                row for row in self.data
-                if any(str(cell).lower().find(search_term) != -1 for cell in row)
-            ]
+            # Si le terme prolonge le précédent, seules les lignes déjà
+            # retenues peuvent encore correspondre
+            if self._match_indices is not None and self._last_search in search_term:
+                candidates = self._match_indices
+            else:
+                candidates = range(len(self._search_keys))
+            keys = self._search_keys
+            self._match_indices = [i for i in candidates if search_term in keys[i]]
+        self._last_search = search_term
+        self._refresh_view()
         
+        if self.virtual:
+            self._offset = 0
+            self._selected_index = None
         self._load_data()
     
+    def _refresh_view(self):
+        """Reconstruit filtered_data à partir du filtre et du tri courants"""
+        indices = range(len(self.data)) if self._match_indices is None else self._match_indices
+        if self._sort_state is not None:
+            column, descending = self._sort_state
+            keys = self._column_sort_keys(column)
+            # sorted() est stable, y compris avec reverse=True
+            indices = sorted(indices, key=keys.__getitem__, reverse=descending)
+        self._view_indices = list(indices)
+        self.filtered_data = [self.data[i] for i in self._view_indices]
+    
+    # ========== TRI ==========
+    
+    @staticmethod
+    def _typed_key(value) -> tuple:
+        """
+        Calcule la clé de tri typée d'une cellule
+        
+        Args:
+            value: Valeur de la cellule
+        
+        Returns:
+            tuple: (0, nombre) pour une valeur numérique, (1, texte) sinon
+        """
+        if isinstance(value, (int, float)):
+            return (0, float(value))
+        text = str(value)
+        match = NUMBER_PATTERN.match(text)
+        if match:
+            return (0, float(match.group(1)))
+        return (1, text)
+    
+    def _column_sort_keys(self, column: int) -> list:
+        """
+        Retourne les clés de tri d'une colonne, calculées une seule fois par set_data
+        
+        Args:
+            column (int): Index de la colonne
+        
+        Returns:
+            list: Clé typée de chaque ligne de self.data
+        """
+        keys = self._sort_keys.get(column)
+        if keys is None:
+            keys = [self._typed_key(row[column]) for row in self.data]
+            self._sort_keys[column] = keys
+        return keys
+    
     def _sort_column(self, col):
-        """Trie les données par colonne"""
-        # Récupérer les données actuelles
-        items = [(self.tree.set(item, col), item) for item in self.tree.get_children("")]
+        """Trie les données par colonne (un second clic inverse l'ordre)"""
+        column = [c[0] for c in self.columns].index(col)
+        descending = (self._sort_state is not None and self._sort_state[0] == column
+                      and not self._sort_state[1])
+        self._sort_state = (column, descending)
         
-        # Trier
-        try:
-            items.sort(key=lambda t: float(t[0]) if t[0].replace('.', '').isdigit() else t[0])
-        except:
-            items.sort(key=lambda t: t[0])
+        # Indicateur de tri dans les en-têtes
+        for index, (col_name, _) in enumerate(self.columns):
+            arrow = (" ▼" if descending else " ▲") if index == column else ""
+            self.tree.heading(col_name, text=col_name + arrow)
         
-        # Réorganiser les items
-        for index, (val, item) in enumerate(items):
-            self.tree.move(item, "", index)
+        self._refresh_view()
+        self._selected_index = None
+        self._load_data()
     
-    def set_data(self, data: list):
-        """Met à jour les données du tableau"""
+    def set_data(self, data: list, keys: list = None):
+        """
+        Met à jour les données du tableau
+        
+        Args:
+            data (list): Lignes à afficher (liste de tuples)
+            keys (list, optional): Clé associée à chaque ligne, retournée par get_selected_key()
+        """
         self.data = data
-        self.filtered_data = data.copy()
+        self.keys = keys
+        self._selected_index = None
+        self._sort_keys = {}
+        self._build_search_index()
+        # Le tri courant est conservé lors du rechargement
+        self._refresh_view()
         self._load_data()
     
     def get_selected_item(self):
         """Retourne l'item sélectionné"""
+        if self.virtual:
+            if self._selected_index is None or self._selected_index >= len(self.filtered_data):
+                return None
+            return list(self.filtered_data[self._selected_index])
+        
         selection = self.tree.selection()
         if selection:
             return self.tree.item(selection[0])['values']
         return None
     
+    def get_selected_key(self):
+        """
+        Retourne la clé de la ligne sélectionnée
+        
+        Returns:
+            La clé passée à set_data() pour cette ligne, ou None
+        """
+        if self.keys is None:
+            return None
+        if self.virtual:
+            if self._selected_index is None or self._selected_index >= len(self._view_indices):
+                return None
+            return self.keys[self._view_indices[self._selected_index]]
+        
+        selection = self.tree.selection()
+        if selection:
+            return self.keys[int(selection[0])]
+        return None
+    
     def clear_selection(self):
         """Efface la sélection"""
+        self._selected_index = None
         for item in self.tree.selection():
             self.tree.selection_remove(item)
 
@@ -65,29 +65,43 @@ class StatCard(ctk.CTkFrame):
         title_label.pack(anchor="w", pady=(0, 5))
         
         # Valeur principale
-        value_label = ctk.CTkLabel(
+        self.value_label = ctk.CTkLabel(
             content_frame,
             text=self.value,
             font=ctk.CTkFont(size=32, weight="bold")
         )
-        value_label.pack(anchor="w", pady=(0, 5))
+        self.value_label.pack(anchor="w", pady=(0, 5))
         
-        # Sous-texte avec variation
+        # Sous-texte avec variation (créé même vide, affiché seulement s'il a un texte)
+        self.subtitle_label = ctk.CTkLabel(
+            content_frame,
+            text=self.subtitle,
+            font=ctk.CTkFont(size=11),
+            text_color=("#4CAF50", "#4CAF50")
+        )
         if self.subtitle:
-            subtitle_label = ctk.CTkLabel(
-                content_frame,
-                text=self.subtitle,
-                font=ctk.CTkFont(size=11),
-                text_color=("#4CAF50", "#4CAF50")
-            )
-            subtitle_label.pack(anchor="w")
+            self.subtitle_label.pack(anchor="w")
     
     def update_value(self, new_value: str, new_subtitle: str = ""):
-        """Met à jour la valeur et le sous-texte"""
-        self.value = new_value
-        self.subtitle = new_subtitle
-        # Recréer les widgets pour mettre à jour
-        for widget in self.winfo_children():
-            widget.destroy()
-        self._create_widgets("📊")
+        """
+        Met à jour la valeur et le sous-texte
+
+        Les labels existants sont modifiés sur place ; rien n'est fait si
+        la valeur et le sous-texte n'ont pas changé.
+        
+        Args:
+            new_value (str): Nouvelle valeur principale
+            new_subtitle (str): Nouveau sous-texte (vide pour le masquer)
+        """
+        if new_value != self.value:
+            self.value = new_value
+            self.value_label.configure(text=new_value)
+        
+        if new_subtitle != self.subtitle:
+            if not new_subtitle:
+                self.subtitle_label.pack_forget()
+            elif not self.subtitle:
+                self.subtitle_label.pack(anchor="w")
+            self.subtitle = new_subtitle
+            self.subtitle_label.configure(text=new_subtitle)
 
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Fenêtre d'import en masse - Importe des fichiers CSV/TSV sans bloquer l'interface
+"""
+
+import os
+import queue
+import threading
+import customtkinter as ctk
+from tkinter import messagebox
+from services import bulk_import
+
+
+class ImportDialog(ctk.CTkToplevel):
+    """
+    Dialogue d'import de fichiers CSV/TSV avec barre de progression
+    
+    La lecture et la validation de chaque fichier s'exécutent dans un thread de
+    travail qui communique par une file consultée avec after() ; il ne lit
+    qu'une copie des clés du dépôt prise dans le thread Tk. Les entités validées
+    sont ajoutées au dépôt par lots depuis le thread Tk, qui fait aussi l'unique
+    sauvegarde finale.
+    """
+    
+    # Intervalle de consultation de la file du thread de travail (ms)
+    POLL_MS = 100
+    
+    # Ordre d'import : les notes référencent étudiants et matières
+    ORDER = {'students': 0, 'subjects': 1, 'grades': 2}
+    
+    def __init__(self, main_window, paths):
+        """
+        Initialise le dialogue et démarre l'import
+        
+        Args:
+            main_window: Fenêtre principale
+            paths (list): Chemins des fichiers à importer
+        """
+        super().__init__(main_window)
+        
+        self.main_window = main_window
+        self._paths = sorted(paths, key=lambda p: self.ORDER.get(bulk_import.file_collection(p), 3))
+        self._file_index = -1
+        self._queue = queue.Queue()
+        self._cancelled = threading.Event()
+        self._result = None
+        self._position = 0
+        self._summary = []
+        
+        self.title("Import de données")
+        self.geometry("480x200")
+        self.transient(main_window)
+        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+        
+        content = ctk.CTkFrame(self)
+        content.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        self.status_label = ctk.CTkLabel(content, text="Préparation...", font=ctk.CTkFont(size=14))
+        self.status_label.pack(anchor="w", pady=(0, 10))
+        
+        self.progress_bar = ctk.CTkProgressBar(content, width=420)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(pady=(0, 20))
+        
+        self.cancel_button = ctk.CTkButton(content, text="Annuler", fg_color="#808080", command=self._cancel)
+        self.cancel_button.pack(side="right")
+        
+        self._next_file()
+    
+    # ========== ÉTAPES ==========
+    
+    def _next_file(self):
+        """Lance la lecture du fichier suivant, ou la sauvegarde s'il n'en reste plus"""
+        self._file_index += 1
+        if self._cancelled.is_set() or self._file_index >= len(self._paths):
+            self._start_commit()
+            return
+        
+        path = self._paths[self._file_index]
+        self.status_label.configure(text=f"Lecture de {os.path.basename(path)} "
+                                         f"({self._file_index + 1}/{len(self._paths)})")
+        self.progress_bar.set(0)
+        existing = bulk_import.ExistingKeys(self.main_window.repository)
+        
+        def work():
+            result = bulk_import.parse_file(
+                path, existing,
+                progress=lambda fraction: self._queue.put(('progress', fraction)),
+                is_cancelled=self._cancelled.is_set
+            )
+            self._queue.put(('parsed', result))
+        
+        threading.Thread(target=work, daemon=True).start()
+        self.after(self.POLL_MS, self._poll)
+    
+    def _poll(self):
+        """Traite les messages du thread de travail"""
+        try:
+            while True:
+                kind, value = self._queue.get_nowait()
+                if kind == 'progress':
+                    # La lecture occupe la première moitié de la barre
+                    self.progress_bar.set(value / 2)
+                elif kind == 'parsed':
+                    self._on_parsed(value)
+                    return
+        except queue.Empty:
+            pass
+        self.after(self.POLL_MS, self._poll)
+    
+    def _on_parsed(self, result):
+        """
+        Commence l'ajout au dépôt des entités d'un fichier lu
+        
+        Args:
+            result (ImportResult): Résultat de la lecture, ou None en cas d'échec
+        """
+        path = self._paths[self._file_index]
+        if result is None:
+            if not self._cancelled.is_set():
+                self._summary.append(f"{os.path.basename(path)} : fichier illisible ou non reconnu")
+            self._next_file()
+            return
+        
+        self._result = result
+        self._position = 0
+        self.status_label.configure(text=f"Ajout de {len(result.entities)} ligne(s) de {os.path.basename(path)}")
+        self._apply_step()
+    
+    def _apply_step(self):
+        """Ajoute un lot d'entités au dépôt puis redonne la main à Tk"""
+        result = self._result
+        if not self._cancelled.is_set():
+            self._position = bulk_import.apply_batch(result, self.main_window.repository, self._position)
+        
+        if self._position < len(result.entities) and not self._cancelled.is_set():
+            self.progress_bar.set(0.5 + self._position / len(result.entities) / 2)
+            self.after(1, self._apply_step)
+            return
+        
+        self._summary.append(self._describe(self._paths[self._file_index], result))
+        self._next_file()
+    
+    def _start_commit(self):
+        """Sauvegarde en une fois tout ce qui a été ajouté, depuis le thread Tk"""
+        self.status_label.configure(text="Sauvegarde...")
+        self.progress_bar.set(1)
+        self.cancel_button.configure(state="disabled")
+        
+        # Laisser Tk afficher l'état avant la sauvegarde
+        self.after(self.POLL_MS, lambda: self._finish(self.main_window.unit_of_work.commit()))
+    
+    def _finish(self, success):
+        """
+        Ferme le dialogue, rafraîchit les frames et affiche le bilan
+        
+        Args:
+            success (bool): True si la sauvegarde a réussi
+        """
+        self.grab_release()
+        self.destroy()
+        self.main_window.refresh_data()
+        
+        lines = list(self._summary)
+        if self._cancelled.is_set():
+            lines.append("Import annulé : les lignes déjà ajoutées ont été conservées")
+        if not success:
+            messagebox.showerror("Erreur", "\n".join(lines + ["Erreur lors de la sauvegarde"]))
+        else:
+            messagebox.showinfo("Import terminé", "\n".join(lines) or "Aucun fichier importé")
+    
+    def _cancel(self):
+        """Demande l'arrêt de l'import (la sauvegarde finale a toujours lieu)"""
+        self._cancelled.set()
+        self.status_label.configure(text="Annulation...")
+    
+    @staticmethod
+    def _describe(path, result):
+        """
+        Résume l'import d'un fichier
+        
+        Args:
+            path (str): Chemin du fichier
+            result (ImportResult): Résultat de l'import
+        
+        Returns:
+            str: Ligne de bilan (avec les premières erreurs éventuelles)
+        """
+        text = (f"{os.path.basename(path)} : {result.rows} ligne(s), "
+                f"{result.added} ajoutée(s), "
+                f"{result.duplicates} doublon(s), {len(result.errors)} erreur(s)")
+        for line, message in result.errors[:5]:
+            text += f"\n  ligne {line} : {message}"
+        return text
@@ -5,33 +5,20 @@ Contient la sidebar, le header, le footer et la zone de contenu
 """
 
 import customtkinter as ctk
+from tkinter import filedialog, messagebox
 from typing import List
 from models.student import Student
 from models.subject import Subject
 from models.grade import Grade
+from services.repository import DataRepository
+from services.unit_of_work import UnitOfWork
+from services.stats_store import StatsStore
+from services.statistics import Statistics
 from gui.components.sidebar import Sidebar
 from gui.components.header import Header
 from gui.components.footer import Footer
-import json
-import os
-
-# #region agent log
-DEBUG_LOG_PATH = r"d:\Ecole\UCAC ICAM\PROJETS IMPORTANTS\student_grade_manager\.cursor\debug.log"
-def _debug_log(location, message, data, hypothesis_id=None):
-    try:
-        with open(DEBUG_LOG_PATH, 'a', encoding='utf-8') as f:
-            log_entry = {
-                "sessionId": "debug-session",
-                "runId": "run1",
-                "hypothesisId": hypothesis_id,
-                "location": location,
-                "message": message,
-                "data": data,
-                "timestamp": os.path.getmtime(DEBUG_LOG_PATH) * 1000 if os.path.exists(DEBUG_LOG_PATH) else 0
-            }
-            f.write(json.dumps(log_entry) + "\n")
-    except: pass
-# #endregion
+from gui.windows.import_dialog import ImportDialog
+from gui.task_runner import TaskRunner
 
 
 class MainWindow(ctk.CTk):
@@ -39,6 +26,17 @@ class MainWindow(ctk.CTk):
     Fenêtre principale avec layout complet
     """
     
+    # Collections affichées par chaque frame : une modification de l'une d'elles
+    # rend la frame obsolète, et elle n'est rafraîchie qu'une fois visible
+    FRAME_DEPENDENCIES = {
+        "dashboard": ("students", "subjects", "grades"),
+        "students": ("students",),
+        "subjects": ("subjects",),
+        "grades": ("students", "subjects", "grades"),
+        "consultation": ("subjects",),
+        "statistics": ("students", "subjects", "grades")
+    }
+    
     def __init__(self, app):
         """
         Initialise la fenêtre principale
@@ -51,14 +49,22 @@ class MainWindow(ctk.CTk):
         self.app = app
         self.file_manager = app.file_manager
         
-        # Données chargées
-        self.students: List[Student] = []
-        self.subjects: List[Subject] = []
-        self.grades: List[Grade] = []
+        # Données chargées (dépôt indexé partagé par toutes les frames)
+        self.repository = DataRepository()
+        self.unit_of_work = UnitOfWork(self.file_manager, self.repository)
+        self.stats_store = StatsStore(self.repository)
+        self._snapshot = None
+        self._snapshot_version = None
+        
+        # Calculs de statistiques exécutés hors du thread Tk
+        self.task_runner = TaskRunner(self)
         
         # Frames disponibles
         self.frames = {}
         self.current_frame = None
+        self.current_frame_name = None
+        self._stale_frames = set()
+        self.repository.add_listener(self._on_data_changed)
         
         # Configuration de la fenêtre
         self.title("GradeMaster - Academic Management System")
@@ -76,7 +82,9 @@ class MainWindow(ctk.CTk):
             self.sidebar.item_buttons["dashboard"].configure(fg_color=("#1F6AA5", "#1F6AA5"))
         self.sidebar.selected_item = "dashboard"
         
-        # Afficher le dashboard par défaut (après que tous les widgets soient créés)
+        # Dessiner d'abord la structure de la fenêtre (sidebar, header, footer),
+        # puis afficher le dashboard par défaut
+        self.update()
         self._show_frame("dashboard")
     
     def _center_window(self):
@@ -88,50 +96,53 @@ class MainWindow(ctk.CTk):
         y = (self.winfo_screenheight() // 2) - (height // 2)
         self.geometry(f'{width}x{height}+{x}+{y}')
     
+    @property
+    def students(self) -> List[Student]:
+        """Liste des étudiants (détenue par le dépôt)"""
+        return self.repository.students
+    
+    @property
+    def subjects(self) -> List[Subject]:
+        """Liste des matières (détenue par le dépôt)"""
+        return self.repository.subjects
+    
+    @property
+    def grades(self) -> List[Grade]:
+        """Liste des notes (détenue par le dépôt)"""
+        return self.repository.grades
+    
+    def get_statistics_snapshot(self) -> tuple:
+        """
+        Retourne un instantané des données pour les calculs du TaskRunner
+        
+        Les données sont copiées dans le thread Tk (Statistics.snapshot()) :
+        le thread de travail reconstruit ses propres objets avec
+        Statistics.from_snapshot() et ne lit jamais ceux du dépôt.
+        
+        Returns:
+            tuple: Instantané mémorisé, recopié seulement si la version a changé
+        """
+        if self._snapshot is None or self._snapshot_version != self.repository.version:
+            self._snapshot = Statistics.snapshot(self.students, self.subjects, self.grades)
+            self._snapshot_version = self.repository.version
+        return self._snapshot
+    
     def _load_data(self):
         """Charge toutes les données depuis les fichiers JSON"""
         # Charger les étudiants
         students_data = self.file_manager.load_students()
-        self.students = [Student.from_dict(s) for s in students_data]
+        students = Student.from_dicts(students_data)
         
         # Charger les matières
         subjects_data = self.file_manager.load_subjects()
-        self.subjects = [Subject.from_dict(s) for s in subjects_data]
+        subjects = Subject.from_dicts(subjects_data)
         
         # Charger les notes
         grades_data = self.file_manager.load_grades()
-        self.grades = [Grade.from_dict(g) for g in grades_data]
-    
-    def _save_data(self):
-        """Sauvegarde toutes les données dans les fichiers JSON"""
-        # #region agent log
-        _debug_log("main_window.py:_save_data:entry", "_save_data() called", {"students_count": len(self.students)}, "C")
-        # #endregion
-        
-        # Sauvegarder les étudiants
-        students_data = [s.to_dict() for s in self.students]
+        grades = Grade.from_dicts(grades_data)
         
-        # #region agent log
-        _debug_log("main_window.py:_save_data:before_save", "Before save_students()", {"students_data_count": len(students_data), "first_student": students_data[0] if students_data else None}, "C")
-        # #endregion
-        
-        result = self.file_manager.save_students(students_data)
-        
-        # #region agent log
-        _debug_log("main_window.py:_save_data:after_save", "After save_students()", {"save_result": result}, "C")
-        # #endregion
-        
-        # Sauvegarder les matières
-        subjects_data = [s.to_dict() for s in self.subjects]
-        self.file_manager.save_subjects(subjects_data)
-        
-        # Sauvegarder les notes
-        grades_data = [g.to_dict() for g in self.grades]
-        self.file_manager.save_grades(grades_data)
-        
-        # #region agent log
-        _debug_log("main_window.py:_save_data:exit", "_save_data() completed", {}, "C")
-        # #endregion
+        # Indexer les données
+        self.repository.load(students, subjects, grades)
     
     def _create_widgets(self):
         """Crée les widgets de la fenêtre principale"""
@@ -174,17 +185,22 @@ class MainWindow(ctk.CTk):
     
     def _show_frame(self, frame_name: str):
         """Affiche une frame spécifique"""
-        # Cacher la frame actuelle
+        # Cacher la frame actuelle ; ses calculs en cours sont abandonnés et
+        # relancés par refresh() à son prochain affichage
         if self.current_frame:
             self.current_frame.pack_forget()
+            if self.task_runner.cancel_group(f"{self.current_frame_name}."):
+                self._stale_frames.add(self.current_frame_name)
         
         # Créer la frame si elle n'existe pas
         if frame_name not in self.frames:
             self._create_frame(frame_name)
         
-        # Afficher la nouvelle frame
+        # Afficher la nouvelle frame (rafraîchie si les données ont changé entre-temps)
         if frame_name in self.frames:
+            self._refresh_if_stale(frame_name)
             self.current_frame = self.frames[frame_name]
+            self.current_frame_name = frame_name
             self.current_frame.pack(fill="both", expand=True)
     
     def _create_frame(self, frame_name: str):
@@ -209,12 +225,16 @@ class MainWindow(ctk.CTk):
             self.frames[frame_name] = StatisticsFrame(self.content_frame, self)
     
     def _on_import_data(self):
-        """Gère l'action Import Data"""
-        # Recharger les données
-        self._load_data()
-        # Rafraîchir la frame actuelle
-        if self.current_frame and hasattr(self.current_frame, 'refresh'):
-            self.current_frame.refresh()
+        """Gère l'action Import Data : import en masse de fichiers CSV/TSV"""
+        paths = filedialog.askopenfilenames(
+            parent=self,
+            title="Importer des étudiants, matières ou notes",
+            filetypes=[("Fichiers CSV/TSV", "*.csv *.tsv *.txt"), ("Tous les fichiers", "*.*")]
+        )
+        if not paths:
+            return
+        # La lecture et la sauvegarde se font hors du thread Tk
+        ImportDialog(self, list(paths))
     
     def _on_new_entry(self):
         """Gère l'action New Entry"""
@@ -223,14 +243,47 @@ class MainWindow(ctk.CTk):
             if hasattr(self.current_frame, 'show_add_dialog'):
                 self.current_frame.show_add_dialog()
     
+    def _on_data_changed(self, action, entity):
+        """Marque comme obsolètes les frames qui affichent la collection modifiée"""
+        if isinstance(entity, Student):
+            changed = {"students"}
+        elif isinstance(entity, Subject):
+            changed = {"subjects"}
+        elif isinstance(entity, Grade):
+            changed = {"grades"}
+        else:
+            # Rechargement complet
+            changed = {"students", "subjects", "grades"}
+        
+        for frame_name in self.frames:
+            if changed.intersection(self.FRAME_DEPENDENCIES.get(frame_name, changed)):
+                self._stale_frames.add(frame_name)
+    
+    def _refresh_if_stale(self, frame_name: str):
+        """Rafraîchit une frame si elle a été marquée obsolète"""
+        if frame_name not in self._stale_frames:
+            return
+        self._stale_frames.discard(frame_name)
+        frame = self.frames[frame_name]
+        if hasattr(frame, 'refresh'):
+            frame.refresh()
+    
     def refresh_data(self):
-        """Rafraîchit les données et sauvegarde"""
-        self._save_data()
-        self._load_data()
-        # Rafraîchir toutes les frames
-        for frame in self.frames.values():
-            if hasattr(frame, 'refresh'):
-                frame.refresh()
+        """Sauvegarde les modifications en attente et rafraîchit la frame visible"""
+        # Seules les entités modifiées via le dépôt sont écrites ; les objets
+        # en mémoire sont déjà à jour, aucun rechargement n'est nécessaire
+        if not self.unit_of_work.commit():
+            messagebox.showerror("Erreur", "Erreur lors de la sauvegarde des données.\n"
+                                 "Les modifications non enregistrées seront retentées à la prochaine sauvegarde.")
+        # Les frames cachées ne seront rafraîchies qu'à leur prochain affichage
+        for frame_name, frame in self.frames.items():
+            if frame is self.current_frame:
+                self._refresh_if_stale(frame_name)
+    
+    def destroy(self):
+        """Arrête les calculs en cours puis ferme la fenêtre"""
+        self.task_runner.shutdown()
+        super().destroy()
     
     def _update_all_texts(self):
         """Met à jour tous les textes de l'interface lors du changement de langue"""
@@ -5,7 +5,7 @@ Gère l'authentification et lance l'application
 """
 
 import sys
-from services.file_manager import FileManager
+from services.file_manager import FileManager, create_file_manager
 from services.menu import Menu
 from services.i18n import get_i18n
 
@@ -64,9 +64,14 @@ def main():
     """
     Fonction principale du programme
     """
+    # Avec des arguments, exécuter la ligne de commande sans interaction
+    if len(sys.argv) > 1:
+        from cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    
     try:
         # Initialiser le gestionnaire de fichiers
-        file_manager = FileManager()
+        file_manager = create_file_manager()
         
         # Charger la configuration et initialiser le gestionnaire de traductions
         config = file_manager.load_config()
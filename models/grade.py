@@ -3,6 +3,7 @@
 Module contenant la classe Grade pour représenter une note
 """
 
+import sys
 from datetime import datetime
 
 
@@ -17,6 +18,9 @@ class Grade:
         date (str): Date de saisie de la note (format YYYY-MM-DD)
     """
     
+    # Pas de __dict__ par instance ; matricule et code sont internés
+    __slots__ = ('matricule_etudiant', 'code_matiere', 'note', 'date')
+    
     def __init__(self, matricule_etudiant, code_matiere, note, date=None):
         """
         Constructeur de la classe Grade
@@ -27,8 +31,8 @@ class Grade:
             note (float): Note obtenue (doit être entre 0 et 20)
             date (str, optional): Date de saisie. Si None, utilise la date actuelle
         """
-        self.matricule_etudiant = matricule_etudiant.strip()
-        self.code_matiere = code_matiere.strip()
+        self.matricule_etudiant = sys.intern(matricule_etudiant.strip())
+        self.code_matiere = sys.intern(code_matiere.strip())
         self.note = float(note)
         
         # Si aucune date n'est fournie, utiliser la date actuelle
@@ -87,6 +91,42 @@ class Grade:
             date=data.get('date', None)
         )
     
+    @staticmethod
+    def from_dicts(data):
+        """
+        Crée des objets Grade en masse à partir de dictionnaires de confiance
+        
+        Destiné aux fichiers écrits par l'application : les valeurs ne sont
+        ni nettoyées (strip) ni validées. Matricules, codes et dates se
+        répètent d'une note à l'autre et sont donc internés.
+        
+        Args:
+            data (list): Dictionnaires contenant les données des notes
+        
+        Returns:
+            list: Liste de Grade
+        """
+        intern = sys.intern
+        # Cache local devant sys.intern : une seule recherche par valeur répétée
+        strings = {}
+        today = None
+        grades = []
+        for item in data:
+            grade = Grade.__new__(Grade)
+            value = item.get('matricule_etudiant', '')
+            grade.matricule_etudiant = strings.get(value) or strings.setdefault(value, intern(value))
+            value = item.get('code_matiere', '')
+            grade.code_matiere = strings.get(value) or strings.setdefault(value, intern(value))
+            grade.note = float(item.get('note', 0.0))
+            value = item.get('date', None)
+            if value is None:
+                if today is None:
+                    today = datetime.now().strftime('%Y-%m-%d')
+                value = today
+            grade.date = strings.get(value) or strings.setdefault(value, value)
+            grades.append(grade)
+        return grades
+    
     def validate(self):
         """
         Valide que la note est dans la plage autorisée (0-20)
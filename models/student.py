@@ -3,6 +3,8 @@
 Module contenant la classe Student pour représenter un étudiant
 """
 
+import sys
+
 
 class Student:
     """
@@ -15,6 +17,9 @@ class Student:
         niveau (str): Niveau/classe de l'étudiant (ex: L1, L2, L3)
     """
     
+    # Pas de __dict__ par instance ; matricule et niveau sont internés
+    __slots__ = ('nom', 'prenom', 'matricule', 'niveau')
+    
     def __init__(self, nom, prenom, matricule, niveau):
         """
         Constructeur de la classe Student
@@ -27,8 +32,8 @@ class Student:
         """
         self.nom = nom.strip()
         self.prenom = prenom.strip()
-        self.matricule = matricule.strip()
-        self.niveau = niveau.strip()
+        self.matricule = sys.intern(matricule.strip())
+        self.niveau = sys.intern(niveau.strip())
     
     def __str__(self):
         """
@@ -80,6 +85,31 @@ class Student:
             niveau=data.get('niveau', '')
         )
     
+    @staticmethod
+    def from_dicts(data):
+        """
+        Crée des objets Student en masse à partir de dictionnaires de confiance
+        
+        Destiné aux fichiers écrits par l'application : les valeurs ne sont
+        ni nettoyées (strip) ni validées, matricule et niveau sont internés.
+        
+        Args:
+            data (list): Dictionnaires contenant les données des étudiants
+        
+        Returns:
+            list: Liste de Student
+        """
+        intern = sys.intern
+        students = []
+        for item in data:
+            student = Student.__new__(Student)
+            student.nom = item.get('nom', '')
+            student.prenom = item.get('prenom', '')
+            student.matricule = intern(item.get('matricule', ''))
+            student.niveau = intern(item.get('niveau', ''))
+            students.append(student)
+        return students
+    
     def validate(self):
         """
         Valide que tous les champs requis sont remplis
@@ -3,6 +3,8 @@
 Module contenant la classe Subject pour représenter une matière
 """
 
+import sys
+
 
 class Subject:
     """
@@ -15,6 +17,9 @@ class Subject:
         niveau (str): Niveau/classe concerné par cette matière
     """
     
+    # Pas de __dict__ par instance ; code et niveau sont internés
+    __slots__ = ('nom', 'code', 'coefficient', 'niveau')
+    
     def __init__(self, nom, code, coefficient, niveau):
         """
         Constructeur de la classe Subject
@@ -26,9 +31,9 @@ class Subject:
             niveau (str): Niveau/classe concerné
         """
         self.nom = nom.strip()
-        self.code = code.strip()
+        self.code = sys.intern(code.strip())
         self.coefficient = float(coefficient)
-        self.niveau = niveau.strip()
+        self.niveau = sys.intern(niveau.strip())
     
     def __str__(self):
         """
@@ -80,6 +85,31 @@ class Subject:
             niveau=data.get('niveau', '')
         )
     
+    @staticmethod
+    def from_dicts(data):
+        """
+        Crée des objets Subject en masse à partir de dictionnaires de confiance
+        
+        Destiné aux fichiers écrits par l'application : les valeurs ne sont
+        ni nettoyées (strip) ni validées, code et niveau sont internés.
+        
+        Args:
+            data (list): Dictionnaires contenant les données des matières
+        
+        Returns:
+            list: Liste de Subject
+        """
+        intern = sys.intern
+        subjects = []
+        for item in data:
+            subject = Subject.__new__(Subject)
+            subject.nom = item.get('nom', '')
+            subject.code = intern(item.get('code', ''))
+            subject.coefficient = float(item.get('coefficient', 1.0))
+            subject.niveau = intern(item.get('niveau', ''))
+            subjects.append(subject)
+        return subjects
+    
     def validate(self):
         """
         Valide que tous les champs requis sont remplis et corrects
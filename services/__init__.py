@@ -1,3 +1,3 @@
 # Module services - Contient les services métier du système
-# Services : file_manager, menu, statistics
+# Services : file_manager, menu, statistics, aggregation, repository, unit_of_work, stats_store, vectorized_aggregation, ranking_index, bulletins, bulk_import, logger
 
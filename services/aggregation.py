@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Module d'agrégation des statistiques académiques
+Calcule en un seul passage sur les notes toutes les moyennes, classements et rangs
+"""
+
+from typing import List, Dict, Tuple, Optional
+from models.student import Student
+from models.subject import Subject
+from models.grade import Grade
+
+
+class Aggregates:
+    """
+    Résultat d'un passage d'agrégation sur l'ensemble des données
+    
+    Attributs:
+        student_averages (Dict[str, float]): Moyenne pondérée par matricule
+        student_ranks (Dict[str, int]): Rang de chaque étudiant dans sa classe
+        class_averages (Dict[str, float]): Moyenne de chaque classe
+        class_rankings (Dict[str, List[Tuple[Student, float, int]]]): Classement par niveau
+        subject_averages (Dict[str, float]): Moyenne de chaque matière
+        subject_best (Dict[str, Tuple[Student, float]]): Meilleur étudiant par matière
+        global_average (Optional[float]): Moyenne générale de l'établissement
+        best_student_global (Optional[Tuple[Student, float]]): Meilleur étudiant global
+    """
+    
+    def __init__(self):
+        """Initialise un résultat d'agrégation vide"""
+        self.student_averages: Dict[str, float] = {}
+        self.student_ranks: Dict[str, int] = {}
+        self.class_averages: Dict[str, float] = {}
+        self.class_rankings: Dict[str, List[Tuple[Student, float, int]]] = {}
+        self.subject_averages: Dict[str, float] = {}
+        self.subject_best: Dict[str, Tuple[Student, float]] = {}
+        self.global_average: Optional[float] = None
+        self.best_student_global: Optional[Tuple[Student, float]] = None
+
+
+def aggregate(students: List[Student], subjects: List[Subject], grades: List[Grade],
+              repository=None) -> Aggregates:
+    """
+    Calcule toutes les statistiques en un seul passage sur les notes
+    
+    Les résultats sont identiques à ceux des calculs individuels de Statistics :
+    seules les notes d'une matière du niveau de l'étudiant comptent dans sa moyenne,
+    et les égalités conservent l'ordre de la liste des étudiants.
+    
+    Args:
+        students (List[Student]): Liste des étudiants
+        subjects (List[Subject]): Liste des matières
+        grades (List[Grade]): Liste des notes
+        repository (DataRepository, optional): Dépôt indexé fournissant les
+            recherches par matricule et par code. Sinon, des index temporaires sont construits
+    
+    Returns:
+        Aggregates: Résultat de l'agrégation
+    """
+    result = Aggregates()
+    
+    if repository is not None:
+        get_student = repository.get_student
+        get_subject = repository.get_subject
+    else:
+        # Index par clé (le premier élément rencontré l'emporte, comme une recherche linéaire)
+        students_by_matricule: Dict[str, Student] = {}
+        for student in students:
+            students_by_matricule.setdefault(student.matricule, student)
+        subjects_by_code: Dict[str, Subject] = {}
+        for subject in subjects:
+            subjects_by_code.setdefault(subject.code, subject)
+        get_student = students_by_matricule.get
+        get_subject = subjects_by_code.get
+    
+    # ========== PASSAGE UNIQUE SUR LES NOTES ==========
+    
+    points: Dict[str, float] = {}
+    coefficients: Dict[str, float] = {}
+    subject_totals: Dict[str, float] = {}
+    subject_counts: Dict[str, int] = {}
+    subject_best_grades: Dict[str, Grade] = {}
+    global_total = 0.0
+    
+    for grade in grades:
+        matricule = grade.matricule_etudiant
+        code = grade.code_matiere
+        note = grade.note
+        
+        global_total += note
+        subject_totals[code] = subject_totals.get(code, 0.0) + note
+        subject_counts[code] = subject_counts.get(code, 0) + 1
+        best = subject_best_grades.get(code)
+        if best is None or note > best.note:
+            subject_best_grades[code] = grade
+        
+        student = get_student(matricule)
+        subject = get_subject(code)
+        if student and subject and subject.niveau == student.niveau:
+            points[matricule] = points.get(matricule, 0.0) + note * subject.coefficient
+            coefficients[matricule] = coefficients.get(matricule, 0.0) + subject.coefficient
+    
+    # ========== MOYENNES PAR ÉTUDIANT ==========
+    
+    for matricule, total_coefficients in coefficients.items():
+        if total_coefficients != 0:
+            result.student_averages[matricule] = points[matricule] / total_coefficients
+    
+    # ========== CLASSES ET CLASSEMENTS ==========
+    
+    class_members: Dict[str, List[Tuple[Student, float]]] = {}
+    best_average = -1.0
+    for student in students:
+        members = class_members.setdefault(student.niveau, [])
+        avg = result.student_averages.get(student.matricule)
+        if avg is None:
+            continue
+        members.append((student, avg))
+        if avg > best_average:
+            best_average = avg
+            result.best_student_global = (student, avg)
+    
+    for niveau, members in class_members.items():
+        if members:
+            result.class_averages[niveau] = sum(avg for _, avg in members) / len(members)
+        
+        # Le tri est stable : les égalités conservent l'ordre des étudiants
+        ordered = sorted(members, key=lambda x: x[1], reverse=True)
+        ranking = [(student, avg, rank) for rank, (student, avg) in enumerate(ordered, start=1)]
+        result.class_rankings[niveau] = ranking
+        
+        for student, _, rank in ranking:
+            if get_student(student.matricule) is student:
+                result.student_ranks.setdefault(student.matricule, rank)
+    
+    # ========== MATIÈRES ET GLOBAL ==========
+    
+    for code, total in subject_totals.items():
+        result.subject_averages[code] = total / subject_counts[code]
+        best_student = get_student(subject_best_grades[code].matricule_etudiant)
+        if best_student:
+            result.subject_best[code] = (best_student, subject_best_grades[code].note)
+    
+    if grades:
+        result.global_average = global_total / len(grades)
+    
+    return result
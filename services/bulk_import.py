@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+"""
+Module d'import en masse de fichiers CSV/TSV
+Lit les lignes au fil de l'eau, les valide par lots et détecte les doublons
+"""
+
+import csv
+import os
+from typing import List, Dict, Tuple, Optional, Callable, Iterator, Iterable
+from models.student import Student
+from models.subject import Subject
+from models.grade import Grade
+from services.repository import DataRepository
+from services.unit_of_work import UnitOfWork
+
+# Colonnes obligatoires de chaque collection (la date des notes est facultative)
+COLUMNS = {
+    'students': ('nom', 'prenom', 'matricule', 'niveau'),
+    'subjects': ('nom', 'code', 'coefficient', 'niveau'),
+    'grades': ('matricule_etudiant', 'code_matiere', 'note')
+}
+
+# Nombre de lignes validées par lot (et entre deux signalements d'avancement)
+BATCH_SIZE = 5000
+
+
+class ImportResult:
+    """
+    Résultat de la lecture d'un fichier d'import
+    
+    Attributs:
+        collection (str): 'students', 'subjects' ou 'grades'
+        entities (list): Entités valides, dans l'ordre du fichier
+        errors (List[Tuple[int, str]]): (numéro de ligne, message) des lignes rejetées
+        duplicates (int): Nombre de lignes ignorées car déjà présentes
+        rows (int): Nombre de lignes lues
+        added (int): Nombre d'entités ajoutées au dépôt
+    """
+    
+    def __init__(self, collection: str):
+        """
+        Initialise un résultat vide
+        
+        Args:
+            collection (str): Collection importée
+        """
+        self.collection = collection
+        self.entities: list = []
+        self.errors: List[Tuple[int, str]] = []
+        self.duplicates = 0
+        self.rows = 0
+        self.added = 0
+
+
+class ExistingKeys:
+    """
+    Clés déjà présentes dans le dépôt, copiées au moment de la création
+    
+    La copie est faite dans le thread qui possède le dépôt ; elle peut ensuite
+    être lue depuis un thread de travail sans jamais consulter le dépôt.
+    """
+    
+    def __init__(self, repository: DataRepository):
+        """
+        Copie les clés des étudiants, matières et notes du dépôt
+        
+        Args:
+            repository (DataRepository): Dépôt à copier
+        """
+        self.matricules = frozenset(student.matricule for student in repository.students)
+        self.codes = frozenset(subject.code for subject in repository.subjects)
+        self.grades = frozenset((grade.matricule_etudiant, grade.code_matiere) for grade in repository.grades)
+    
+    def contains(self, entity) -> bool:
+        """
+        Indique si une entité de même clé existait dans le dépôt
+        
+        Args:
+            entity: Étudiant, matière ou note
+        
+        Returns:
+            bool: True si la clé est déjà présente
+        """
+        if isinstance(entity, Student):
+            return entity.matricule in self.matricules
+        if isinstance(entity, Subject):
+            return entity.code in self.codes
+        return (entity.matricule_etudiant, entity.code_matiere) in self.grades
+
+
+# ========== LECTURE ==========
+
+def detect_delimiter(path: str, first_line: str) -> str:
+    """
+    Détermine le séparateur d'un fichier
+    
+    Args:
+        path (str): Chemin du fichier (.tsv ou .tab impose la tabulation)
+        first_line (str): Ligne d'en-tête
+    
+    Returns:
+        str: Séparateur (tabulation, point-virgule ou virgule)
+    """
+    if os.path.splitext(path)[1].lower() in ('.tsv', '.tab'):
+        return '\t'
+    return max(('\t', ';', ','), key=first_line.count)
+
+
+def read_rows(path: str, progress: Optional[Callable[[float], None]] = None
+              ) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """
+    Lit un fichier CSV/TSV ligne par ligne
+    
+    Args:
+        path (str): Chemin du fichier
+        progress (Callable, optional): Reçoit la fraction du fichier déjà lue (0 à 1)
+    
+    Returns:
+        Iterator[Tuple[int, Dict[str, str]]]: (numéro de ligne, valeurs par colonne),
+            la première valeur produite étant (1, en-tête) avec les noms de colonnes
+    """
+    size = os.path.getsize(path) or 1
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        first_line = f.readline()
+        delimiter = detect_delimiter(path, first_line)
+        fieldnames = [name.strip() for name in next(csv.reader([first_line], delimiter=delimiter), [])]
+        yield 1, {name: name for name in fieldnames}
+        
+        consumed = len(first_line)
+        
+        def lines():
+            nonlocal consumed
+            for line in f:
+                consumed += len(line)
+                yield line
+        
+        reader = csv.DictReader(lines(), fieldnames=fieldnames, delimiter=delimiter)
+        for row in reader:
+            yield reader.line_num + 1, row
+            if progress and reader.line_num % BATCH_SIZE == 0:
+                progress(min(consumed / size, 1.0))
+
+
+def iter_batches(items: Iterable, size: int = BATCH_SIZE) -> Iterator[list]:
+    """
+    Regroupe les éléments d'un itérable en lots
+    
+    Args:
+        items (Iterable): Éléments à regrouper
+        size (int): Taille maximale d'un lot
+    
+    Returns:
+        Iterator[list]: Lots successifs
+    """
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def detect_collection(fieldnames: Iterable[str]) -> Optional[str]:
+    """
+    Reconnaît la collection d'un fichier d'après ses colonnes
+    
+    Args:
+        fieldnames (Iterable[str]): Noms des colonnes
+    
+    Returns:
+        Optional[str]: Collection reconnue ou None
+    """
+    names = set(fieldnames)
+    for collection, columns in COLUMNS.items():
+        if names.issuperset(columns):
+            return collection
+    return None
+
+
+def file_collection(path: str) -> Optional[str]:
+    """
+    Reconnaît la collection d'un fichier en ne lisant que son en-tête
+    
+    Args:
+        path (str): Chemin du fichier CSV/TSV
+    
+    Returns:
+        Optional[str]: Collection reconnue ou None (fichier illisible ou non reconnu)
+    """
+    try:
+        _, header = next(read_rows(path), (1, {}))
+    except (OSError, UnicodeDecodeError, csv.Error):
+        return None
+    return detect_collection(header)
+
+
+# ========== VALIDATION ==========
+
+def _build(collection: str, row: Dict[str, str]):
+    """
+    Crée l'entité correspondant à une ligne
+    
+    Args:
+        collection (str): Collection importée
+        row (Dict[str, str]): Valeurs de la ligne
+    
+    Returns:
+        Student, Subject ou Grade
+    
+    Raises:
+        ValueError: Si une valeur numérique est invalide
+    """
+    def value(name):
+        return (row.get(name) or '').strip()
+    
+    if collection == 'students':
+        return Student(value('nom'), value('prenom'), value('matricule'), value('niveau'))
+    if collection == 'subjects':
+        return Subject(value('nom'), value('code'), float(value('coefficient').replace(',', '.')),
+                       value('niveau'))
+    return Grade(value('matricule_etudiant'), value('code_matiere'),
+                 float(value('note').replace(',', '.')), value('date') or None)
+
+
+def _key(entity) -> tuple:
+    """Retourne la clé d'unicité d'une entité"""
+    if isinstance(entity, Student):
+        return (entity.matricule,)
+    if isinstance(entity, Subject):
+        return (entity.code,)
+    return (entity.matricule_etudiant, entity.code_matiere)
+
+
+def _exists(repository: DataRepository, entity) -> bool:
+    """Indique si une entité de même clé est déjà dans le dépôt"""
+    if isinstance(entity, Student):
+        return repository.get_student(entity.matricule) is not None
+    if isinstance(entity, Subject):
+        return repository.get_subject(entity.code) is not None
+    return repository.get_grade(entity.matricule_etudiant, entity.code_matiere) is not None
+
+
+def _validate_batch(collection: str, batch: List[Tuple[int, Dict[str, str]]],
+                    existing: ExistingKeys, seen: set, result: ImportResult):
+    """
+    Valide un lot de lignes et ajoute les entités retenues au résultat
+    
+    Args:
+        collection (str): Collection importée
+        batch (List[Tuple[int, Dict[str, str]]]): Lignes du lot
+        existing (ExistingKeys): Clés du dépôt utilisées pour les doublons et les références
+        seen (set): Clés déjà rencontrées dans le fichier
+        result (ImportResult): Résultat complété
+    """
+    for line, row in batch:
+        try:
+            entity = _build(collection, row)
+        except ValueError:
+            result.errors.append((line, "Valeur numérique invalide"))
+            continue
+        
+        is_valid, error_msg = entity.validate()
+        if not is_valid:
+            result.errors.append((line, error_msg))
+            continue
+        
+        key = _key(entity)
+        if key in seen or existing.contains(entity):
+            result.duplicates += 1
+            continue
+        
+        if collection == 'grades':
+            if entity.matricule_etudiant not in existing.matricules:
+                result.errors.append((line, f"Étudiant inconnu : {entity.matricule_etudiant}"))
+                continue
+            if entity.code_matiere not in existing.codes:
+                result.errors.append((line, f"Matière inconnue : {entity.code_matiere}"))
+                continue
+        
+        seen.add(key)
+        result.entities.append(entity)
+
+
+def parse_file(path: str, existing: ExistingKeys,
+               progress: Optional[Callable[[float], None]] = None,
+               is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[ImportResult]:
+    """
+    Lit et valide un fichier d'import sans consulter le dépôt
+    
+    Peut s'exécuter dans un thread de travail : seules les clés copiées
+    dans existing sont lues.
+    
+    Args:
+        path (str): Chemin du fichier CSV/TSV
+        existing (ExistingKeys): Clés du dépôt utilisées pour les doublons et les références
+        progress (Callable, optional): Reçoit la fraction du fichier déjà lue (0 à 1)
+        is_cancelled (Callable, optional): Retourne True pour interrompre la lecture
+    
+    Returns:
+        Optional[ImportResult]: Résultat de la lecture, ou None si le fichier est
+            illisible, non reconnu ou si l'import a été annulé
+    """
+    try:
+        rows = read_rows(path, progress)
+        _, header = next(rows, (1, {}))
+        collection = detect_collection(header)
+        if collection is None:
+            print(f"Erreur: colonnes non reconnues dans {path}")
+            return None
+        
+        result = ImportResult(collection)
+        seen = set()
+        for batch in iter_batches(rows):
+            if is_cancelled and is_cancelled():
+                return None
+            result.rows += len(batch)
+            _validate_batch(collection, batch, existing, seen, result)
+        if progress:
+            progress(1.0)
+        return result
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        print(f"Erreur lors de la lecture de {path}: {e}")
+        return None
+
+
+# ========== APPLICATION ==========
+
+def apply_batch(result: ImportResult, repository: DataRepository, start: int, size: int = BATCH_SIZE) -> int:
+    """
+    Ajoute au dépôt une partie des entités d'un import
+    
+    Les doublons sont vérifiés à nouveau, le dépôt ayant pu changer depuis la lecture.
+    
+    Args:
+        result (ImportResult): Résultat de parse_file()
+        repository (DataRepository): Dépôt à compléter
+        start (int): Position de la première entité à ajouter
+        size (int): Nombre maximal d'entités à ajouter
+    
+    Returns:
+        int: Position de la prochaine entité à ajouter
+    """
+    add = getattr(repository, f'add_{result.collection[:-1]}')
+    end = min(start + size, len(result.entities))
+    for entity in result.entities[start:end]:
+        if _exists(repository, entity):
+            result.duplicates += 1
+            continue
+        add(entity)
+        result.added += 1
+    return end
+
+
+def apply_import(result: ImportResult, repository: DataRepository,
+                 unit_of_work: Optional[UnitOfWork] = None) -> bool:
+    """
+    Ajoute toutes les entités d'un import puis sauvegarde une seule fois
+    
+    Args:
+        result (ImportResult): Résultat de parse_file()
+        repository (DataRepository): Dépôt à compléter
+        unit_of_work (UnitOfWork, optional): Unité de travail utilisée pour la
+            sauvegarde. Si None, rien n'est sauvegardé (l'appelant s'en charge)
+    
+    Returns:
+        bool: True si la sauvegarde a réussi (ou n'a pas été demandée)
+    """
+    position = 0
+    while position < len(result.entities):
+        position = apply_batch(result, repository, position)
+    if unit_of_work is None:
+        return True
+    return unit_of_work.commit()
+
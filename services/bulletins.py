@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+Module de génération des bulletins en lot
+Produit les bulletins d'une classe ou de tout l'établissement en fichiers texte ou HTML
+"""
+
+import os
+import re
+import html
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from services.statistics import Statistics
+
+# Formats de sortie disponibles et extension des fichiers
+FORMATS = {'text': 'txt', 'html': 'html'}
+
+# Nombre de bulletins rendus par tâche envoyée à un processus
+BATCH_SIZE = 200
+
+# Libellés utilisés si l'appelant n'en fournit pas (mêmes clés que consultation.bulletin)
+DEFAULT_LABELS = {
+    'header': "BULLETIN DE NOTES",
+    'student': "Étudiant: {name}",
+    'matricule_label': "Matricule: {matricule}",
+    'level_label': "Niveau: {level}",
+    'subject': "Matière",
+    'note': "Note",
+    'coef': "Coef",
+    'points': "Points",
+    'average': "Moyenne générale: {average:.2f}/20",
+    'rank': "Rang dans la classe: {rank}{suffix}",
+    'rank_1': "er",
+    'rank_other': "ème",
+    'no_grades': "Aucune note enregistrée"
+}
+
+
+class ExportResult:
+    """
+    Résultat d'un export de bulletins
+    
+    Attributs:
+        paths (List[str]): Chemins des fichiers écrits, dans l'ordre des étudiants
+        total (int): Nombre de bulletins à exporter
+        error (str): Message de la première erreur d'écriture, ou None
+    """
+    
+    def __init__(self, total: int = 0):
+        """
+        Initialise un résultat vide
+        
+        Args:
+            total (int): Nombre de bulletins à exporter
+        """
+        self.paths: List[str] = []
+        self.total = total
+        self.error: Optional[str] = None
+
+
+def build_bulletins(statistics: Statistics, niveau: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Prépare les données de tous les bulletins à partir d'une seule agrégation
+    
+    Args:
+        statistics (Statistics): Calculateur de statistiques (agrégats calculés une fois)
+        niveau (str, optional): Niveau/classe à traiter. Si None, tout l'établissement
+    
+    Returns:
+        List[Dict[str, Any]]: Un dictionnaire par étudiant (données simples, transmissibles
+            à un autre processus)
+    """
+    repository = statistics.repository
+    ranks = statistics.aggregates.student_ranks
+    students = repository.get_students_by_niveau(niveau) if niveau else statistics.students
+    
+    subjects_by_niveau: Dict[str, list] = {}
+    for subject in statistics.subjects:
+        subjects_by_niveau.setdefault(subject.niveau, []).append(subject)
+    
+    bulletins = []
+    seen = set()
+    for student in students:
+        # Un seul bulletin par matricule, celui de l'étudiant de référence
+        if student.matricule in seen:
+            continue
+        seen.add(student.matricule)
+        student = repository.get_student(student.matricule)
+        
+        rows = []
+        total_points = 0.0
+        total_coefficients = 0.0
+        for subject in subjects_by_niveau.get(student.niveau, []):
+            grade = repository.get_grade(student.matricule, subject.code)
+            if grade:
+                points = grade.note * subject.coefficient
+                total_points += points
+                total_coefficients += subject.coefficient
+                rows.append((subject.nom, grade.note, subject.coefficient, points))
+            else:
+                rows.append((subject.nom, None, subject.coefficient, None))
+        
+        bulletins.append({
+            'name': f"{student.prenom} {student.nom.upper()}",
+            'matricule': student.matricule,
+            'niveau': student.niveau,
+            'rows': rows,
+            'average': total_points / total_coefficients if total_coefficients > 0 else None,
+            'rank': ranks.get(student.matricule)
+        })
+    return bulletins
+
+
+def translated_labels(i18n) -> Dict[str, str]:
+    """
+    Retourne les libellés des bulletins dans la langue courante
+    
+    Args:
+        i18n (TranslationManager): Gestionnaire de traductions
+    
+    Returns:
+        Dict[str, str]: Libellés lus dans consultation.bulletin
+    """
+    labels = {}
+    for key in DEFAULT_LABELS:
+        if key in ('subject', 'note', 'coef', 'points'):
+            labels[key] = i18n.get(f'consultation.bulletin.columns.{key}')
+        else:
+            labels[key] = i18n.get(f'consultation.bulletin.{key}')
+    return labels
+
+
+# ========== RENDU ==========
+
+def render_text(bulletin: Dict[str, Any], labels: Dict[str, str]) -> str:
+    """
+    Rend un bulletin au format texte (même présentation que la console)
+    
+    Args:
+        bulletin (Dict[str, Any]): Données préparées par build_bulletins()
+        labels (Dict[str, str]): Libellés traduits
+    
+    Returns:
+        str: Bulletin en texte
+    """
+    lines = [
+        "=" * 60,
+        f"  {labels['header']}",
+        "=" * 60,
+        "",
+        labels['student'].format(name=bulletin['name']),
+        labels['matricule_label'].format(matricule=bulletin['matricule']),
+        labels['level_label'].format(level=bulletin['niveau']),
+        "",
+        "=" * 60,
+        f"{labels['subject']:<30} {labels['note']:<10} {labels['coef']:<10} {labels['points']:<10}",
+        "=" * 60
+    ]
+    for nom, note, coefficient, points in bulletin['rows']:
+        if note is None:
+            lines.append(f"{nom:<30} {'-':<10} {coefficient:<10.2f} {'-':<10}")
+        else:
+            lines.append(f"{nom:<30} {note:<10.2f} {coefficient:<10.2f} {points:<10.2f}")
+    lines.append("=" * 60)
+    
+    if bulletin['average'] is not None:
+        lines.append("")
+        lines.append(labels['average'].format(average=bulletin['average']))
+        rank = bulletin['rank']
+        if rank:
+            suffix = labels['rank_1'] if rank == 1 else labels['rank_other']
+            lines.append(labels['rank'].format(rank=rank, suffix=suffix))
+    else:
+        lines.append("")
+        lines.append(labels['no_grades'])
+    lines.append("=" * 60)
+    return "\n".join(lines) + "\n"
+
+
+def render_html(bulletin: Dict[str, Any], labels: Dict[str, str]) -> str:
+    """
+    Rend un bulletin au format HTML
+    
+    Args:
+        bulletin (Dict[str, Any]): Données préparées par build_bulletins()
+        labels (Dict[str, str]): Libellés traduits
+    
+    Returns:
+        str: Page HTML du bulletin
+    """
+    escape = html.escape
+    rows = []
+    for nom, note, coefficient, points in bulletin['rows']:
+        note_text = '-' if note is None else f"{note:.2f}"
+        points_text = '-' if points is None else f"{points:.2f}"
+        rows.append(f"<tr><td>{escape(nom)}</td><td>{note_text}</td>"
+                    f"<td>{coefficient:.2f}</td><td>{points_text}</td></tr>")
+    
+    if bulletin['average'] is not None:
+        summary = [labels['average'].format(average=bulletin['average'])]
+        rank = bulletin['rank']
+        if rank:
+            suffix = labels['rank_1'] if rank == 1 else labels['rank_other']
+            summary.append(labels['rank'].format(rank=rank, suffix=suffix))
+    else:
+        summary = [labels['no_grades']]
+    
+    return (
+        "<!DOCTYPE html>\n"
+        "<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{escape(labels['header'])} - {escape(bulletin['matricule'])}</title>\n"
+        "</head>\n<body>\n"
+        f"<h1>{escape(labels['header'])}</h1>\n"
+        f"<p>{escape(labels['student'].format(name=bulletin['name']))}<br>\n"
+        f"{escape(labels['matricule_label'].format(matricule=bulletin['matricule']))}<br>\n"
+        f"{escape(labels['level_label'].format(level=bulletin['niveau']))}</p>\n"
+        "<table border=\"1\" cellspacing=\"0\" cellpadding=\"4\">\n"
+        f"<tr><th>{escape(labels['subject'])}</th><th>{escape(labels['note'])}</th>"
+        f"<th>{escape(labels['coef'])}</th><th>{escape(labels['points'])}</th></tr>\n"
+        + "\n".join(rows) + "\n"
+        "</table>\n"
+        + "".join(f"<p>{escape(line)}</p>\n" for line in summary)
+        + "</body>\n</html>\n"
+    )
+
+
+def bulletin_filename(matricule: str, fmt: str) -> str:
+    """
+    Retourne le nom de fichier du bulletin d'un étudiant
+    
+    Args:
+        matricule (str): Matricule de l'étudiant
+        fmt (str): Format de sortie ('text' ou 'html')
+    
+    Returns:
+        str: Nom de fichier sans caractères problématiques
+    """
+    # Forme composée des accents, pour qu'un même matricule donne toujours le même nom
+    safe = re.sub(r'[^\w.-]', '_', unicodedata.normalize('NFC', matricule)) or '_'
+    return f"bulletin_{safe}.{FORMATS[fmt]}"
+
+
+def assign_filenames(bulletins: List[Dict[str, Any]], fmt: str):
+    """
+    Attribue à chaque bulletin un nom de fichier unique (clé 'filename')
+    
+    Des matricules différents peuvent donner le même nom une fois nettoyés
+    (ponctuation remplacée par '_', casse ignorée par le système de fichiers) :
+    les suivants reçoivent un suffixe _2, _3... au lieu d'écraser le premier.
+    
+    Args:
+        bulletins (List[Dict[str, Any]]): Bulletins à exporter, dans l'ordre des étudiants
+        fmt (str): Format de sortie
+    """
+    taken = set()
+    for bulletin in bulletins:
+        filename = bulletin_filename(bulletin['matricule'], fmt)
+        stem, extension = os.path.splitext(filename)
+        suffix = 2
+        while filename.casefold() in taken:
+            filename = f"{stem}_{suffix}{extension}"
+            suffix += 1
+        taken.add(filename.casefold())
+        bulletin['filename'] = filename
+
+
+def _write_batch(bulletins: List[Dict[str, Any]], fmt: str, labels: Dict[str, str],
+                 output_dir: str) -> Tuple[List[str], Optional[str]]:
+    """
+    Rend et écrit un lot de bulletins (exécuté dans un processus de travail)
+    
+    Args:
+        bulletins (List[Dict[str, Any]]): Bulletins du lot, avec leur nom de fichier
+        fmt (str): Format de sortie
+        labels (Dict[str, str]): Libellés traduits
+        output_dir (str): Dossier de sortie
+    
+    Returns:
+        Tuple[List[str], Optional[str]]: Chemins des fichiers écrits, et message
+            de l'erreur qui a interrompu le lot (None si tout a été écrit)
+    """
+    render = render_html if fmt == 'html' else render_text
+    paths = []
+    for bulletin in bulletins:
+        path = os.path.join(output_dir, bulletin['filename'])
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(render(bulletin, labels))
+        except OSError as e:
+            return paths, str(e)
+        paths.append(path)
+    return paths, None
+
+
+# ========== EXPORT ==========
+
+def export_bulletins(statistics: Statistics, output_dir: str, niveau: Optional[str] = None,
+                     fmt: str = 'text', labels: Optional[Dict[str, str]] = None,
+                     max_workers: Optional[int] = None,
+                     progress: Optional[Callable[[int, int], None]] = None) -> ExportResult:
+    """
+    Exporte les bulletins d'une classe ou de tout l'établissement
+    
+    Les statistiques sont agrégées une seule fois, puis les bulletins sont
+    rendus et écrits par lots dans des processus séparés. Rien n'est affiché :
+    l'appelant présente le résultat.
+    
+    Args:
+        statistics (Statistics): Calculateur de statistiques
+        output_dir (str): Dossier de sortie (créé au besoin)
+        niveau (str, optional): Niveau/classe à exporter. Si None, tout l'établissement
+        fmt (str): Format de sortie : 'text' ou 'html'
+        labels (Dict[str, str], optional): Libellés traduits (DEFAULT_LABELS par défaut)
+        max_workers (int, optional): Nombre de processus. 1 pour tout faire dans le
+            processus courant, None pour le nombre de processeurs
+        progress (Callable, optional): Appelée avec (bulletins écrits, total) après chaque lot
+    
+    Returns:
+        ExportResult: Fichiers écrits dans l'ordre des étudiants (y compris ceux
+            écrits avant une erreur) et message d'erreur éventuel
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Format de bulletin inconnu : {fmt}")
+    labels = {**DEFAULT_LABELS, **(labels or {})}
+    
+    bulletins = build_bulletins(statistics, niveau)
+    assign_filenames(bulletins, fmt)
+    total = len(bulletins)
+    batches = [bulletins[i:i + BATCH_SIZE] for i in range(0, total, BATCH_SIZE)]
+    result = ExportResult(total)
+    
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+    except OSError as e:
+        result.error = str(e)
+        return result
+    
+    if max_workers == 1 or len(batches) <= 1:
+        # Un seul lot : démarrer des processus coûterait plus qu'il ne rapporte
+        written = (_write_batch(batch, fmt, labels, output_dir) for batch in batches)
+        for paths, error in written:
+            result.paths.extend(paths)
+            if progress:
+                progress(len(result.paths), total)
+            if error:
+                result.error = error
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # map() rend les lots dans l'ordre de soumission : les chemins suivent l'ordre des étudiants
+            for paths, error in executor.map(_write_batch, batches, [fmt] * len(batches),
+                                             [labels] * len(batches), [output_dir] * len(batches)):
+                result.paths.extend(paths)
+                if progress:
+                    progress(len(result.paths), total)
+                if error and result.error is None:
+                    result.error = error
+    
+    return result
@@ -6,7 +6,11 @@ Gère la lecture, l'écriture et la sauvegarde des étudiants, matières et note
 
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+
+
+# Taille du journal des notes (en octets) au-delà de laquelle il est compacté
+DEFAULT_JOURNAL_COMPACTION_THRESHOLD = 1024 * 1024
 
 
 class FileManager:
@@ -15,18 +19,37 @@ class FileManager:
     Assure la persistance des données et la gestion des erreurs
     """
     
-    def __init__(self, data_dir='data'):
+    def __init__(self, data_dir='data', grades_journal=False,
+                 journal_compaction_threshold=DEFAULT_JOURNAL_COMPACTION_THRESHOLD):
         """
         Initialise le gestionnaire de fichiers
         
         Args:
             data_dir (str): Répertoire où sont stockés les fichiers JSON
+            grades_journal (bool): Active le journal des notes (grades.journal)
+            journal_compaction_threshold (int): Taille du journal en octets
+                au-delà de laquelle il est intégré à grades.json
         """
         self.data_dir = data_dir
+        self.grades_journal = grades_journal
+        self.journal_compaction_threshold = journal_compaction_threshold
         # S'assurer que le répertoire existe
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
     
+    def supports_row_updates(self, collection: str) -> bool:
+        """
+        Indique si une collection accepte les opérations ligne par ligne
+        (insert_*, update_*, delete_*) au lieu d'une réécriture complète
+        
+        Args:
+            collection (str): 'students', 'subjects' ou 'grades'
+            
+        Returns:
+            bool: True pour les notes lorsque le journal est activé, False sinon
+        """
+        return collection == 'grades' and self.grades_journal
+    
     def _read_json(self, filename: str) -> List[Dict[str, Any]]:
         """
         Lit un fichier JSON et retourne son contenu sous forme de liste
@@ -148,22 +171,199 @@ class FileManager:
         """
         Charge la liste des notes depuis le fichier JSON
         
+        En mode journal, les opérations de grades.journal sont rejouées
+        sur le dernier instantané grades.json.
+        
         Returns:
             List[Dict]: Liste des notes
         """
-        return self._read_json('grades.json')
+        grades = self._read_json('grades.json')
+        if self.grades_journal:
+            grades = self._replay_journal(grades)
+        return grades
     
     def save_grades(self, grades: List[Dict[str, Any]]) -> bool:
         """
         Sauvegarde la liste des notes dans le fichier JSON
         
+        En mode journal, la liste complète devient le nouvel instantané
+        et le journal est vidé.
+        
         Args:
             grades (List[Dict]): Liste des notes à sauvegarder
             
         Returns:
             bool: True si la sauvegarde a réussi
         """
-        return self._write_json('grades.json', grades)
+        if not self._write_json('grades.json', grades):
+            return False
+        if self.grades_journal:
+            self._clear_journal()
+        return True
+    
+    # ========== JOURNAL DES NOTES ==========
+    
+    def _journal_path(self) -> str:
+        """Retourne le chemin du journal des notes"""
+        return os.path.join(self.data_dir, 'grades.journal')
+    
+    def _append_journal(self, entry: Dict[str, Any]) -> bool:
+        """
+        Ajoute une opération à la fin du journal (une ligne JSON)
+        
+        Args:
+            entry (Dict): Opération à enregistrer
+            
+        Returns:
+            bool: True si l'écriture a réussi
+        """
+        filepath = self._journal_path()
+        try:
+            with open(filepath, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                size = f.tell()
+        except Exception as e:
+            print(f"Erreur lors de l'écriture de grades.journal: {e}")
+            return False
+        
+        if size > self.journal_compaction_threshold:
+            self.compact_grades_journal()
+        return True
+    
+    def _truncate_journal_tail(self, filepath: str):
+        """
+        Supprime une dernière ligne incomplète (écriture interrompue)
+        
+        Sans cela, l'ajout suivant serait collé à cette ligne et perdu avec elle.
+        
+        Args:
+            filepath (str): Chemin du journal
+        """
+        with open(filepath, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                end = data.rfind(b"\n") + 1
+                print(f"Attention: Fin incomplète de grades.journal supprimée ({len(data) - end} octet(s)).")
+                f.truncate(end)
+    
+    def _replay_journal(self, grades: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Rejoue le journal sur un instantané des notes
+        
+        Args:
+            grades (List[Dict]): Notes de l'instantané grades.json
+            
+        Returns:
+            List[Dict]: Notes après application du journal
+        """
+        filepath = self._journal_path()
+        if not os.path.exists(filepath):
+            return grades
+        
+        # Position de chaque note dans la liste, par (matricule, code matière)
+        positions: Dict[Tuple[str, str], int] = {}
+        for i, grade in enumerate(grades):
+            positions.setdefault((grade.get('matricule_etudiant', ''), grade.get('code_matiere', '')), i)
+        records: List[Any] = list(grades)
+        
+        try:
+            self._truncate_journal_tail(filepath)
+            with open(filepath, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Ligne incomplète (interruption pendant l'écriture)
+                        print(f"Attention: Ligne {line_number} de grades.journal ignorée (corrompue).")
+                        continue
+                    
+                    op = entry.get('op')
+                    key = (entry.get('matricule_etudiant', ''), entry.get('code_matiere', ''))
+                    if op == 'delete':
+                        index = positions.pop(key, None)
+                        if index is not None:
+                            records[index] = None
+                            # Une note en double dans l'instantané devient la suivante visée
+                            for i in range(index + 1, len(records)):
+                                record = records[i]
+                                if record is not None and (record.get('matricule_etudiant', ''),
+                                                           record.get('code_matiere', '')) == key:
+                                    positions[key] = i
+                                    break
+                    elif op in ('add', 'update'):
+                        grade = entry.get('grade', {})
+                        key = (grade.get('matricule_etudiant', ''), grade.get('code_matiere', ''))
+                        index = positions.get(key)
+                        if index is None:
+                            positions[key] = len(records)
+                            records.append(grade)
+                        else:
+                            records[index] = grade
+        except Exception as e:
+            print(f"Erreur lors de la lecture de grades.journal: {e}")
+        
+        return [g for g in records if g is not None]
+    
+    def _clear_journal(self):
+        """Supprime le journal des notes"""
+        filepath = self._journal_path()
+        if os.path.exists(filepath):
+            try:
+                os.remove(filepath)
+            except Exception as e:
+                print(f"Erreur lors de la suppression de grades.journal: {e}")
+    
+    def compact_grades_journal(self) -> bool:
+        """
+        Intègre le journal dans l'instantané grades.json puis le vide
+        
+        Returns:
+            bool: True si la compaction a réussi
+        """
+        return self.save_grades(self.load_grades())
+    
+    def insert_grade(self, grade: Dict[str, Any]) -> bool:
+        """
+        Enregistre l'ajout d'une note dans le journal
+        
+        Args:
+            grade (Dict): Note ajoutée
+            
+        Returns:
+            bool: True si l'écriture a réussi
+        """
+        return self._append_journal({'op': 'add', 'grade': grade})
+    
+    def update_grade(self, grade: Dict[str, Any]) -> bool:
+        """
+        Enregistre la modification d'une note dans le journal
+        
+        Args:
+            grade (Dict): Note modifiée
+            
+        Returns:
+            bool: True si l'écriture a réussi
+        """
+        return self._append_journal({'op': 'update', 'grade': grade})
+    
+    def delete_grade(self, matricule: str, code_matiere: str) -> bool:
+        """
+        Enregistre la suppression d'une note dans le journal
+        
+        Args:
+            matricule (str): Matricule de l'étudiant
+            code_matiere (str): Code de la matière
+            
+        Returns:
+            bool: True si l'écriture a réussi
+        """
+        return self._append_journal({
+            'op': 'delete',
+            'matricule_etudiant': matricule,
+            'code_matiere': code_matiere
+        })
     
     # ========== GESTION DE LA CONFIGURATION ==========
     
@@ -225,3 +425,32 @@ class FileManager:
         config['language'] = language
         return self.save_config(config)
 
+
+def create_file_manager(data_dir='data') -> FileManager:
+    """
+    Crée le gestionnaire de stockage choisi dans config.json
+    
+    La clé "storage" vaut "json" (par défaut) ou "sqlite". En stockage JSON,
+    "grades_journal" active le journal des notes et
+    "journal_compaction_threshold" fixe sa taille maximale en octets.
+    
+    Args:
+        data_dir (str): Répertoire des données
+        
+    Returns:
+        FileManager: Gestionnaire JSON ou SQLite
+    """
+    config = FileManager(data_dir).load_config()
+    storage = config.get('storage', 'json')
+    
+    if storage == 'sqlite':
+        # Import local pour éviter un import circulaire
+        from services.sqlite_storage import SQLiteFileManager
+        return SQLiteFileManager(data_dir)
+    
+    return FileManager(
+        data_dir,
+        grades_journal=config.get('grades_journal', False),
+        journal_compaction_threshold=config.get('journal_compaction_threshold',
+                                                DEFAULT_JOURNAL_COMPACTION_THRESHOLD)
+    )
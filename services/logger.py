@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Module de journalisation structurée
+S'appuie sur le module logging : les appels placent les événements dans une file, écrite par un thread d'arrière-plan
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+# Nom du journal de l'application (les journaux des modules en sont les enfants)
+LOGGER_NAME = 'student_grade_manager'
+
+# Niveaux de journalisation ('off' désactive le journal)
+LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'off': logging.CRITICAL + 1
+}
+
+# Désactivé tant que configure_logger() ne l'a pas activé ; NullHandler évite
+# l'affichage des avertissements sur stderr par le gestionnaire par défaut
+_app_logger = logging.getLogger(LOGGER_NAME)
+_app_logger.setLevel(LEVELS['off'])
+_app_logger.propagate = False
+_app_logger.addHandler(logging.NullHandler())
+
+# Thread d'écriture en cours (un seul à la fois)
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formate un événement en une ligne JSON
+    
+    Les données associées sont passées par extra={'data': {...}} lors de l'appel.
+    """
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Convertit un événement en ligne JSON
+        
+        Args:
+            record (logging.LogRecord): Événement à formater
+        
+        Returns:
+            str: Ligne JSON (horodatage en millisecondes, niveau, origine, message, données)
+        """
+        entry: Dict[str, Any] = {
+            'timestamp': round(record.created * 1000),
+            'level': record.levelname.lower(),
+            'location': f"{record.module}.{record.funcName}:{record.lineno}",
+            'message': record.getMessage(),
+            'data': getattr(record, 'data', {})
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """
+    Retourne le journal de l'application ou celui d'un module
+    
+    Args:
+        name (str, optional): Nom du module (ex: __name__)
+    
+    Returns:
+        logging.Logger: Journal enfant de LOGGER_NAME
+    """
+    if not name:
+        return _app_logger
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+def _stop_listener():
+    """Arrête le thread d'écriture après avoir écrit les événements en attente"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def configure_logger(config: Dict[str, Any], data_dir: str = 'data') -> logging.Logger:
+    """
+    Configure le journal de l'application à partir de config.json
+    
+    La clé "log_level" vaut 'off' (par défaut), 'debug', 'info', 'warning'
+    ou 'error' ; "log_file" indique le fichier (data/app.log par défaut).
+    Les appels ne font que placer l'événement dans une file (QueueHandler) ;
+    un QueueListener l'écrit dans le fichier depuis son propre thread.
+    
+    Args:
+        config (Dict[str, Any]): Configuration chargée
+        data_dir (str): Répertoire des données
+    
+    Returns:
+        logging.Logger: Journal de l'application configuré
+    """
+    global _listener
+    level = config.get('log_level', 'off')
+    if level not in LEVELS:
+        print(f"Niveau de journalisation inconnu : {level} (journal désactivé)")
+        level = 'off'
+    
+    _stop_listener()
+    for handler in list(_app_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            _app_logger.removeHandler(handler)
+    _app_logger.setLevel(LEVELS[level])
+    if level == 'off':
+        return _app_logger
+    
+    path = config.get('log_file') or os.path.join(data_dir, 'app.log')
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_handler = logging.FileHandler(path, encoding='utf-8', delay=True)
+    except OSError as e:
+        print(f"Erreur lors de l'ouverture du journal {path}: {e}")
+        _app_logger.setLevel(LEVELS['off'])
+        return _app_logger
+    file_handler.setFormatter(JsonFormatter())
+    
+    events = queue.SimpleQueue()
+    _app_logger.addHandler(QueueHandler(events))
+    _listener = QueueListener(events, file_handler)
+    _listener.start()
+    return _app_logger
+
+
+# Les événements en attente sont écrits à la fermeture de l'application
+atexit.register(_stop_listener)
@@ -10,8 +10,12 @@ from models.student import Student
 from models.subject import Subject
 from models.grade import Grade
 from services.file_manager import FileManager
+from services.stats_store import StatsStore
 from services.statistics import Statistics
+from services.repository import DataRepository
+from services.unit_of_work import UnitOfWork
 from services.i18n import TranslationManager
+from services import bulletins
 
 
 class Menu:
@@ -29,38 +33,43 @@ class Menu:
         """
         self.file_manager = file_manager
         self.i18n = i18n
-        self.students: List[Student] = []
-        self.subjects: List[Subject] = []
-        self.grades: List[Grade] = []
+        self.repository = DataRepository()
+        self.unit_of_work = UnitOfWork(file_manager, self.repository)
+        self.stats_store = StatsStore(self.repository)
+        self.statistics = Statistics.for_repository(self.repository)
         self._load_data()
     
+    @property
+    def students(self) -> List[Student]:
+        """Liste des étudiants (détenue par le dépôt)"""
+        return self.repository.students
+    
+    @property
+    def subjects(self) -> List[Subject]:
+        """Liste des matières (détenue par le dépôt)"""
+        return self.repository.subjects
+    
+    @property
+    def grades(self) -> List[Grade]:
+        """Liste des notes (détenue par le dépôt)"""
+        return self.repository.grades
+    
     def _load_data(self):
         """Charge toutes les données depuis les fichiers JSON"""
         # Charger les étudiants
         students_data = self.file_manager.load_students()
-        self.students = [Student.from_dict(s) for s in students_data]
+        students = Student.from_dicts(students_data)
         
         # Charger les matières
         subjects_data = self.file_manager.load_subjects()
-        self.subjects = [Subject.from_dict(s) for s in subjects_data]
+        subjects = Subject.from_dicts(subjects_data)
         
         # Charger les notes
         grades_data = self.file_manager.load_grades()
-        self.grades = [Grade.from_dict(g) for g in grades_data]
-    
-    def _save_data(self):
-        """Sauvegarde toutes les données dans les fichiers JSON"""
-        # Sauvegarder les étudiants
-        students_data = [s.to_dict() for s in self.students]
-        self.file_manager.save_students(students_data)
-        
-        # Sauvegarder les matières
-        subjects_data = [s.to_dict() for s in self.subjects]
-        self.file_manager.save_subjects(subjects_data)
+        grades = Grade.from_dicts(grades_data)
         
-        # Sauvegarder les notes
-        grades_data = [g.to_dict() for g in self.grades]
-        self.file_manager.save_grades(grades_data)
+        # Indexer les données
+        self.repository.load(students, subjects, grades)
     
     def _clear_screen(self):
         """Efface l'écran de la console"""
@@ -211,7 +220,7 @@ class Menu:
         niveau = self._get_input(self.i18n.get('students.add.level'))
         
         # Vérifier que le matricule est unique
-        if any(s.matricule == matricule for s in self.students):
+        if self.repository.get_student(matricule):
             print(f"\n{self.i18n.get('students.add.matricule_exists', matricule=matricule)}")
             self._press_enter()
             return
@@ -224,8 +233,8 @@ class Menu:
             self._press_enter()
             return
         
-        self.students.append(student)
-        self._save_data()
+        self.repository.add_student(student)
+        self.unit_of_work.commit()
         print(f"\n{self.i18n.get('students.add.success', student=str(student))}")
         self._press_enter()
     
@@ -251,17 +260,16 @@ class Menu:
         prenom = self._get_input(self.i18n.get('students.modify.new_firstname'), student.prenom)
         niveau = self._get_input(self.i18n.get('students.modify.new_level'), student.niveau)
         
-        student.nom = nom
-        student.prenom = prenom
-        student.niveau = niveau
-        
-        is_valid, error_msg = student.validate()
+        # Valider les nouvelles valeurs avant de modifier l'étudiant
+        candidate = Student(nom, prenom, student.matricule, niveau)
+        is_valid, error_msg = candidate.validate()
         if not is_valid:
             print(f"\n{self.i18n.get('students.modify.validation_error', error=error_msg)}")
             self._press_enter()
             return
         
-        self._save_data()
+        self.repository.update_student(student, candidate.nom, candidate.prenom, candidate.niveau)
+        self.unit_of_work.commit()
         print(f"\n{self.i18n.get('students.modify.success', student=str(student))}")
         self._press_enter()
     
@@ -285,9 +293,8 @@ class Menu:
         
         if confirm == 'o' or confirm == 'y':
             # Supprimer aussi toutes ses notes
-            self.grades = [g for g in self.grades if g.matricule_etudiant != matricule]
-            self.students.remove(student)
-            self._save_data()
+            self.repository.remove_student(student)
+            self.unit_of_work.commit()
             print(f"\n{self.i18n.get('students.delete.success')}")
         else:
             print(f"\n{self.i18n.get('students.delete.cancelled')}")
@@ -329,7 +336,7 @@ class Menu:
         niveau = self._get_input(self.i18n.get('students.list.level_prompt'))
         
         if niveau:
-            filtered = [s for s in self.students if s.niveau == niveau]
+            filtered = self.repository.get_students_by_niveau(niveau)
         else:
             filtered = self.students
         
@@ -344,10 +351,7 @@ class Menu:
     
     def _find_student_by_matricule(self, matricule: str) -> Optional[Student]:
         """Trouve un étudiant par son matricule"""
-        for student in self.students:
-            if student.matricule == matricule:
-                return student
-        return None
+        return self.repository.get_student(matricule)
     
     # ========== GESTION DES MATIÈRES ==========
     
@@ -393,7 +397,7 @@ class Menu:
         niveau = self._get_input(self.i18n.get('subjects.add.level'))
         
         # Vérifier que le code est unique
-        if any(s.code == code for s in self.subjects):
+        if self.repository.get_subject(code):
             print(f"\n{self.i18n.get('subjects.add.code_exists', code=code)}")
             self._press_enter()
             return
@@ -413,8 +417,8 @@ class Menu:
             self._press_enter()
             return
         
-        self.subjects.append(subject)
-        self._save_data()
+        self.repository.add_subject(subject)
+        self.unit_of_work.commit()
         print(f"\n{self.i18n.get('subjects.add.success', subject=str(subject))}")
         self._press_enter()
     
@@ -447,17 +451,16 @@ class Menu:
             self._press_enter()
             return
         
-        subject.nom = nom
-        subject.coefficient = coef
-        subject.niveau = niveau
-        
-        is_valid, error_msg = subject.validate()
+        # Valider les nouvelles valeurs avant de modifier la matière
+        candidate = Subject(nom, subject.code, coef, niveau)
+        is_valid, error_msg = candidate.validate()
         if not is_valid:
             print(f"\n{self.i18n.get('subjects.modify.validation_error', error=error_msg)}")
             self._press_enter()
             return
         
-        self._save_data()
+        self.repository.update_subject(subject, candidate.nom, candidate.coefficient, candidate.niveau)
+        self.unit_of_work.commit()
         print(f"\n{self.i18n.get('subjects.modify.success', subject=str(subject))}")
         self._press_enter()
     
@@ -481,9 +484,8 @@ class Menu:
         
         if confirm == 'o' or confirm == 'y':
             # Supprimer aussi toutes les notes de cette matière
-            self.grades = [g for g in self.grades if g.code_matiere != code]
-            self.subjects.remove(subject)
-            self._save_data()
+            self.repository.remove_subject(subject)
+            self.unit_of_work.commit()
             print(f"\n{self.i18n.get('subjects.delete.success')}")
         else:
             print(f"\n{self.i18n.get('subjects.delete.cancelled')}")
@@ -515,10 +517,7 @@ class Menu:
     
     def _find_subject_by_code(self, code: str) -> Optional[Subject]:
         """Trouve une matière par son code"""
-        for subject in self.subjects:
-            if subject.code == code:
-                return subject
-        return None
+        return self.repository.get_subject(code)
     
     # ========== GESTION DES NOTES ==========
     
@@ -572,11 +571,10 @@ class Menu:
             return
         
         # Vérifier qu'il n'y a pas déjà une note pour cet étudiant dans cette matière
-        existing = [g for g in self.grades 
-                   if g.matricule_etudiant == matricule and g.code_matiere == code_matiere]
+        existing = self._find_grade(matricule, code_matiere)
         if existing:
             print(f"\n{self.i18n.get('grades.add.already_exists')}")
-            print(self.i18n.get('grades.add.existing_note', note=existing[0].note))
+            print(self.i18n.get('grades.add.existing_note', note=existing.note))
             self._press_enter()
             return
         
@@ -597,8 +595,8 @@ class Menu:
             self._press_enter()
             return
         
-        self.grades.append(grade)
-        self._save_data()
+        self.repository.add_grade(grade)
+        self.unit_of_work.commit()
         print(f"\n{self.i18n.get('grades.add.success', grade=str(grade))}")
         self._press_enter()
     
@@ -629,15 +627,17 @@ class Menu:
             self._press_enter()
             return
         
-        grade.note = note
-        is_valid, error_msg = grade.validate()
+        # Valider la nouvelle note avant de modifier la note existante
+        candidate = Grade(grade.matricule_etudiant, grade.code_matiere, note, grade.date)
+        is_valid, error_msg = candidate.validate()
         
         if not is_valid:
             print(f"\n{self.i18n.get('grades.modify.validation_error', error=error_msg)}")
             self._press_enter()
             return
         
-        self._save_data()
+        self.repository.update_grade(grade, candidate.note)
+        self.unit_of_work.commit()
         print(f"\n{self.i18n.get('grades.modify.success', grade=str(grade))}")
         self._press_enter()
     
@@ -662,8 +662,8 @@ class Menu:
         confirm = input(f"\n{self.i18n.get('grades.delete.confirm')}").strip().lower()
         
         if confirm == 'o' or confirm == 'y':
-            self.grades.remove(grade)
-            self._save_data()
+            self.repository.remove_grade(grade)
+            self.unit_of_work.commit()
             print(f"\n{self.i18n.get('grades.delete.success')}")
         else:
             print(f"\n{self.i18n.get('grades.delete.cancelled')}")
@@ -672,10 +672,7 @@ class Menu:
     
     def _find_grade(self, matricule: str, code_matiere: str) -> Optional[Grade]:
         """Trouve une note par matricule et code matière"""
-        for grade in self.grades:
-            if grade.matricule_etudiant == matricule and grade.code_matiere == code_matiere:
-                return grade
-        return None
+        return self.repository.get_grade(matricule, code_matiere)
     
     # ========== CONSULTATION DES NOTES ==========
     
@@ -690,6 +687,7 @@ class Menu:
             print(f"2. {self.i18n.get('menu.consultation.option_2')}")
             print(f"3. {self.i18n.get('menu.consultation.option_3')}")
             print(f"4. {self.i18n.get('menu.consultation.option_4')}")
+            print(f"5. {self.i18n.get('menu.consultation.option_5')}")
             
             choice = input(f"\n{self.i18n.get('menu.main.choice')}").strip()
             
@@ -700,6 +698,8 @@ class Menu:
             elif choice == '3':
                 self.show_student_bulletin()
             elif choice == '4':
+                self.export_bulletins()
+            elif choice == '5':
                 break
             else:
                 print(f"\n{self.i18n.get('menu.main.invalid')}")
@@ -720,7 +720,7 @@ class Menu:
             self._press_enter()
             return
         
-        student_grades = [g for g in self.grades if g.matricule_etudiant == matricule]
+        student_grades = self.repository.get_grades_by_student(matricule)
         
         print(f"\n{self.i18n.get('consultation.student_grades.student_info', student=str(student))}")
         print(f"\n{self.i18n.get('consultation.student_grades.count', count=len(student_grades))}\n")
@@ -752,7 +752,7 @@ class Menu:
             return
         
         # Récupérer les étudiants de la classe
-        class_students = [s for s in self.students if s.niveau == niveau]
+        class_students = self.repository.get_students_by_niveau(niveau)
         
         print(f"\n{self.i18n.get('consultation.class_grades.subject_info', subject=subject.nom)}")
         print(self.i18n.get('consultation.class_grades.class_info', level=niveau))
@@ -783,14 +783,11 @@ class Menu:
             self._press_enter()
             return
         
-        # Récupérer les notes de l'étudiant
-        student_grades = [g for g in self.grades if g.matricule_etudiant == matricule]
-        
         # Récupérer les matières du niveau de l'étudiant
         level_subjects = [s for s in self.subjects if s.niveau == student.niveau]
         
         # Calculer les statistiques
-        stats = Statistics(self.students, self.subjects, self.grades)
+        stats = self.stats_store
         moyenne = stats.calculate_student_average(matricule)
         rang = stats.calculate_student_rank(matricule)
         
@@ -835,6 +832,35 @@ class Menu:
         print(f"{'='*60}")
         self._press_enter()
     
+    def export_bulletins(self):
+        """Exporte les bulletins d'une classe ou de tout l'établissement"""
+        self._clear_screen()
+        print("=" * 60)
+        print(f"    {self.i18n.get('consultation.batch.title')}")
+        print("=" * 60)
+        
+        niveau = self._get_input(self.i18n.get('consultation.batch.level'))
+        fmt = self._get_input(self.i18n.get('consultation.batch.format'), "text").lower()
+        if fmt not in bulletins.FORMATS:
+            print(f"\n{self.i18n.get('consultation.batch.invalid_format', format=fmt)}")
+            self._press_enter()
+            return
+        output_dir = self._get_input(self.i18n.get('consultation.batch.output'), "bulletins")
+        
+        def report(done, total):
+            print(f"\r{self.i18n.get('consultation.batch.progress', done=done, total=total)}", end="", flush=True)
+        
+        result = bulletins.export_bulletins(self.statistics, output_dir, niveau or None, fmt,
+                                            bulletins.translated_labels(self.i18n), progress=report)
+        print()
+        if result.error:
+            print(f"\n{self.i18n.get('consultation.batch.failed', error=result.error, count=len(result.paths), total=result.total)}")
+        elif not result.paths:
+            print(f"\n{self.i18n.get('consultation.batch.none')}")
+        if result.paths:
+            print(f"\n{self.i18n.get('consultation.batch.done', count=len(result.paths), path=output_dir)}")
+        self._press_enter()
+    
     # ========== STATISTIQUES ==========
     
     def handle_statistics_menu(self):
@@ -881,7 +907,7 @@ class Menu:
             self._press_enter()
             return
         
-        stats = Statistics(self.students, self.subjects, self.grades)
+        stats = self.stats_store
         moyenne = stats.calculate_student_average(matricule)
         rang = stats.calculate_student_rank(matricule)
         
@@ -907,7 +933,7 @@ class Menu:
         
         niveau = self._get_input(self.i18n.get('statistics.class.level'))
         
-        stats = Statistics(self.students, self.subjects, self.grades)
+        stats = self.stats_store
         moyenne_classe = stats.calculate_class_average(niveau)
         meilleur = stats.get_best_student_in_class(niveau)
         classement = stats.get_class_ranking(niveau)
@@ -951,7 +977,7 @@ class Menu:
             self._press_enter()
             return
         
-        stats = Statistics(self.students, self.subjects, self.grades)
+        stats = self.stats_store
         moyenne = stats.calculate_subject_average(code_matiere)
         meilleur = stats.get_best_student_in_subject(code_matiere)
         
@@ -976,7 +1002,7 @@ class Menu:
         print(f"    {self.i18n.get('statistics.global.title')}")
         print("=" * 60)
         
-        stats = Statistics(self.students, self.subjects, self.grades)
+        stats = self.stats_store
         moyenne_globale = stats.calculate_global_average()
         meilleur = stats.get_best_student_global()
         
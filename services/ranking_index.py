@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Module de l'index de classement d'une classe
+Tient les étudiants triés par moyenne pour obtenir rangs et têtes de classement
+"""
+
+from bisect import bisect_left, insort
+from typing import List, Dict, Tuple, Optional
+from models.student import Student
+
+
+class RankingIndex:
+    """
+    Classement trié d'une classe, mis à jour étudiant par étudiant
+    
+    Les entrées sont des clés (-moyenne, position) conservées dans une liste
+    triée : la position de l'étudiant dans la liste des étudiants départage
+    les égalités, comme le tri stable de Statistics. Les moyennes reçues
+    doivent être celles que calcule Statistics, au bit près (StatsStore les
+    obtient par les mêmes opérations) : sinon deux étudiants à égalité
+    pourraient être classés autrement que dans la CLI et les bulletins.
+    
+    Le rang d'un étudiant s'obtient par recherche dichotomique, sans trier la
+    classe. Déplacer un étudiant décale en revanche la fin de la liste (O(n)
+    en nombre d'étudiants de la classe) : pour quelques centaines d'élèves,
+    ce décalage mémoire coûte moins qu'un arbre équilibré écrit en Python.
+    """
+    
+    def __init__(self, entries: Optional[List[Tuple[Student, int, float]]] = None):
+        """
+        Construit l'index en un seul tri
+        
+        Args:
+            entries (List[Tuple[Student, int, float]], optional): (étudiant, position
+                dans la liste des étudiants, moyenne) des étudiants ayant une moyenne
+        """
+        self._keys: List[Tuple[float, int]] = []
+        self._key_by_position: Dict[int, Tuple[float, int]] = {}
+        self._students: Dict[int, Student] = {}
+        for student, position, average in entries or []:
+            key = (-average, position)
+            self._keys.append(key)
+            self._key_by_position[position] = key
+            self._students[position] = student
+        self._keys.sort()
+    
+    def __len__(self):
+        """
+        Nombre d'étudiants classés
+        
+        Returns:
+            int: Nombre d'entrées de l'index
+        """
+        return len(self._keys)
+    
+    def update(self, student: Student, position: int, average: Optional[float]):
+        """
+        Place un étudiant à sa nouvelle moyenne (ou le retire si elle est None)
+        
+        Recherche en O(log n), suppression et insertion dans la liste en O(n).
+        
+        Args:
+            student (Student): Étudiant concerné
+            position (int): Position de l'étudiant dans la liste des étudiants
+            average (Optional[float]): Nouvelle moyenne
+        """
+        previous = self._key_by_position.pop(position, None)
+        if previous is not None:
+            del self._keys[bisect_left(self._keys, previous)]
+            del self._students[position]
+        if average is not None:
+            key = (-average, position)
+            insort(self._keys, key)
+            self._key_by_position[position] = key
+            self._students[position] = student
+    
+    def rank(self, position: int) -> Optional[int]:
+        """
+        Retourne le rang d'un étudiant
+        
+        Args:
+            position (int): Position de l'étudiant dans la liste des étudiants
+        
+        Returns:
+            Optional[int]: Rang (1 = premier) ou None si l'étudiant n'est pas classé
+        """
+        key = self._key_by_position.get(position)
+        if key is None:
+            return None
+        return bisect_left(self._keys, key) + 1
+    
+    def top(self, count: Optional[int] = None) -> List[Tuple[Student, float, int]]:
+        """
+        Retourne les premiers du classement
+        
+        Args:
+            count (int, optional): Nombre d'étudiants voulus. Si None, toute la classe
+        
+        Returns:
+            List[Tuple[Student, float, int]]: Liste de (étudiant, moyenne, rang)
+        """
+        keys = self._keys if count is None else self._keys[:max(count, 0)]
+        return [(self._students[position], -average, rank)
+                for rank, (average, position) in enumerate(keys, start=1)]
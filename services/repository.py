@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+Module du dépôt de données en mémoire
+Maintient les listes d'étudiants, de matières et de notes ainsi que leurs index
+"""
+
+from typing import List, Dict, Tuple, Optional, Callable
+from models.student import Student
+from models.subject import Subject
+from models.grade import Grade
+
+
+class DataRepository:
+    """
+    Dépôt central des données avec index par clé
+    
+    Les index sont tenus à jour à chaque ajout, modification ou suppression
+    effectué via le dépôt, ce qui rend toutes les recherches en O(1).
+    Chaque modification est signalée aux écouteurs enregistrés avec add_listener().
+    
+    Attributs:
+        students (List[Student]): Liste des étudiants
+        subjects (List[Subject]): Liste des matières
+        grades (List[Grade]): Liste des notes
+        version (int): Version des données, incrémentée à chaque modification signalée
+    """
+    
+    def __init__(self, students: Optional[List[Student]] = None,
+                 subjects: Optional[List[Subject]] = None,
+                 grades: Optional[List[Grade]] = None):
+        """
+        Initialise le dépôt de données
+        
+        Args:
+            students (List[Student], optional): Liste des étudiants
+            subjects (List[Subject], optional): Liste des matières
+            grades (List[Grade], optional): Liste des notes
+        """
+        self.students: List[Student] = []
+        self.subjects: List[Subject] = []
+        self.grades: List[Grade] = []
+        self._listeners: List[Callable] = []
+        self.version = 0
+        self.load(students or [], subjects or [], grades or [])
+    
+    def add_listener(self, callback: Callable):
+        """
+        Enregistre un écouteur appelé après chaque modification
+        
+        Args:
+            callback (Callable): Fonction appelée avec (action, entité) où action vaut
+                'add', 'update' ou 'delete', ou ('load', None) après un rechargement complet
+        """
+        self._listeners.append(callback)
+    
+    def _notify(self, action: str, entity):
+        """Signale une modification à tous les écouteurs"""
+        self.version += 1
+        for callback in self._listeners:
+            callback(action, entity)
+    
+    def load(self, students: List[Student], subjects: List[Subject], grades: List[Grade]):
+        """
+        Remplace toutes les données du dépôt et reconstruit les index
+        
+        Args:
+            students (List[Student]): Liste des étudiants
+            subjects (List[Subject]): Liste des matières
+            grades (List[Grade]): Liste des notes
+        """
+        self.students = students
+        self.subjects = subjects
+        self.grades = grades
+        self._rebuild_indexes()
+        self._notify('load', None)
+    
+    def _rebuild_indexes(self):
+        """Reconstruit tous les index à partir des listes"""
+        # Les sous-index sont des dictionnaires indexés par id() : ils gardent
+        # l'ordre d'insertion et permettent une suppression en O(1)
+        self._students_by_matricule: Dict[str, Student] = {}
+        self._students_by_niveau: Dict[str, Dict[int, Student]] = {}
+        self._subjects_by_code: Dict[str, Subject] = {}
+        self._grades_by_key: Dict[Tuple[str, str], Grade] = {}
+        self._grades_by_student: Dict[str, Dict[int, Grade]] = {}
+        self._grades_by_subject: Dict[str, Dict[int, Grade]] = {}
+        
+        for student in self.students:
+            self._index_student(student)
+        for subject in self.subjects:
+            self._subjects_by_code.setdefault(subject.code, subject)
+        for grade in self.grades:
+            self._index_grade(grade)
+    
+    def _index_student(self, student: Student):
+        """Ajoute un étudiant aux index"""
+        self._students_by_matricule.setdefault(student.matricule, student)
+        self._students_by_niveau.setdefault(student.niveau, {})[id(student)] = student
+    
+    def _unindex_student(self, student: Student):
+        """Retire un étudiant des index"""
+        if self._students_by_matricule.get(student.matricule) is student:
+            del self._students_by_matricule[student.matricule]
+            # Un éventuel doublon de matricule devient l'étudiant de référence
+            for other in self.students:
+                if other.matricule == student.matricule and other is not student:
+                    self._students_by_matricule[other.matricule] = other
+                    break
+        self._unindex_student_niveau(student)
+    
+    def _unindex_student_niveau(self, student: Student):
+        """Retire un étudiant de l'index par niveau"""
+        bucket = self._students_by_niveau.get(student.niveau)
+        if bucket is not None:
+            bucket.pop(id(student), None)
+            if not bucket:
+                del self._students_by_niveau[student.niveau]
+    
+    def _index_grade(self, grade: Grade):
+        """Ajoute une note aux index"""
+        self._grades_by_key.setdefault((grade.matricule_etudiant, grade.code_matiere), grade)
+        self._grades_by_student.setdefault(grade.matricule_etudiant, {})[id(grade)] = grade
+        self._grades_by_subject.setdefault(grade.code_matiere, {})[id(grade)] = grade
+    
+    def _unindex_grade(self, grade: Grade):
+        """Retire une note des index"""
+        key = (grade.matricule_etudiant, grade.code_matiere)
+        if self._grades_by_key.get(key) is grade:
+            del self._grades_by_key[key]
+            for other in self._grades_by_student.get(grade.matricule_etudiant, {}).values():
+                if other.code_matiere == grade.code_matiere and other is not grade:
+                    self._grades_by_key[key] = other
+                    break
+        for index, value in ((self._grades_by_student, grade.matricule_etudiant),
+                             (self._grades_by_subject, grade.code_matiere)):
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(id(grade), None)
+                if not bucket:
+                    del index[value]
+    
+    def _remove_grades(self, grades: List[Grade]):
+        """Retire un ensemble de notes de la liste et des index"""
+        if not grades:
+            return
+        removed = {id(g) for g in grades}
+        for grade in grades:
+            self._unindex_grade(grade)
+        # Modification en place pour conserver la même liste
+        self.grades[:] = [g for g in self.grades if id(g) not in removed]
+        for grade in grades:
+            self._notify('delete', grade)
+    
+    # ========== RECHERCHES ==========
+    
+    def get_student(self, matricule: str) -> Optional[Student]:
+        """
+        Trouve un étudiant par son matricule
+        
+        Args:
+            matricule (str): Matricule de l'étudiant
+        
+        Returns:
+            Optional[Student]: L'étudiant trouvé ou None
+        """
+        return self._students_by_matricule.get(matricule)
+    
+    def get_subject(self, code: str) -> Optional[Subject]:
+        """
+        Trouve une matière par son code
+        
+        Args:
+            code (str): Code de la matière
+        
+        Returns:
+            Optional[Subject]: La matière trouvée ou None
+        """
+        return self._subjects_by_code.get(code)
+    
+    def get_grade(self, matricule: str, code_matiere: str) -> Optional[Grade]:
+        """
+        Trouve une note par matricule et code matière
+        
+        Args:
+            matricule (str): Matricule de l'étudiant
+            code_matiere (str): Code de la matière
+        
+        Returns:
+            Optional[Grade]: La note trouvée ou None
+        """
+        return self._grades_by_key.get((matricule, code_matiere))
+    
+    def get_students_by_niveau(self, niveau: str) -> List[Student]:
+        """
+        Récupère les étudiants d'un niveau/classe
+        
+        Args:
+            niveau (str): Niveau/classe
+        
+        Returns:
+            List[Student]: Étudiants du niveau
+        """
+        return list(self._students_by_niveau.get(niveau, {}).values())
+    
+    def get_grades_by_student(self, matricule: str) -> List[Grade]:
+        """
+        Récupère toutes les notes d'un étudiant
+        
+        Args:
+            matricule (str): Matricule de l'étudiant
+        
+        Returns:
+            List[Grade]: Notes de l'étudiant
+        """
+        return list(self._grades_by_student.get(matricule, {}).values())
+    
+    def get_grades_by_subject(self, code_matiere: str) -> List[Grade]:
+        """
+        Récupère toutes les notes d'une matière
+        
+        Args:
+            code_matiere (str): Code de la matière
+        
+        Returns:
+            List[Grade]: Notes de la matière
+        """
+        return list(self._grades_by_subject.get(code_matiere, {}).values())
+    
+    def get_niveaux(self) -> List[str]:
+        """
+        Retourne la liste des niveaux ayant au moins un étudiant
+        
+        Returns:
+            List[str]: Niveaux/classes
+        """
+        return list(self._students_by_niveau.keys())
+    
+    # ========== ÉTUDIANTS ==========
+    
+    def add_student(self, student: Student):
+        """
+        Ajoute un étudiant
+        
+        Args:
+            student (Student): Étudiant à ajouter
+        """
+        self.students.append(student)
+        self._index_student(student)
+        self._notify('add', student)
+    
+    def update_student(self, student: Student, nom: str, prenom: str, niveau: str):
+        """
+        Modifie les champs modifiables d'un étudiant
+        
+        Args:
+            student (Student): Étudiant à modifier
+            nom (str): Nouveau nom
+            prenom (str): Nouveau prénom
+            niveau (str): Nouveau niveau
+        """
+        # Seul l'index par niveau dépend des champs modifiables
+        self._unindex_student_niveau(student)
+        student.nom = nom
+        student.prenom = prenom
+        student.niveau = niveau
+        self._students_by_niveau.setdefault(student.niveau, {})[id(student)] = student
+        self._notify('update', student)
+    
+    def remove_student(self, student: Student):
+        """
+        Supprime un étudiant ainsi que toutes ses notes
+        
+        Args:
+            student (Student): Étudiant à supprimer
+        """
+        self._remove_grades(self.get_grades_by_student(student.matricule))
+        self._unindex_student(student)
+        self.students.remove(student)
+        self._notify('delete', student)
+    
+    # ========== MATIÈRES ==========
+    
+    def add_subject(self, subject: Subject):
+        """
+        Ajoute une matière
+        
+        Args:
+            subject (Subject): Matière à ajouter
+        """
+        self.subjects.append(subject)
+        self._subjects_by_code.setdefault(subject.code, subject)
+        self._notify('add', subject)
+    
+    def update_subject(self, subject: Subject, nom: str, coefficient: float, niveau: str):
+        """
+        Modifie les champs modifiables d'une matière
+        
+        Args:
+            subject (Subject): Matière à modifier
+            nom (str): Nouveau nom
+            coefficient (float): Nouveau coefficient
+            niveau (str): Nouveau niveau
+        """
+        subject.nom = nom
+        subject.coefficient = coefficient
+        subject.niveau = niveau
+        self._notify('update', subject)
+    
+    def remove_subject(self, subject: Subject):
+        """
+        Supprime une matière ainsi que toutes ses notes
+        
+        Args:
+            subject (Subject): Matière à supprimer
+        """
+        self._remove_grades(self.get_grades_by_subject(subject.code))
+        if self._subjects_by_code.get(subject.code) is subject:
+            del self._subjects_by_code[subject.code]
+            for other in self.subjects:
+                if other.code == subject.code and other is not subject:
+                    self._subjects_by_code[other.code] = other
+                    break
+        self.subjects.remove(subject)
+        self._notify('delete', subject)
+    
+    # ========== NOTES ==========
+    
+    def add_grade(self, grade: Grade):
+        """
+        Ajoute une note
+        
+        Args:
+            grade (Grade): Note à ajouter
+        """
+        self.grades.append(grade)
+        self._index_grade(grade)
+        self._notify('add', grade)
+    
+    def update_grade(self, grade: Grade, note: float):
+        """
+        Modifie la valeur d'une note
+        
+        Args:
+            grade (Grade): Note à modifier
+            note (float): Nouvelle valeur
+        """
+        grade.note = note
+        self._notify('update', grade)
+    
+    def remove_grade(self, grade: Grade):
+        """
+        Supprime une note
+        
+        Args:
+            grade (Grade): Note à supprimer
+        """
+        self._unindex_grade(grade)
+        self.grades.remove(grade)
+        self._notify('delete', grade)
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+"""
+Module de stockage SQLite pour les étudiants, matières et notes
+Offre la même interface que FileManager avec en plus des opérations ligne par ligne
+"""
+
+import os
+import sqlite3
+from typing import List, Dict, Any
+from services.file_manager import FileManager
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL,
+    prenom TEXT NOT NULL,
+    matricule TEXT NOT NULL,
+    niveau TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_students_matricule ON students (matricule);
+CREATE INDEX IF NOT EXISTS idx_students_niveau ON students (niveau);
+
+CREATE TABLE IF NOT EXISTS subjects (
+    id INTEGER PRIMARY KEY,
+    nom TEXT NOT NULL,
+    code TEXT NOT NULL,
+    coefficient REAL NOT NULL,
+    niveau TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_subjects_code ON subjects (code);
+CREATE INDEX IF NOT EXISTS idx_subjects_niveau ON subjects (niveau);
+
+CREATE TABLE IF NOT EXISTS grades (
+    id INTEGER PRIMARY KEY,
+    matricule_etudiant TEXT NOT NULL,
+    code_matiere TEXT NOT NULL,
+    note REAL NOT NULL,
+    date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_grades_matricule ON grades (matricule_etudiant, code_matiere);
+CREATE INDEX IF NOT EXISTS idx_grades_code_matiere ON grades (code_matiere);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class SQLiteFileManager(FileManager):
+    """
+    Gestionnaire de stockage basé sur SQLite
+
+    Les étudiants, matières et notes sont stockés dans des tables indexées.
+    La configuration reste dans config.json comme pour FileManager.
+    Comme dans les fichiers JSON, une clé (matricule, code, couple
+    étudiant/matière) peut apparaître sur plusieurs lignes : une modification
+    ou une suppression ne vise que la première, celle qu'indexe le dépôt.
+    """
+
+    def __init__(self, data_dir='data', db_name='grades.db'):
+        """
+        Initialise le stockage SQLite et migre les fichiers JSON existants au premier lancement
+
+        Args:
+            data_dir (str): Répertoire où sont stockées les données
+            db_name (str): Nom du fichier de base de données
+        """
+        super().__init__(data_dir)
+        self.db_path = os.path.join(data_dir, db_name)
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+
+        if not self._is_migrated():
+            self.migrate_from_json()
+
+    def close(self):
+        """Ferme la connexion à la base de données"""
+        self.connection.close()
+
+    def supports_row_updates(self, collection: str) -> bool:
+        """
+        Indique que toutes les collections acceptent les opérations ligne par ligne
+
+        Args:
+            collection (str): 'students', 'subjects' ou 'grades'
+
+        Returns:
+            bool: Toujours True
+        """
+        return True
+
+    def _execute(self, statements: List[tuple]) -> bool:
+        """
+        Exécute une suite de requêtes dans une seule transaction
+
+        Args:
+            statements (List[tuple]): Liste de (requête, paramètres, plusieurs_lignes)
+
+        Returns:
+            bool: True si la transaction a réussi, False sinon
+        """
+        try:
+            with self.connection:
+                for sql, params, many in statements:
+                    if many:
+                        self.connection.executemany(sql, params)
+                    else:
+                        self.connection.execute(sql, params)
+            return True
+        except sqlite3.Error as e:
+            print(f"Erreur lors de l'écriture dans {self.db_path}: {e}")
+            return False
+
+    def _select(self, sql: str) -> List[Dict[str, Any]]:
+        """
+        Exécute une requête de lecture et retourne des dictionnaires
+
+        Args:
+            sql (str): Requête SELECT
+
+        Returns:
+            List[Dict]: Lignes lues, ou une liste vide en cas d'erreur
+        """
+        try:
+            return [dict(row) for row in self.connection.execute(sql)]
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la lecture de {self.db_path}: {e}")
+            return []
+
+    # ========== MIGRATION ==========
+
+    def _is_migrated(self) -> bool:
+        """Indique si la migration depuis les fichiers JSON a déjà eu lieu"""
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'migrated_from_json'").fetchone()
+        return row is not None
+
+    def migrate_from_json(self) -> bool:
+        """
+        Importe en une fois students.json, subjects.json et grades.json dans la base
+
+        Les fichiers JSON ne sont pas modifiés. La migration n'est exécutée
+        automatiquement qu'au premier lancement.
+
+        Returns:
+            bool: True si la migration a réussi
+        """
+        statements = self._replace_statements('students', self._read_json('students.json'))
+        statements += self._replace_statements('subjects', self._read_json('subjects.json'))
+        statements += self._replace_statements('grades', self._read_json('grades.json'))
+        statements.append(("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from_json', '1')", (), False))
+        return self._execute(statements)
+
+    def _replace_statements(self, table: str, rows: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        Prépare le remplacement complet du contenu d'une table
+
+        Args:
+            table (str): Nom de la table
+            rows (List[Dict]): Nouvelles lignes
+
+        Returns:
+            List[tuple]: Requêtes à exécuter dans une transaction
+        """
+        if table == 'students':
+            sql = "INSERT INTO students (nom, prenom, matricule, niveau) VALUES (?, ?, ?, ?)"
+            params = [(r.get('nom', ''), r.get('prenom', ''), r.get('matricule', ''), r.get('niveau', ''))
+                      for r in rows]
+        elif table == 'subjects':
+            sql = "INSERT INTO subjects (nom, code, coefficient, niveau) VALUES (?, ?, ?, ?)"
+            params = [(r.get('nom', ''), r.get('code', ''), r.get('coefficient', 1.0), r.get('niveau', ''))
+                      for r in rows]
+        else:
+            sql = "INSERT INTO grades (matricule_etudiant, code_matiere, note, date) VALUES (?, ?, ?, ?)"
+            params = [(r.get('matricule_etudiant', ''), r.get('code_matiere', ''), r.get('note', 0.0), r.get('date'))
+                      for r in rows]
+        return [(f"DELETE FROM {table}", (), False), (sql, params, True)]
+
+    # ========== GESTION DES ÉTUDIANTS ==========
+
+    def load_students(self) -> List[Dict[str, Any]]:
+        """
+        Charge la liste des étudiants depuis la base
+
+        Returns:
+            List[Dict]: Liste des étudiants
+        """
+        return self._select("SELECT nom, prenom, matricule, niveau FROM students ORDER BY id")
+
+    def save_students(self, students: List[Dict[str, Any]]) -> bool:
+        """
+        Remplace la liste des étudiants dans la base
+
+        Args:
+            students (List[Dict]): Liste des étudiants à sauvegarder
+
+        Returns:
+            bool: True si la sauvegarde a réussi
+        """
+        return self._execute(self._replace_statements('students', students))
+
+    def insert_student(self, student: Dict[str, Any]) -> bool:
+        """
+        Ajoute un étudiant
+
+        Args:
+            student (Dict): Étudiant à ajouter
+
+        Returns:
+            bool: True si l'ajout a réussi
+        """
+        return self._execute([(
+            "INSERT INTO students (nom, prenom, matricule, niveau) VALUES (?, ?, ?, ?)",
+            (student['nom'], student['prenom'], student['matricule'], student['niveau']), False
+        )])
+
+    def update_student(self, student: Dict[str, Any]) -> bool:
+        """
+        Met à jour un étudiant identifié par son matricule
+
+        Args:
+            student (Dict): Étudiant modifié
+
+        Returns:
+            bool: True si la mise à jour a réussi
+        """
+        return self._execute([(
+            "UPDATE students SET nom = ?, prenom = ?, niveau = ? WHERE id = (SELECT MIN(id) FROM students WHERE matricule = ?)",
+            (student['nom'], student['prenom'], student['niveau'], student['matricule']), False
+        )])
+
+    def delete_student(self, matricule: str) -> bool:
+        """
+        Supprime un étudiant ainsi que toutes ses notes
+
+        Args:
+            matricule (str): Matricule de l'étudiant
+
+        Returns:
+            bool: True si la suppression a réussi
+        """
+        return self._execute([
+            ("DELETE FROM grades WHERE matricule_etudiant = ?", (matricule,), False),
+            ("DELETE FROM students WHERE id = (SELECT MIN(id) FROM students WHERE matricule = ?)", (matricule,), False),
+        ])
+
+    # ========== GESTION DES MATIÈRES ==========
+
+    def load_subjects(self) -> List[Dict[str, Any]]:
+        """
+        Charge la liste des matières depuis la base
+
+        Returns:
+            List[Dict]: Liste des matières
+        """
+        return self._select("SELECT nom, code, coefficient, niveau FROM subjects ORDER BY id")
+
+    def save_subjects(self, subjects: List[Dict[str, Any]]) -> bool:
+        """
+        Remplace la liste des matières dans la base
+
+        Args:
+            subjects (List[Dict]): Liste des matières à sauvegarder
+
+        Returns:
+            bool: True si la sauvegarde a réussi
+        """
+        return self._execute(self._replace_statements('subjects', subjects))
+
+    def insert_subject(self, subject: Dict[str, Any]) -> bool:
+        """
+        Ajoute une matière
+
+        Args:
+            subject (Dict): Matière à ajouter
+
+        Returns:
+            bool: True si l'ajout a réussi
+        """
+        return self._execute([(
+            "INSERT INTO subjects (nom, code, coefficient, niveau) VALUES (?, ?, ?, ?)",
+            (subject['nom'], subject['code'], subject['coefficient'], subject['niveau']), False
+        )])
+
+    def update_subject(self, subject: Dict[str, Any]) -> bool:
+        """
+        Met à jour une matière identifiée par son code
+
+        Args:
+            subject (Dict): Matière modifiée
+
+        Returns:
+            bool: True si la mise à jour a réussi
+        """
+        return self._execute([(
+            "UPDATE subjects SET nom = ?, coefficient = ?, niveau = ? WHERE id = (SELECT MIN(id) FROM subjects WHERE code = ?)",
+            (subject['nom'], subject['coefficient'], subject['niveau'], subject['code']), False
+        )])
+
+    def delete_subject(self, code: str) -> bool:
+        """
+        Supprime une matière ainsi que toutes ses notes
+
+        Args:
+            code (str): Code de la matière
+
+        Returns:
+            bool: True si la suppression a réussi
+        """
+        return self._execute([
+            ("DELETE FROM grades WHERE code_matiere = ?", (code,), False),
+            ("DELETE FROM subjects WHERE id = (SELECT MIN(id) FROM subjects WHERE code = ?)", (code,), False),
+        ])
+
+    # ========== GESTION DES NOTES ==========
+
+    def load_grades(self) -> List[Dict[str, Any]]:
+        """
+        Charge la liste des notes depuis la base
+
+        Returns:
+            List[Dict]: Liste des notes
+        """
+        return self._select("SELECT matricule_etudiant, code_matiere, note, date FROM grades ORDER BY id")
+
+    def save_grades(self, grades: List[Dict[str, Any]]) -> bool:
+        """
+        Remplace la liste des notes dans la base
+
+        Args:
+            grades (List[Dict]): Liste des notes à sauvegarder
+
+        Returns:
+            bool: True si la sauvegarde a réussi
+        """
+        return self._execute(self._replace_statements('grades', grades))
+
+    def insert_grade(self, grade: Dict[str, Any]) -> bool:
+        """
+        Ajoute une note
+
+        Args:
+            grade (Dict): Note à ajouter
+
+        Returns:
+            bool: True si l'ajout a réussi
+        """
+        return self._execute([(
+            "INSERT INTO grades (matricule_etudiant, code_matiere, note, date) VALUES (?, ?, ?, ?)",
+            (grade['matricule_etudiant'], grade['code_matiere'], grade['note'], grade['date']), False
+        )])
+
+    def update_grade(self, grade: Dict[str, Any]) -> bool:
+        """
+        Met à jour une note identifiée par le couple (matricule, code matière)
+
+        Args:
+            grade (Dict): Note modifiée
+
+        Returns:
+            bool: True si la mise à jour a réussi
+        """
+        return self._execute([(
+            "UPDATE grades SET note = ?, date = ? WHERE id = (SELECT MIN(id) FROM grades "
+            "WHERE matricule_etudiant = ? AND code_matiere = ?)",
+            (grade['note'], grade['date'], grade['matricule_etudiant'], grade['code_matiere']), False
+        )])
+
+    def delete_grade(self, matricule: str, code_matiere: str) -> bool:
+        """
+        Supprime une note
+
+        Args:
+            matricule (str): Matricule de l'étudiant
+            code_matiere (str): Code de la matière
+
+        Returns:
+            bool: True si la suppression a réussi
+        """
+        return self._execute([(
+            "DELETE FROM grades WHERE id = (SELECT MIN(id) FROM grades "
+            "WHERE matricule_etudiant = ? AND code_matiere = ?)",
+            (matricule, code_matiere), False
+        )])
@@ -8,14 +8,24 @@ from typing import List, Dict, Any, Tuple, Optional
 from models.student import Student
 from models.subject import Subject
 from models.grade import Grade
+from services.aggregation import Aggregates, aggregate
+from services.vectorized_aggregation import NUMPY_AVAILABLE, aggregate_vectorized
+from services.repository import DataRepository
 
 
 class Statistics:
     """
     Classe pour calculer toutes les statistiques académiques
+    
+    Moyennes, rangs et classements sont mémorisés. Lorsqu'un dépôt partagé est
+    fourni, ils restent valables tant que la version du dépôt ne change pas.
     """
     
-    def __init__(self, students: List[Student], subjects: List[Subject], grades: List[Grade]):
+    # Moteurs de calcul disponibles ('auto' choisit numpy s'il est installé)
+    BACKENDS = ('python', 'numpy', 'auto')
+    
+    def __init__(self, students: List[Student], subjects: List[Subject], grades: List[Grade],
+                 repository: Optional[DataRepository] = None, backend: str = 'python'):
         """
         Initialise le calculateur de statistiques
         
@@ -23,10 +33,96 @@ class Statistics:
             students (List[Student]): Liste des étudiants
             subjects (List[Subject]): Liste des matières
             grades (List[Grade]): Liste des notes
+            repository (DataRepository, optional): Dépôt indexé partagé.
+                S'il est absent, un dépôt est construit à la demande à partir des listes
+            backend (str): Moteur de calcul : 'python', 'numpy' (vectorisé) ou 'auto'
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Moteur de statistiques inconnu : {backend}")
+        if backend == 'numpy' and not NUMPY_AVAILABLE:
+            raise ImportError("Le moteur 'numpy' nécessite le paquet numpy")
+        # Avec 'auto', un numpy présent mais inutilisable fait revenir au moteur Python
+        self._fallback = backend == 'auto'
+        if backend == 'auto':
+            backend = 'numpy' if NUMPY_AVAILABLE else 'python'
+        
         self.students = students
         self.subjects = subjects
         self.grades = grades
+        self._repository = repository
+        self._shared_repository = repository is not None
+        self._aggregates: Optional[Aggregates] = None
+        self._aggregates_version: Optional[int] = None
+        self.backend = backend
+    
+    @classmethod
+    def for_repository(cls, repository: DataRepository, backend: str = 'python') -> 'Statistics':
+        """
+        Crée le calculateur partagé d'un dépôt
+        
+        Une seule instance suffit pour toute la durée de vie du dépôt : ses
+        résultats sont recalculés dès que la version du dépôt change, y compris
+        après un rechargement complet (load()).
+        
+        Args:
+            repository (DataRepository): Dépôt indexé partagé
+            backend (str): Moteur de calcul
+        
+        Returns:
+            Statistics: Calculateur lié au dépôt
+        """
+        return cls(repository.students, repository.subjects, repository.grades, repository, backend)
+    
+    @staticmethod
+    def snapshot(students: List[Student], subjects: List[Subject], grades: List[Grade]) -> Tuple[tuple, tuple, tuple]:
+        """
+        Copie les données dans un instantané transmissible à un autre thread
+        
+        À appeler dans le thread qui possède les données : l'instantané ne
+        partage aucun objet modifiable avec elles.
+        
+        Args:
+            students (List[Student]): Liste des étudiants
+            subjects (List[Subject]): Liste des matières
+            grades (List[Grade]): Liste des notes
+        
+        Returns:
+            Tuple[tuple, tuple, tuple]: Dictionnaires (to_dict) des étudiants, matières et notes
+        """
+        return (tuple(student.to_dict() for student in students),
+                tuple(subject.to_dict() for subject in subjects),
+                tuple(grade.to_dict() for grade in grades))
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: Tuple[tuple, tuple, tuple], backend: str = 'auto') -> 'Statistics':
+        """
+        Crée un calculateur sur des objets reconstruits à partir d'un instantané
+        
+        Les objets sont recréés sans nettoyage (from_dicts) : les résultats sont
+        ceux qu'aurait donnés un calcul sur les données d'origine.
+        
+        Args:
+            snapshot (Tuple[tuple, tuple, tuple]): Résultat de snapshot()
+            backend (str): Moteur de calcul
+        
+        Returns:
+            Statistics: Calculateur propre à l'appelant
+        """
+        students, subjects, grades = snapshot
+        return cls(Student.from_dicts(students), Subject.from_dicts(subjects), Grade.from_dicts(grades),
+                   backend=backend)
+    
+    @property
+    def repository(self) -> DataRepository:
+        """
+        Dépôt indexé utilisé pour les recherches par clé
+        
+        Returns:
+            DataRepository: Dépôt partagé ou construit à partir des listes
+        """
+        if self._repository is None:
+            self._repository = DataRepository(self.students, self.subjects, self.grades)
+        return self._repository
     
     def _get_student_by_matricule(self, matricule: str) -> Optional[Student]:
         """
@@ -38,10 +134,7 @@ class Statistics:
         Returns:
             Optional[Student]: L'étudiant trouvé ou None
         """
-        for student in self.students:
-            if student.matricule == matricule:
-                return student
-        return None
+        return self.repository.get_student(matricule)
     
     def _get_subject_by_code(self, code: str) -> Optional[Subject]:
         """
@@ -53,10 +146,7 @@ class Statistics:
         Returns:
             Optional[Subject]: La matière trouvée ou None
         """
-        for subject in self.subjects:
-            if subject.code == code:
-                return subject
-        return None
+        return self.repository.get_subject(code)
     
     def _get_grades_by_matricule(self, matricule: str) -> List[Grade]:
         """
@@ -68,7 +158,7 @@ class Statistics:
         Returns:
             List[Grade]: Liste des notes de l'étudiant
         """
-        return [g for g in self.grades if g.matricule_etudiant == matricule]
+        return self.repository.get_grades_by_student(matricule)
     
     def _get_grades_by_code_matiere(self, code_matiere: str) -> List[Grade]:
         """
@@ -80,7 +170,7 @@ class Statistics:
         Returns:
             List[Grade]: Liste des notes de la matière
         """
-        return [g for g in self.grades if g.code_matiere == code_matiere]
+        return self.repository.get_grades_by_subject(code_matiere)
     
     def _get_grades_by_niveau(self, niveau: str) -> List[Grade]:
         """
@@ -92,10 +182,52 @@ class Statistics:
         Returns:
             List[Grade]: Liste des notes du niveau
         """
-        # Récupérer les matricules des étudiants du niveau
-        matricules = [s.matricule for s in self.students if s.niveau == niveau]
-        # Récupérer les notes de ces étudiants
-        return [g for g in self.grades if g.matricule_etudiant in matricules]
+        grades = []
+        for student in self.repository.get_students_by_niveau(niveau):
+            grades.extend(self.repository.get_grades_by_student(student.matricule))
+        return grades
+    
+    @property
+    def data_version(self) -> Optional[int]:
+        """
+        Version des données utilisées pour le calcul
+        
+        Returns:
+            Optional[int]: Version du dépôt partagé, ou None sans dépôt partagé
+                (les listes sont alors considérées comme figées)
+        """
+        if not self._shared_repository:
+            return None
+        return self._repository.version
+    
+    @property
+    def aggregates(self) -> Aggregates:
+        """
+        Résultat de l'agrégation en un seul passage, recalculé si les données ont changé
+        
+        Returns:
+            Aggregates: Moyennes, classements et rangs de tout l'établissement
+        """
+        version = self.data_version
+        if self._aggregates is None or version != self._aggregates_version:
+            self._aggregates = None
+            if self._shared_repository:
+                # load() remplace les listes du dépôt
+                self.students = self._repository.students
+                self.subjects = self._repository.subjects
+                self.grades = self._repository.grades
+            if self.backend == 'numpy':
+                try:
+                    self._aggregates = aggregate_vectorized(self.students, self.subjects, self.grades,
+                                                            self._repository)
+                except ImportError:
+                    if not self._fallback:
+                        raise
+                    self.backend = 'python'
+            if self._aggregates is None:
+                self._aggregates = aggregate(self.students, self.subjects, self.grades, self._repository)
+            self._aggregates_version = version
+        return self._aggregates
     
     # ========== STATISTIQUES PAR ÉTUDIANT ==========
     
@@ -109,27 +241,7 @@ class Statistics:
         Returns:
             Optional[float]: Moyenne générale ou None si aucune note
         """
-        student = self._get_student_by_matricule(matricule)
-        if not student:
-            return None
-        
-        student_grades = self._get_grades_by_matricule(matricule)
-        if not student_grades:
-            return None
-        
-        total_points = 0.0
-        total_coefficients = 0.0
-        
-        for grade in student_grades:
-            subject = self._get_subject_by_code(grade.code_matiere)
-            if subject and subject.niveau == student.niveau:
-                total_points += grade.note * subject.coefficient
-                total_coefficients += subject.coefficient
-        
-        if total_coefficients == 0:
-            return None
-        
-        return total_points / total_coefficients
+        return self.aggregates.student_averages.get(matricule)
     
     def calculate_student_rank(self, matricule: str) -> Optional[int]:
         """
@@ -141,29 +253,7 @@ class Statistics:
         Returns:
             Optional[int]: Rang de l'étudiant (1 = premier) ou None
         """
-        student = self._get_student_by_matricule(matricule)
-        if not student:
-            return None
-        
-        # Récupérer tous les étudiants du même niveau
-        class_students = [s for s in self.students if s.niveau == student.niveau]
-        
-        # Calculer la moyenne de chaque étudiant
-        averages = []
-        for s in class_students:
-            avg = self.calculate_student_average(s.matricule)
-            if avg is not None:
-                averages.append((s.matricule, avg))
-        
-        # Trier par moyenne décroissante
-        averages.sort(key=lambda x: x[1], reverse=True)
-        
-        # Trouver le rang
-        for rank, (mat, avg) in enumerate(averages, start=1):
-            if mat == matricule:
-                return rank
-        
-        return None
+        return self.aggregates.student_ranks.get(matricule)
     
     # ========== STATISTIQUES PAR CLASSE ==========
     
@@ -177,20 +267,7 @@ class Statistics:
         Returns:
             Optional[float]: Moyenne générale de la classe ou None
         """
-        class_students = [s for s in self.students if s.niveau == niveau]
-        if not class_students:
-            return None
-        
-        averages = []
-        for student in class_students:
-            avg = self.calculate_student_average(student.matricule)
-            if avg is not None:
-                averages.append(avg)
-        
-        if not averages:
-            return None
-        
-        return sum(averages) / len(averages)
+        return self.aggregates.class_averages.get(niveau)
     
     def get_best_student_in_class(self, niveau: str) -> Optional[Tuple[Student, float]]:
         """
@@ -202,21 +279,10 @@ class Statistics:
         Returns:
             Optional[Tuple[Student, float]]: (Étudiant, moyenne) ou None
         """
-        class_students = [s for s in self.students if s.niveau == niveau]
-        if not class_students:
-            return None
-        
-        best_student = None
-        best_average = -1.0
-        
-        for student in class_students:
-            avg = self.calculate_student_average(student.matricule)
-            if avg is not None and avg > best_average:
-                best_average = avg
-                best_student = student
-        
-        if best_student:
-            return (best_student, best_average)
+        ranking = self.aggregates.class_rankings.get(niveau)
+        if ranking:
+            student, avg, _ = ranking[0]
+            return (student, avg)
         return None
     
     def get_class_ranking(self, niveau: str) -> List[Tuple[Student, float, int]]:
@@ -229,24 +295,20 @@ class Statistics:
         Returns:
             List[Tuple[Student, float, int]]: Liste de (étudiant, moyenne, rang)
         """
-        class_students = [s for s in self.students if s.niveau == niveau]
-        
-        # Calculer la moyenne de chaque étudiant
-        student_averages = []
-        for student in class_students:
-            avg = self.calculate_student_average(student.matricule)
-            if avg is not None:
-                student_averages.append((student, avg))
+        return list(self.aggregates.class_rankings.get(niveau, []))
         
-        # Trier par moyenne décroissante
-        student_averages.sort(key=lambda x: x[1], reverse=True)
+    def get_top_students(self, niveau: str, count: int) -> List[Tuple[Student, float, int]]:
+        """
+        Obtient les premiers du classement d'une classe
         
-        # Ajouter le rang
-        ranking = []
-        for rank, (student, avg) in enumerate(student_averages, start=1):
-            ranking.append((student, avg, rank))
+        Args:
+            niveau (str): Niveau/classe
+            count (int): Nombre d'étudiants voulus
         
-        return ranking
+        Returns:
+            List[Tuple[Student, float, int]]: Liste de (étudiant, moyenne, rang)
+        """
+        return self.aggregates.class_rankings.get(niveau, [])[:max(count, 0)]
     
     # ========== STATISTIQUES PAR MATIÈRE ==========
     
@@ -260,12 +322,7 @@ class Statistics:
         Returns:
             Optional[float]: Moyenne générale de la matière ou None
         """
-        subject_grades = self._get_grades_by_code_matiere(code_matiere)
-        if not subject_grades:
-            return None
-        
-        total = sum(g.note for g in subject_grades)
-        return total / len(subject_grades)
+        return self.aggregates.subject_averages.get(code_matiere)
     
     def get_best_student_in_subject(self, code_matiere: str) -> Optional[Tuple[Student, float]]:
         """
@@ -277,17 +334,7 @@ class Statistics:
         Returns:
             Optional[Tuple[Student, float]]: (Étudiant, note) ou None
         """
-        subject_grades = self._get_grades_by_code_matiere(code_matiere)
-        if not subject_grades:
-            return None
-        
-        # Trouver la meilleure note
-        best_grade = max(subject_grades, key=lambda g: g.note)
-        best_student = self._get_student_by_matricule(best_grade.matricule_etudiant)
-        
-        if best_student:
-            return (best_student, best_grade.note)
-        return None
+        return self.aggregates.subject_best.get(code_matiere)
     
     # ========== STATISTIQUES GLOBALES ==========
     
@@ -298,11 +345,7 @@ class Statistics:
         Returns:
             Optional[float]: Moyenne générale globale ou None
         """
-        if not self.grades:
-            return None
-        
-        total = sum(g.note for g in self.grades)
-        return total / len(self.grades)
+        return self.aggregates.global_average
     
     def get_best_student_global(self) -> Optional[Tuple[Student, float]]:
         """
@@ -311,19 +354,4 @@ class Statistics:
         Returns:
             Optional[Tuple[Student, float]]: (Étudiant, moyenne) ou None
         """
-        if not self.students:
-            return None
-        
-        best_student = None
-        best_average = -1.0
-        
-        for student in self.students:
-            avg = self.calculate_student_average(student.matricule)
-            if avg is not None and avg > best_average:
-                best_average = avg
-                best_student = student
-        
-        if best_student:
-            return (best_student, best_average)
-        return None
-
+        return self.aggregates.best_student_global
@@ -0,0 +1,419 @@
+# -*- coding: utf-8 -*-
+"""
+Module des statistiques maintenues incrémentalement
+Met à jour sommes et compteurs à chaque note ajoutée, modifiée ou supprimée
+"""
+
+from typing import List, Dict, Tuple, Optional
+from models.student import Student
+from models.grade import Grade
+from services.repository import DataRepository
+from services.ranking_index import RankingIndex
+
+
+class StatsStore:
+    """
+    Statistiques académiques tenues à jour au fil des modifications du dépôt
+    
+    Le magasin conserve des sommes pondérées et des totaux de coefficients par
+    étudiant, des sommes et effectifs par matière, ainsi que la somme globale.
+    Une note ajoutée est la dernière de la liste : l'ajouter aux sommes refait
+    exactement l'opération suivante d'une agrégation complète, en O(1). Une
+    note modifiée ou supprimée fait recalculer la somme de son étudiant à
+    partir de ses notes, dans l'ordre de la liste ; les sommes de sa matière et
+    la somme globale sont recalculées de la même façon au prochain accès, tout
+    comme la moyenne d'une classe dont un membre a changé de moyenne. Les
+    modifications d'étudiants ou de matières, plus rares, provoquent un
+    recalcul complet au prochain accès.
+    
+    Chaque classe consultée reçoit un RankingIndex : une variation de moyenne
+    y déplace un seul étudiant sans trier à nouveau la classe, et le rang d'un
+    étudiant se lit par recherche dichotomique.
+    
+    Les sommes sont ainsi calculées avec les mêmes opérations flottantes, dans
+    le même ordre, que dans Statistics : les méthodes de lecture ont les mêmes
+    noms et renvoient exactement les mêmes valeurs.
+    """
+    
+    def __init__(self, repository: DataRepository):
+        """
+        Initialise le magasin et s'abonne aux modifications du dépôt
+        
+        Args:
+            repository (DataRepository): Dépôt dont les données sont suivies
+        """
+        self.repository = repository
+        self._dirty = True
+        repository.add_listener(self._on_change)
+    
+    def _reset(self):
+        """Remet à zéro toutes les valeurs maintenues"""
+        # Par étudiant (matricule) : sommes des notes comptées dans sa moyenne
+        self._student_points: Dict[str, float] = {}
+        self._student_coefficients: Dict[str, float] = {}
+        # Par matière (code) : sommes à recalculer pour les codes de _stale_subjects
+        self._subject_totals: Dict[str, float] = {}
+        self._subject_counts: Dict[str, int] = {}
+        self._stale_subjects = set()
+        # Somme de toutes les notes (None : à recalculer)
+        self._global_total: Optional[float] = 0.0
+        # Structure des classes, dans l'ordre de la liste des étudiants
+        self._class_members: Dict[str, List[Student]] = {}
+        self._members_by_matricule: Dict[str, List[Student]] = {}
+        self._positions: Dict[int, int] = {}
+        # Résultats dérivés, calculés à la demande
+        self._indexes: Dict[str, RankingIndex] = {}
+        self._class_averages: Dict[str, Optional[float]] = {}
+        self._subject_best: Dict[str, Optional[Tuple[Student, float]]] = {}
+    
+    def _rebuild(self):
+        """Recalcule toutes les valeurs à partir du dépôt"""
+        self._reset()
+        for position, student in enumerate(self.repository.students):
+            self._class_members.setdefault(student.niveau, []).append(student)
+            self._members_by_matricule.setdefault(student.matricule, []).append(student)
+            self._positions[id(student)] = position
+        for grade in self.repository.grades:
+            self._add_grade(grade)
+        self._dirty = False
+    
+    def _ensure_built(self):
+        """Recalcule les valeurs si elles ont été invalidées"""
+        if self._dirty:
+            self._rebuild()
+    
+    # ========== MISE À JOUR ==========
+    
+    def _on_change(self, action: str, entity):
+        """
+        Met à jour les valeurs après une modification du dépôt
+        
+        Args:
+            action (str): 'add', 'update', 'delete' ou 'load'
+            entity: Entité modifiée (None pour 'load')
+        """
+        if action == 'load' or not isinstance(entity, Grade):
+            self._dirty = True
+            return
+        if self._dirty:
+            return
+        
+        if action == 'add':
+            self._add_grade(entity)
+        else:
+            self._refresh_grade(entity, action == 'delete')
+    
+    def _weight(self, grade: Grade) -> Optional[float]:
+        """
+        Retourne le coefficient d'une note si elle compte dans la moyenne de l'étudiant
+        
+        Args:
+            grade (Grade): Note concernée
+        
+        Returns:
+            Optional[float]: Coefficient de la matière, ou None si la note ne compte pas
+        """
+        student = self.repository.get_student(grade.matricule_etudiant)
+        subject = self.repository.get_subject(grade.code_matiere)
+        if student and subject and subject.niveau == student.niveau:
+            return subject.coefficient
+        return None
+    
+    def _add_grade(self, grade: Grade):
+        """
+        Ajoute aux sommes maintenues une note placée en fin de liste
+        
+        Args:
+            grade (Grade): Note ajoutée
+        """
+        code = grade.code_matiere
+        note = grade.note
+        if self._global_total is not None:
+            self._global_total += note
+        self._subject_counts[code] = self._subject_counts.get(code, 0) + 1
+        if code not in self._stale_subjects:
+            self._subject_totals[code] = self._subject_totals.get(code, 0.0) + note
+        self._subject_best.pop(code, None)
+        
+        coefficient = self._weight(grade)
+        if coefficient is None:
+            return
+        
+        matricule = grade.matricule_etudiant
+        previous = self._student_average(matricule)
+        self._student_points[matricule] = self._student_points.get(matricule, 0.0) + note * coefficient
+        self._student_coefficients[matricule] = self._student_coefficients.get(matricule, 0.0) + coefficient
+        self._update_classes(matricule, previous)
+    
+    def _refresh_grade(self, grade: Grade, removed: bool):
+        """
+        Invalide les sommes touchées par une note modifiée ou supprimée
+        
+        La somme de l'étudiant est recalculée immédiatement (le classement de
+        sa classe en dépend) ; celles de la matière et la somme globale le
+        seront au prochain accès.
+        
+        Args:
+            grade (Grade): Note concernée
+            removed (bool): True si la note a été supprimée
+        """
+        code = grade.code_matiere
+        self._global_total = None
+        if removed:
+            count = self._subject_counts.get(code, 0) - 1
+            if count > 0:
+                self._subject_counts[code] = count
+            else:
+                self._subject_counts.pop(code, None)
+        self._subject_totals.pop(code, None)
+        self._stale_subjects.add(code)
+        self._subject_best.pop(code, None)
+        
+        if self._weight(grade) is None:
+            return
+        
+        matricule = grade.matricule_etudiant
+        previous = self._student_average(matricule)
+        points = 0.0
+        coefficients = 0.0
+        counted = False
+        # Notes de l'étudiant dans l'ordre de la liste, comme lors d'une agrégation complète
+        for other in self.repository.get_grades_by_student(matricule):
+            coefficient = self._weight(other)
+            if coefficient is not None:
+                points += other.note * coefficient
+                coefficients += coefficient
+                counted = True
+        if counted:
+            self._student_points[matricule] = points
+            self._student_coefficients[matricule] = coefficients
+        else:
+            self._student_points.pop(matricule, None)
+            self._student_coefficients.pop(matricule, None)
+        self._update_classes(matricule, previous)
+        
+    def _update_classes(self, matricule: str, previous: Optional[float]):
+        """
+        Reporte la variation de moyenne d'un étudiant sur ses classes et leurs classements
+        
+        Args:
+            matricule (str): Matricule de l'étudiant
+            previous (Optional[float]): Ancienne moyenne
+        """
+        average = self._student_average(matricule)
+        if average == previous:
+            return
+        for student in self._members_by_matricule.get(matricule, []):
+            niveau = student.niveau
+            self._class_averages.pop(niveau, None)
+            index = self._indexes.get(niveau)
+            if index is not None:
+                index.update(student, self._positions[id(student)], average)
+    
+    def _student_average(self, matricule: str) -> Optional[float]:
+        """Moyenne courante d'un étudiant à partir des sommes maintenues"""
+        coefficients = self._student_coefficients.get(matricule)
+        if not coefficients:
+            return None
+        return self._student_points[matricule] / coefficients
+    
+    # ========== STATISTIQUES PAR ÉTUDIANT ==========
+    
+    def calculate_student_average(self, matricule: str) -> Optional[float]:
+        """
+        Retourne la moyenne générale d'un étudiant (pondérée par les coefficients)
+        
+        Args:
+            matricule (str): Matricule de l'étudiant
+        
+        Returns:
+            Optional[float]: Moyenne générale ou None si aucune note
+        """
+        self._ensure_built()
+        return self._student_average(matricule)
+    
+    def calculate_student_rank(self, matricule: str) -> Optional[int]:
+        """
+        Retourne le rang d'un étudiant dans sa classe
+        
+        Args:
+            matricule (str): Matricule de l'étudiant
+        
+        Returns:
+            Optional[int]: Rang de l'étudiant (1 = premier) ou None
+        """
+        self._ensure_built()
+        student = self.repository.get_student(matricule)
+        if not student:
+            return None
+        return self._index(student.niveau).rank(self._positions[id(student)])
+    
+    # ========== STATISTIQUES PAR CLASSE ==========
+    
+    def calculate_class_average(self, niveau: str) -> Optional[float]:
+        """
+        Retourne la moyenne générale d'une classe
+        
+        Args:
+            niveau (str): Niveau/classe
+        
+        Returns:
+            Optional[float]: Moyenne générale de la classe ou None
+        """
+        self._ensure_built()
+        if niveau not in self._class_averages:
+            averages = [self._student_average(student.matricule)
+                        for student in self._class_members.get(niveau, [])]
+            averages = [avg for avg in averages if avg is not None]
+            self._class_averages[niveau] = sum(averages) / len(averages) if averages else None
+        return self._class_averages[niveau]
+    
+    def get_best_student_in_class(self, niveau: str) -> Optional[Tuple[Student, float]]:
+        """
+        Retourne le meilleur étudiant d'une classe
+        
+        Args:
+            niveau (str): Niveau/classe
+        
+        Returns:
+            Optional[Tuple[Student, float]]: (Étudiant, moyenne) ou None
+        """
+        ranking = self._index(niveau).top(1)
+        if ranking:
+            student, avg, _ = ranking[0]
+            return (student, avg)
+        return None
+    
+    def get_class_ranking(self, niveau: str) -> List[Tuple[Student, float, int]]:
+        """
+        Retourne le classement complet d'une classe
+        
+        Args:
+            niveau (str): Niveau/classe
+        
+        Returns:
+            List[Tuple[Student, float, int]]: Liste de (étudiant, moyenne, rang)
+        """
+        return self._index(niveau).top()
+    
+    def get_top_students(self, niveau: str, count: int) -> List[Tuple[Student, float, int]]:
+        """
+        Retourne les premiers du classement d'une classe
+        
+        Args:
+            niveau (str): Niveau/classe
+            count (int): Nombre d'étudiants voulus
+        
+        Returns:
+            List[Tuple[Student, float, int]]: Liste de (étudiant, moyenne, rang)
+        """
+        return self._index(niveau).top(count)
+    
+    def _index(self, niveau: str) -> RankingIndex:
+        """
+        Retourne l'index de classement d'une classe, construit au premier accès
+        
+        Args:
+            niveau (str): Niveau/classe
+        
+        Returns:
+            RankingIndex: Index tenu à jour par _update_classes()
+        """
+        self._ensure_built()
+        index = self._indexes.get(niveau)
+        if index is None:
+            entries = []
+            for student in self._class_members.get(niveau, []):
+                avg = self._student_average(student.matricule)
+                if avg is not None:
+                    entries.append((student, self._positions[id(student)], avg))
+            index = RankingIndex(entries)
+            self._indexes[niveau] = index
+        return index
+    
+    # ========== STATISTIQUES PAR MATIÈRE ==========
+    
+    def calculate_subject_average(self, code_matiere: str) -> Optional[float]:
+        """
+        Retourne la moyenne générale d'une matière
+        
+        Args:
+            code_matiere (str): Code de la matière
+        
+        Returns:
+            Optional[float]: Moyenne générale de la matière ou None
+        """
+        self._ensure_built()
+        count = self._subject_counts.get(code_matiere)
+        if not count:
+            return None
+        if code_matiere in self._stale_subjects:
+            total = 0.0
+            for grade in self.repository.get_grades_by_subject(code_matiere):
+                total += grade.note
+            self._subject_totals[code_matiere] = total
+            self._stale_subjects.discard(code_matiere)
+        return self._subject_totals[code_matiere] / count
+    
+    def get_best_student_in_subject(self, code_matiere: str) -> Optional[Tuple[Student, float]]:
+        """
+        Retourne le meilleur étudiant dans une matière
+        
+        Args:
+            code_matiere (str): Code de la matière
+        
+        Returns:
+            Optional[Tuple[Student, float]]: (Étudiant, note) ou None
+        """
+        self._ensure_built()
+        if code_matiere not in self._subject_best:
+            best = None
+            for grade in self.repository.get_grades_by_subject(code_matiere):
+                if best is None or grade.note > best.note:
+                    best = grade
+            result = None
+            if best is not None:
+                student = self.repository.get_student(best.matricule_etudiant)
+                if student:
+                    result = (student, best.note)
+            self._subject_best[code_matiere] = result
+        return self._subject_best[code_matiere]
+    
+    # ========== STATISTIQUES GLOBALES ==========
+    
+    def calculate_global_average(self) -> Optional[float]:
+        """
+        Retourne la moyenne générale de tout l'établissement
+        
+        Returns:
+            Optional[float]: Moyenne générale globale ou None
+        """
+        self._ensure_built()
+        grades = self.repository.grades
+        if not grades:
+            return None
+        if self._global_total is None:
+            total = 0.0
+            for grade in grades:
+                total += grade.note
+            self._global_total = total
+        return self._global_total / len(grades)
+    
+    def get_best_student_global(self) -> Optional[Tuple[Student, float]]:
+        """
+        Retourne le meilleur étudiant de tout l'établissement
+        
+        Returns:
+            Optional[Tuple[Student, float]]: (Étudiant, moyenne) ou None
+        """
+        self._ensure_built()
+        best = None
+        # Le premier de chaque classe suffit ; à égalité, le premier de la liste l'emporte
+        for niveau in self._class_members:
+            head = self.get_best_student_in_class(niveau)
+            if head is None:
+                continue
+            if (best is None or head[1] > best[1]
+                    or (head[1] == best[1] and self._positions[id(head[0])] < self._positions[id(best[0])])):
+                best = head
+        return best
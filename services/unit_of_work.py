@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+Module de l'unité de travail
+Enregistre les modifications faites via le dépôt et ne sauvegarde que celles-ci
+"""
+
+from typing import Dict, Tuple, Any
+from models.student import Student
+from models.subject import Subject
+from services.file_manager import FileManager
+from services.repository import DataRepository
+
+
+class UnitOfWork:
+    """
+    Unité de travail branchée sur un DataRepository
+    
+    Chaque ajout, modification ou suppression signalé par le dépôt est
+    enregistré par collection et par entité. commit() ne sauvegarde que
+    les collections touchées, ligne par ligne lorsque le stockage le permet.
+    """
+    
+    COLLECTIONS = ('students', 'subjects', 'grades')
+    
+    # Au-delà de ce nombre de modifications, la collection est réécrite en une
+    # seule opération plutôt que ligne par ligne (imports en masse)
+    ROW_COMMIT_LIMIT = 1000
+    
+    def __init__(self, file_manager: FileManager, repository: DataRepository):
+        """
+        Initialise l'unité de travail et s'abonne aux modifications du dépôt
+        
+        Args:
+            file_manager (FileManager): Stockage utilisé pour la sauvegarde
+            repository (DataRepository): Dépôt dont les modifications sont suivies
+        """
+        self.file_manager = file_manager
+        self.repository = repository
+        # Par collection : clé de l'entité -> (action, entité), dans l'ordre des modifications
+        self._changes: Dict[str, Dict[Tuple[str, ...], Tuple[str, Any]]] = {
+            name: {} for name in self.COLLECTIONS
+        }
+        repository.add_listener(self._on_change)
+    
+    @staticmethod
+    def _identify(entity) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Retourne la collection et la clé d'une entité
+        
+        Args:
+            entity: Student, Subject ou Grade
+        
+        Returns:
+            Tuple[str, Tuple]: (collection, clé)
+        """
+        if isinstance(entity, Student):
+            return 'students', (entity.matricule,)
+        if isinstance(entity, Subject):
+            return 'subjects', (entity.code,)
+        return 'grades', (entity.matricule_etudiant, entity.code_matiere)
+    
+    def _on_change(self, action: str, entity):
+        """
+        Enregistre une modification signalée par le dépôt
+        
+        Args:
+            action (str): 'add', 'update', 'delete' ou 'load'
+            entity: Entité modifiée (None pour 'load')
+        """
+        if action == 'load':
+            # Les données viennent d'être relues depuis le stockage
+            self.clear()
+            return
+        
+        collection, key = self._identify(entity)
+        changes = self._changes[collection]
+        previous = changes.pop(key, None)
+        previous_action = previous[0] if previous else None
+        
+        if previous_action == 'add':
+            # Une entité jamais sauvegardée reste un ajout, ou disparaît si elle est supprimée
+            if action == 'delete':
+                return
+            action = 'add'
+        elif previous_action == 'delete' and action == 'add':
+            # Supprimée puis recréée : la ligne existe encore dans le stockage
+            action = 'update'
+        
+        changes[key] = (action, entity)
+    
+    def has_changes(self) -> bool:
+        """
+        Indique si des modifications sont en attente
+        
+        Returns:
+            bool: True si au moins une modification n'est pas sauvegardée
+        """
+        return any(self._changes.values())
+    
+    def touched_collections(self):
+        """
+        Retourne les collections ayant des modifications en attente
+        
+        Returns:
+            List[str]: Noms des collections touchées
+        """
+        return [name for name in self.COLLECTIONS if self._changes[name]]
+    
+    def clear(self):
+        """Oublie toutes les modifications en attente"""
+        for changes in self._changes.values():
+            changes.clear()
+    
+    def commit(self) -> bool:
+        """
+        Sauvegarde uniquement les collections et entités modifiées
+        
+        Les modifications dont la sauvegarde échoue restent en attente et
+        seront retentées au prochain commit().
+        
+        Returns:
+            bool: True si toutes les sauvegardes ont réussi
+        """
+        success = True
+        for collection in self.touched_collections():
+            if (self.file_manager.supports_row_updates(collection)
+                    and len(self._changes[collection]) <= self.ROW_COMMIT_LIMIT):
+                success = self._commit_rows(collection) and success
+            else:
+                success = self._commit_collection(collection) and success
+        return success
+    
+    def _commit_collection(self, collection: str) -> bool:
+        """
+        Réécrit une collection complète
+        
+        Args:
+            collection (str): Nom de la collection
+        
+        Returns:
+            bool: True si la sauvegarde a réussi (les modifications sont alors oubliées)
+        """
+        data = [entity.to_dict() for entity in getattr(self.repository, collection)]
+        if not getattr(self.file_manager, f'save_{collection}')(data):
+            return False
+        self._changes[collection].clear()
+        return True
+    
+    def _commit_rows(self, collection: str) -> bool:
+        """
+        Applique les modifications d'une collection ligne par ligne
+        
+        Args:
+            collection (str): Nom de la collection
+        
+        Returns:
+            bool: True si toutes les opérations ont réussi (seules les
+                modifications en échec restent en attente)
+        """
+        name = collection[:-1]
+        changes = self._changes[collection]
+        success = True
+        for key, (action, entity) in list(changes.items()):
+            if action == 'add':
+                result = getattr(self.file_manager, f'insert_{name}')(entity.to_dict())
+            elif action == 'update':
+                result = getattr(self.file_manager, f'update_{name}')(entity.to_dict())
+            else:
+                result = getattr(self.file_manager, f'delete_{name}')(*key)
+            if result:
+                del changes[key]
+            else:
+                success = False
+        return success
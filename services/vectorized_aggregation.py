@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Module d'agrégation vectorisée des statistiques académiques
+Calcule les mêmes résultats que services.aggregation avec des tableaux numpy
+"""
+
+import importlib.util
+from typing import List, Dict
+from models.student import Student
+from models.subject import Subject
+from models.grade import Grade
+from services.aggregation import Aggregates
+
+# numpy est cherché sans être importé : son import coûte plusieurs dizaines
+# de millisecondes, payées seulement au premier calcul vectorisé
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+_np = None
+
+
+def _numpy():
+    """
+    Importe numpy au premier appel
+    
+    Returns:
+        module: Module numpy, ou None s'il ne peut pas être importé
+    """
+    global _np, NUMPY_AVAILABLE
+    if _np is None and NUMPY_AVAILABLE:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            NUMPY_AVAILABLE = False
+    return _np
+
+
+def _grade_arrays(grades, student_positions: Dict[str, int], subject_positions: Dict[str, int]):
+    """
+    Convertit les notes en tableaux numpy (en parcourant la liste une seule fois)
+    
+    Args:
+        grades (List[Grade]): Liste des notes
+        student_positions (Dict[str, int]): Position de l'étudiant de référence par matricule
+        subject_positions (Dict[str, int]): Position de la matière de référence par code
+    
+    Returns:
+        tuple: (notes, positions des étudiants, positions des matières,
+            identifiants de code, code correspondant à chaque identifiant)
+    """
+    np = _numpy()
+    notes = np.fromiter((grade.note for grade in grades), dtype=np.float64, count=len(grades))
+    grade_students = np.array([student_positions.get(grade.matricule_etudiant, -1) for grade in grades],
+                              dtype=np.int64)
+    grade_subjects = np.array([subject_positions.get(grade.code_matiere, -1) for grade in grades],
+                              dtype=np.int64)
+    # Identifiant de code dans l'ordre d'apparition (y compris les matières inconnues)
+    code_ids: Dict[str, int] = {}
+    grade_codes = np.array([code_ids.setdefault(grade.code_matiere, len(code_ids)) for grade in grades],
+                           dtype=np.int64)
+    return notes, grade_students, grade_subjects, grade_codes, list(code_ids)
+
+
+def aggregate_vectorized(students: List[Student], subjects: List[Subject], grades: List[Grade],
+                         repository=None) -> Aggregates:
+    """
+    Calcule toutes les statistiques avec des opérations vectorisées numpy
+    
+    Les notes sont converties en tableaux (indice d'étudiant, indice de matière,
+    note, coefficient). Les sommes utilisent np.bincount, qui accumule dans
+    l'ordre des notes : les résultats sont identiques au bit près à ceux de
+    aggregate(), classements et égalités compris.
+    
+    Args:
+        students (List[Student]): Liste des étudiants
+        subjects (List[Subject]): Liste des matières
+        grades (List[Grade]): Liste des notes
+        repository (DataRepository, optional): Non utilisé, accepté pour
+            garder la même signature que aggregate()
+    
+    Returns:
+        Aggregates: Résultat de l'agrégation
+    """
+    np = _numpy()
+    if np is None:
+        raise ImportError("numpy est nécessaire pour l'agrégation vectorisée")
+    
+    result = Aggregates()
+    
+    # ========== INDEX DES ÉTUDIANTS ET MATIÈRES ==========
+    
+    # Position de l'étudiant de référence de chaque matricule (le premier l'emporte)
+    student_positions: Dict[str, int] = {}
+    niveau_ids: Dict[str, int] = {}
+    student_niveaux = np.empty(len(students), dtype=np.int64)
+    canonical = np.empty(len(students), dtype=np.int64)
+    for position, student in enumerate(students):
+        canonical[position] = student_positions.setdefault(student.matricule, position)
+        student_niveaux[position] = niveau_ids.setdefault(student.niveau, len(niveau_ids))
+    # Les niveaux des étudiants portent les premiers identifiants, dans l'ordre d'apparition
+    class_count = len(niveau_ids)
+    
+    subject_positions: Dict[str, int] = {}
+    subject_niveaux = np.empty(len(subjects), dtype=np.int64)
+    subject_coefficients = np.empty(len(subjects), dtype=np.float64)
+    for position, subject in enumerate(subjects):
+        subject_positions.setdefault(subject.code, position)
+        # Les niveaux sans étudiant reçoivent un identifiant qui ne correspond à personne
+        subject_niveaux[position] = niveau_ids.setdefault(subject.niveau, len(niveau_ids))
+        subject_coefficients[position] = subject.coefficient
+    
+    # ========== TABLEAUX DES NOTES ==========
+    
+    count = len(grades)
+    notes, grade_students, grade_subjects, grade_codes, code_names = _grade_arrays(
+        grades, student_positions, subject_positions)
+    
+    # ========== MOYENNES PAR ÉTUDIANT ==========
+    
+    known = (grade_students >= 0) & (grade_subjects >= 0)
+    counted = np.zeros(count, dtype=bool)
+    counted[known] = (student_niveaux[grade_students[known]]
+                      == subject_niveaux[grade_subjects[known]])
+    counted_students = grade_students[counted]
+    counted_coefficients = subject_coefficients[grade_subjects[counted]]
+    
+    points = np.bincount(counted_students, weights=notes[counted] * counted_coefficients,
+                         minlength=len(students))
+    coefficients = np.bincount(counted_students, weights=counted_coefficients,
+                               minlength=len(students))
+    has_grades = np.bincount(counted_students, minlength=len(students)) > 0
+    has_average = has_grades & (coefficients != 0)
+    averages = np.zeros(len(students), dtype=np.float64)
+    np.divide(points, coefficients, out=averages, where=has_average)
+    
+    for position in np.flatnonzero(has_average):
+        result.student_averages[students[position].matricule] = float(averages[position])
+    
+    # ========== CLASSES ET CLASSEMENTS ==========
+    
+    # Chaque étudiant de la liste reçoit la moyenne de son matricule
+    member_averages = averages[canonical]
+    member_valid = has_average[canonical]
+    valid_positions = np.flatnonzero(member_valid)
+    
+    niveau_names = list(niveau_ids)
+    class_sums = np.bincount(student_niveaux[valid_positions],
+                             weights=member_averages[valid_positions], minlength=len(niveau_ids))
+    class_counts = np.bincount(student_niveaux[valid_positions], minlength=len(niveau_ids))
+    
+    for niveau_id in range(class_count):
+        niveau = niveau_names[niveau_id]
+        if class_counts[niveau_id]:
+            result.class_averages[niveau] = float(class_sums[niveau_id] / class_counts[niveau_id])
+        
+        members = valid_positions[student_niveaux[valid_positions] == niveau_id]
+        # Tri stable décroissant : les égalités conservent l'ordre des étudiants
+        ordered = members[np.argsort(-member_averages[members], kind='stable')]
+        ranking = [(students[position], float(member_averages[position]), rank)
+                   for rank, position in enumerate(ordered, start=1)]
+        result.class_rankings[niveau] = ranking
+        
+        for position, (student, _, rank) in zip(ordered, ranking):
+            if canonical[position] == position:
+                result.student_ranks.setdefault(student.matricule, rank)
+    
+    if len(valid_positions):
+        # argmax retourne la première occurrence du maximum
+        best = valid_positions[np.argmax(member_averages[valid_positions])]
+        result.best_student_global = (students[best], float(member_averages[best]))
+    
+    # ========== MATIÈRES ET GLOBAL ==========
+    
+    if count:
+        subject_totals = np.bincount(grade_codes, weights=notes, minlength=len(code_names))
+        subject_counts = np.bincount(grade_codes, minlength=len(code_names))
+        # Par code : note la plus haute, puis première dans l'ordre des notes
+        order = np.lexsort((np.arange(count), -notes, grade_codes))
+        firsts = order[np.flatnonzero(np.diff(grade_codes[order], prepend=-1))]
+        
+        for code_id in np.flatnonzero(subject_counts):
+            result.subject_averages[code_names[code_id]] = float(subject_totals[code_id] / subject_counts[code_id])
+        for i in firsts:
+            best_grade = grades[i]
+            best_student = grade_students[i]
+            if best_student >= 0:
+                result.subject_best[best_grade.code_matiere] = (students[best_student], best_grade.note)
+        
+        # bincount sur un seul indice : somme séquentielle comme la boucle Python
+        global_total = np.bincount(np.zeros(count, dtype=np.int64), weights=notes)[0]
+        result.global_average = float(global_total / count)
+    
+    return result
@@ -0,0 +1 @@
+# Module tests - Vérifications exécutées avec pytest
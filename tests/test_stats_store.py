@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Tests du magasin de statistiques incrémental
+Compare StatsStore à une agrégation complète de Statistics après des suites aléatoires de modifications
+"""
+
+import random
+
+import pytest
+
+from models.student import Student
+from models.subject import Subject
+from models.grade import Grade
+from services.repository import DataRepository
+from services.statistics import Statistics
+from services.stats_store import StatsStore
+
+NIVEAUX = ('L1', 'L2', 'L3')
+
+# Notes à une ou deux décimales : leurs sommes flottantes ne sont pas exactes
+NOTES = (0, 7.5, 8, 10, 10.1, 11, 12.3, 13.25, 14.7, 15.5, 16.05, 19.9, 20)
+
+
+def make_repository(rng: random.Random) -> DataRepository:
+    """
+    Crée un dépôt aléatoire (matricules et codes en double compris)
+    
+    Args:
+        rng (random.Random): Générateur aléatoire
+    
+    Returns:
+        DataRepository: Dépôt généré
+    """
+    students = [Student(f"Nom{i}", f"Prenom{i}", f"E{rng.randint(0, 60)}", rng.choice(NIVEAUX))
+                for i in range(50)]
+    subjects = [Subject(f"Matiere{i}", f"C{rng.randint(0, 12)}", rng.choice((1, 2, 2.5, 3)), rng.choice(NIVEAUX))
+                for i in range(10)]
+    grades = [random_grade(rng) for _ in range(300)]
+    return DataRepository(students, subjects, grades)
+
+
+def random_grade(rng: random.Random) -> Grade:
+    """
+    Crée une note aléatoire (étudiant ou matière parfois inconnus)
+    
+    Args:
+        rng (random.Random): Générateur aléatoire
+    
+    Returns:
+        Grade: Note générée
+    """
+    return Grade(f"E{rng.randint(0, 65)}", f"C{rng.randint(0, 14)}", rng.choice(NOTES))
+
+
+def compare(repository: DataRepository, store: StatsStore) -> list:
+    """
+    Compare toutes les lectures du magasin à une agrégation complète
+    
+    Args:
+        repository (DataRepository): Dépôt suivi par le magasin
+        store (StatsStore): Magasin à vérifier
+    
+    Returns:
+        list: Descriptions des écarts (vide si les résultats sont identiques)
+    """
+    reference = Statistics(repository.students, repository.subjects, repository.grades)
+    checks = [('global_average', (), 'calculate_global_average'),
+              ('best_student_global', (), 'get_best_student_global')]
+    matricules = {s.matricule for s in repository.students} | {g.matricule_etudiant for g in repository.grades}
+    for matricule in sorted(matricules):
+        checks.append(('student_average', (matricule,), 'calculate_student_average'))
+        checks.append(('student_rank', (matricule,), 'calculate_student_rank'))
+    for niveau in NIVEAUX:
+        checks.append(('class_average', (niveau,), 'calculate_class_average'))
+        checks.append(('class_ranking', (niveau,), 'get_class_ranking'))
+        checks.append(('best_in_class', (niveau,), 'get_best_student_in_class'))
+    for code in sorted({g.code_matiere for g in repository.grades} | {s.code for s in repository.subjects}):
+        checks.append(('subject_average', (code,), 'calculate_subject_average'))
+        checks.append(('best_in_subject', (code,), 'get_best_student_in_subject'))
+    
+    errors = []
+    for label, args, method in checks:
+        expected = getattr(reference, method)(*args)
+        value = getattr(store, method)(*args)
+        # Égalité stricte : les flottants doivent être identiques, et les étudiants les mêmes objets
+        if value != expected:
+            errors.append(f"{label}{args}: {value!r} au lieu de {expected!r}")
+    return errors
+
+
+def run(seed: int, steps: int) -> list:
+    """
+    Applique une suite aléatoire de modifications en comparant régulièrement les résultats
+    
+    Args:
+        seed (int): Graine du générateur
+        steps (int): Nombre de modifications
+    
+    Returns:
+        list: Écarts constatés (vide si aucun)
+    """
+    rng = random.Random(seed)
+    repository = make_repository(rng)
+    store = StatsStore(repository)
+    for step in range(steps):
+        choice = rng.random()
+        if choice < 0.35 and repository.grades:
+            repository.update_grade(rng.choice(repository.grades), rng.choice(NOTES))
+        elif choice < 0.65:
+            repository.add_grade(random_grade(rng))
+        elif choice < 0.9 and repository.grades:
+            repository.remove_grade(rng.choice(repository.grades))
+        elif choice < 0.95 and repository.students:
+            student = rng.choice(repository.students)
+            repository.update_student(student, student.nom, student.prenom, rng.choice(NIVEAUX))
+        elif repository.subjects:
+            repository.remove_subject(rng.choice(repository.subjects))
+        if rng.random() < 0.2:
+            errors = compare(repository, store)
+            if errors:
+                return [f"étape {step}: {error}" for error in errors]
+    return compare(repository, store)
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_stats_store_matches_statistics(seed):
+    """Après 200 modifications, StatsStore donne exactement les résultats de Statistics"""
+    errors = run(seed, 200)
+    assert not errors, "\n".join(errors[:10])